@@ -0,0 +1,61 @@
+"""Compare the time to build a pdf report with the LaTeX and Typst engines.
+
+Run from project root, with Quarto (and TinyTeX for LaTeX) installed:
+
+    python bin/benchmark_pdf_engines.py --repeats 3
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from vuegen.report_generator import get_report
+
+EXAMPLE_DIR = "docs/example_data/Basic_example_vuegen_demo_notebook"
+
+
+def time_engine(directory: str, pdf_engine: str, repeats: int) -> list:
+    """Build the pdf report of a folder several times and return the times."""
+    times = []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            get_report(
+                report_type="pdf",
+                logger=logging.getLogger("vuegen"),
+                dir_path=directory,
+                output_dir=output_dir,
+                pdf_engine=pdf_engine,
+            )
+            times.append(time.perf_counter() - start)
+            pdf_file = Path(output_dir) / "quarto_report" / "quarto_report.pdf"
+            assert pdf_file.exists(), f"No pdf report written with {pdf_engine}"
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directory", default=EXAMPLE_DIR)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--engines", nargs="+", default=["latex", "typst"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = {
+        engine: time_engine(args.directory, engine, args.repeats)
+        for engine in args.engines
+    }
+
+    print(f"{'engine':<8} {'min s':>8} {'mean s':>8}")
+    for engine, times in results.items():
+        print(f"{engine:<8} {min(times):8.2f} {statistics.mean(times):8.2f}")
+    if {"latex", "typst"} <= results.keys():
+        speedup = min(results["latex"]) / min(results["typst"])
+        print(f"typst is {speedup:.1f}x faster than latex (best of {args.repeats})")
+
+
+if __name__ == "__main__":
+    main()
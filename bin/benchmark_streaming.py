@@ -0,0 +1,127 @@
+"""Compare the peak memory of building a large report with and without streaming.
+
+A synthetic configuration with many Markdown components is written to a temporary
+folder and each report is built in its own process, which reports its peak
+resident memory. Run from project root:
+
+    python bin/benchmark_streaming.py --components 50000
+"""
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from vuegen.report_generator import build_report
+
+SUBSECTIONS_PER_SECTION = 20
+
+
+def write_config(folder: Path, n_components: int, per_subsection: int) -> Path:
+    """Write a configuration with n_components Markdown components, one section at a
+    time, so that this process stays small: the peak memory of a child process
+    includes that of its parent when it was started."""
+    md_file = folder / "text.md"
+    md_file.write_text("Some **Markdown** text of a component.\n")
+    n_subsections = -(-n_components // per_subsection)
+    config_path = folder / "config.yaml"
+    with open(config_path, "w", encoding="utf-8") as f:
+        report = {"title": "Large report", "description": "A synthetic report"}
+        f.write(yaml.safe_dump({"report": report}, sort_keys=False))
+        f.write("sections:\n")
+        for first in range(0, n_subsections, SUBSECTIONS_PER_SECTION):
+            subsections = []
+            for idx in range(
+                first, min(first + SUBSECTIONS_PER_SECTION, n_subsections)
+            ):
+                size = min(per_subsection, n_components - idx * per_subsection)
+                components = [
+                    {
+                        "title": f"Text {idx + 1} {i + 1}",
+                        "file_path": md_file.as_posix(),
+                        "component_type": "markdown",
+                    }
+                    for i in range(size)
+                ]
+                subsections.append(
+                    {"title": f"Subsection {idx + 1}", "components": components}
+                )
+            section = {
+                "title": f"Section {first // SUBSECTIONS_PER_SECTION + 1}",
+                "subsections": subsections,
+            }
+            f.write(yaml.safe_dump([section], sort_keys=False))
+    return config_path
+
+
+def build(config_path: str, report_type: str, stream: bool, output_dir: str) -> dict:
+    """Build a report in this process and return its time and peak memory."""
+    logger = logging.getLogger("vuegen")
+    logger.setLevel(logging.WARNING)
+    start = time.perf_counter()
+    build_report(
+        report_type,
+        config_path=config_path,
+        output_dir=output_dir,
+        logger=logger,
+        run=False,
+        stream=stream,
+    )
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    max_rss_mib = max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+    return {"seconds": time.perf_counter() - start, "max_rss_mib": max_rss_mib}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=50_000)
+    parser.add_argument("--per_subsection", type=int, default=50)
+    parser.add_argument("--report_types", nargs="+", default=["streamlit", "jupyter"])
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        config_path, report_type, stream, output_dir = args.child
+        print(json.dumps(build(config_path, report_type, stream == "1", output_dir)))
+        return
+
+    with tempfile.TemporaryDirectory() as folder:
+        config_path = write_config(Path(folder), args.components, args.per_subsection)
+        size = config_path.stat().st_size
+        print(f"{args.components} components, configuration of {size:,} bytes")
+        print(f"{'report':<10} {'mode':<9} {'seconds':>8} {'peak MiB':>9}")
+        for report_type in args.report_types:
+            for stream in [False, True]:
+                mode = "streamed" if stream else "in memory"
+                output_dir = Path(folder) / f"{report_type}_{int(stream)}"
+                child = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--child",
+                        str(config_path),
+                        report_type,
+                        str(int(stream)),
+                        str(output_dir),
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                result = json.loads(child.stdout.splitlines()[-1])
+                print(
+                    f"{report_type:<10} {mode:<9} {result['seconds']:8.2f}"
+                    f" {result['max_rss_mib']:9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
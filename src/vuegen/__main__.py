@@ -4,10 +4,47 @@ import sys
 from pathlib import Path
 
 from vuegen import report_generator
-from vuegen.utils import get_completion_message, get_logger, get_parser
+from vuegen.utils import (
+    get_batch_parser,
+    get_completion_message,
+    get_logger,
+    get_parser,
+    get_serve_parser,
+    get_validate_parser,
+)
 
 
 def main():
+    # Build many reports in one run: vuegen batch manifest.yaml
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from vuegen import batch
+
+        args = get_batch_parser(prog_name="VueGen").parse_args(sys.argv[2:])
+        sys.exit(batch.main(args.manifest, jobs=args.jobs))
+
+    # Check a configuration without building it: vuegen validate config.yaml
+    if len(sys.argv) > 1 and sys.argv[1] == "validate":
+        from vuegen import config_validation
+
+        args = get_validate_parser(prog_name="VueGen").parse_args(sys.argv[2:])
+        sys.exit(config_validation.main(args.config, report_type=args.report_type))
+
+    # Build reports on demand from a local service: vuegen serve
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from vuegen import server
+
+        args = get_serve_parser(prog_name="VueGen").parse_args(sys.argv[2:])
+        sys.exit(
+            server.main(
+                host=args.host,
+                port=args.port,
+                output_dir=args.output_directory,
+                workers=args.workers,
+                max_queued=args.max_queued,
+                token=args.token,
+            )
+        )
+
     # Parse command-line arguments
     parser = get_parser(prog_name="VueGen")
     args = parser.parse_args()
@@ -50,6 +87,27 @@ def main():
         streamlit_autorun=args.streamlit_autorun,
         quarto_checks=args.quarto_checks,
         max_depth=args.max_depth,
+        prefetch_remote=args.prefetch_remote,
+        prerender_static=args.prerender_static,
+        table_row_count=args.table_row_count,
+        table_max_rows=args.table_max_rows,
+        table_max_bytes=args.table_max_bytes,
+        quarto_project=args.quarto_project,
+        profile_chunks=args.profile_chunks,
+        profile_memory=args.profile_memory,
+        execute_notebooks=args.execute_notebooks,
+        dedup_assets=args.dedup_assets,
+        pdf_engine=args.pdf_engine,
+        image_settings={
+            "dpi": args.image_dpi,
+            "max_size": args.image_max_size,
+            "format": args.image_format,
+        },
+        profile=args.profile,
+        jobs=args.jobs,
+        stream=args.stream,
+        validate=not args.skip_validation,
+        static_store=args.static_store,
     )
 
     # Print completion message
@@ -0,0 +1,446 @@
+"""Build many reports in one run from a manifest file, e.g. one report per sample.
+
+The imports, the logger setup and the process-wide caches (such as the shared HTTP
+session) are paid once per worker instead of once per report, and a failing report
+does not stop the others. The manifest is a YAML file like:
+
+.. code-block:: yaml
+
+    output_dir: reports       # reports are written to reports/<name>
+    jobs: 4                   # number of worker processes
+    defaults:                 # options of all reports, as in get_report
+      report_type: html
+      dedup_assets: true
+    reports:
+      - directory: samples/sample_1
+      - name: cohort
+        config: configs/cohort_config.yaml
+        report_type: pdf
+
+Relative paths are resolved from the folder of the manifest.
+"""
+
+import logging
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+from .utils import generate_log_filename, get_logger, init_log, load_yaml_config
+
+# Keys of a report in the manifest which are not options of the report
+REPORT_KEYS = ("name", "config", "directory", "output_dir")
+# Options of a report in the manifest, i.e. arguments of build_report
+REPORT_OPTIONS = (
+    "report_type",
+    "max_depth",
+    "write_config",
+    "run",
+    "streamlit_autorun",
+    "quarto_checks",
+    "prefetch_remote",
+    "prerender_static",
+    "table_row_count",
+    "table_max_rows",
+    "table_max_bytes",
+    "quarto_project",
+    "profile_chunks",
+    "profile_memory",
+    "execute_notebooks",
+    "dedup_assets",
+    "pdf_engine",
+    "image_settings",
+    "profile",
+    "jobs",
+    "stream",
+    "validate",
+    "static_store",
+)
+# Table of the durations and failures of the reports, in the output folder
+SUMMARY_FILE = "batch_summary.tsv"
+
+
+@dataclass
+class BatchEntry:
+    """
+    A report to build in a batch.
+
+    Attributes
+    ----------
+    name : str
+        The unique name of the report, used for its output folder and log file.
+    output_dir : Path
+        The folder in which the report folder is generated.
+    config_path : Path, optional
+        The configuration file of the report.
+    dir_path : Path, optional
+        The directory from which the configuration is generated.
+    config : dict, optional
+        The configuration of the report, if given inline instead of as a file.
+    options : dict
+        The options of the report, i.e. keyword arguments of build_report.
+    """
+
+    name: str
+    output_dir: Path
+    config_path: Optional[Path] = None
+    dir_path: Optional[Path] = None
+    config: Optional[dict] = None
+    options: dict = field(default_factory=dict)
+
+    @property
+    def report_type(self) -> str:
+        """The type of the report."""
+        return self.options.get("report_type", "streamlit")
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of building one report of a batch.
+
+    Attributes
+    ----------
+    name : str
+        The name of the report.
+    report_type : str
+        The type of the report.
+    seconds : float
+        The time to build the report, including failed attempts.
+    report_dir : Path, optional
+        The folder of the generated report, if it was built.
+    log_file : str, optional
+        The log file of the report.
+    error : str, optional
+        The error which stopped the report, if any.
+    timings : dict
+        The time in seconds of each build stage ('config', 'generate', 'run'), if
+        the report was built.
+    """
+
+    name: str
+    report_type: str
+    seconds: float = 0.0
+    report_dir: Optional[Path] = None
+    log_file: Optional[str] = None
+    error: Optional[str] = None
+    timings: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the report was built."""
+        return self.error is None
+
+
+def read_manifest(
+    manifest_path: Union[str, Path], logger: logging.Logger
+) -> tuple[list[BatchEntry], dict]:
+    """
+    Read the reports of a batch manifest.
+
+    Parameters
+    ----------
+    manifest_path : str | Path
+        The YAML manifest file.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+
+    Returns
+    -------
+    tuple[list[BatchEntry], dict]
+        The reports to build and the settings of the batch ('output_dir', 'jobs').
+
+    Raises
+    ------
+    ValueError
+        If the manifest lists no report, a report has not exactly one of 'config'
+        and 'directory', an option is unknown or two reports have the same name.
+    """
+    manifest_path = Path(manifest_path)
+    manifest = load_yaml_config(manifest_path) or {}
+    base_dir = manifest_path.parent
+
+    def resolve(path: Optional[str]) -> Optional[Path]:
+        if path is None:
+            return None
+        path = Path(path).expanduser()
+        return path if path.is_absolute() else base_dir / path
+
+    def check_options(options: dict, where: str):
+        unknown = set(options) - set(REPORT_OPTIONS)
+        if unknown:
+            msg = (
+                f"Unknown option(s) {', '.join(sorted(unknown))} in {where} of the"
+                f" manifest {manifest_path}. Valid options are:"
+                f" {', '.join(REPORT_OPTIONS)}."
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+
+    reports = manifest.get("reports") or []
+    if not reports:
+        msg = f"No reports listed under 'reports' in the manifest {manifest_path}."
+        logger.error(msg)
+        raise ValueError(msg)
+    defaults = manifest.get("defaults") or {}
+    check_options(defaults, "the defaults")
+    output_dir = resolve(manifest.get("output_dir", "."))
+
+    entries = []
+    for i, report in enumerate(reports, start=1):
+        config_path = resolve(report.get("config"))
+        dir_path = resolve(report.get("directory"))
+        if (config_path is None) == (dir_path is None):
+            msg = (
+                f"Report {i} of the manifest {manifest_path} needs exactly one of"
+                " 'config' and 'directory'."
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+        name = str(report.get("name") or (config_path or dir_path).stem)
+        options = {
+            key: value for key, value in report.items() if key not in REPORT_KEYS
+        }
+        check_options(options, f"report '{name}'")
+        entries.append(
+            BatchEntry(
+                name=name,
+                output_dir=resolve(report.get("output_dir")) or output_dir / name,
+                config_path=config_path,
+                dir_path=dir_path,
+                options={**defaults, **options},
+            )
+        )
+
+    names = [entry.name for entry in entries]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        msg = (
+            f"Report names must be unique in the manifest {manifest_path}, set"
+            f" 'name' for: {', '.join(duplicates)}."
+        )
+        logger.error(msg)
+        raise ValueError(msg)
+
+    settings = {"output_dir": output_dir, "jobs": manifest.get("jobs", 1)}
+    return entries, settings
+
+
+def build_entry(entry: BatchEntry, log_folder: Union[str, Path]) -> BatchResult:
+    """
+    Build one report of a batch, logging to its own log file. Errors are caught and
+    returned in the result, so that the other reports are still built.
+
+    Parameters
+    ----------
+    entry : BatchEntry
+        The report to build.
+    log_folder : str | Path
+        The folder of the log files of the reports.
+
+    Returns
+    -------
+    BatchResult
+        The duration of the build and the error, if any.
+    """
+    from .report_generator import build_report
+
+    result = BatchResult(name=entry.name, report_type=entry.report_type)
+    result.log_file = generate_log_filename(
+        folder=str(log_folder), suffix=f"{entry.report_type}_report_{entry.name}"
+    )
+    logger = init_log(
+        result.log_file, display=False, logger_id=f"vuegen.batch.{entry.name}"
+    )
+    # Only the progress of the batch is shown, the reports log to their files
+    logger.propagate = False
+    logger.info("Path to log file: %s", result.log_file)
+    start = time.perf_counter()
+    try:
+        build = build_report(
+            config=entry.config,
+            config_path=entry.config_path,
+            dir_path=entry.dir_path,
+            output_dir=entry.output_dir,
+            logger=logger,
+            **{"write_config": True, **entry.options},
+        )
+        result.report_dir = build.report_dir
+        result.timings = build.timings
+    except Exception as e:  # the other reports are still built
+        logger.error("Error building report '%s': %s", entry.name, e, exc_info=True)
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        result.seconds = time.perf_counter() - start
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
+    return result
+
+
+def run_batch(
+    entries: list[BatchEntry],
+    logger: logging.Logger,
+    jobs: int = 1,
+    log_folder: Union[str, Path] = "logs",
+) -> list[BatchResult]:
+    """
+    Build the reports of a batch, continuing past failed reports.
+
+    Parameters
+    ----------
+    entries : list[BatchEntry]
+        The reports to build.
+    logger : logging.Logger
+        A logger object to track the progress of the batch.
+    jobs : int, optional
+        The number of reports built at the same time (default is 1, building them
+        one after the other in this process). Reports are built in worker
+        processes, as Matplotlib figures cannot be drawn from several threads.
+    log_folder : str | Path, optional
+        The folder of the log files of the reports (default is "logs").
+
+    Returns
+    -------
+    list[BatchResult]
+        The results in the order of the entries.
+    """
+    jobs = max(1, min(jobs, len(entries)))
+    logger.info("Building %d report(s) with %d worker(s).", len(entries), jobs)
+    results = {}
+
+    def log_result(result: BatchResult):
+        if result.ok:
+            logger.info("Built report '%s' in %.2f s.", result.name, result.seconds)
+        else:
+            logger.error(
+                "Report '%s' failed after %.2f s: %s (log: %s)",
+                result.name,
+                result.seconds,
+                result.error,
+                result.log_file,
+            )
+
+    if jobs == 1:
+        for entry in entries:
+            results[entry.name] = build_entry(entry, log_folder)
+            log_result(results[entry.name])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(build_entry, entry, log_folder): entry for entry in entries
+            }
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:  # e.g. a worker killed by the system
+                    result = BatchResult(
+                        name=entry.name,
+                        report_type=entry.report_type,
+                        error="".join(
+                            traceback.format_exception_only(type(e), e)
+                        ).strip(),
+                    )
+                results[entry.name] = result
+                log_result(result)
+    return [results[entry.name] for entry in entries]
+
+
+def format_summary(results: list[BatchResult]) -> str:
+    """
+    Format the results of a batch as a table of durations and failures.
+
+    Parameters
+    ----------
+    results : list[BatchResult]
+        The results of the reports.
+
+    Returns
+    -------
+    str
+        The table, followed by the totals.
+    """
+    width = max([len("report")] + [len(result.name) for result in results])
+    lines = [f"{'report':<{width}}  {'type':<10} {'status':<7} {'seconds':>8}  error"]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}}  {result.report_type:<10}"
+            f" {'ok' if result.ok else 'failed':<7} {result.seconds:8.2f}"
+            f"  {result.error or ''}".rstrip()
+        )
+    n_failed = sum(not result.ok for result in results)
+    lines.append(
+        f"{len(results) - n_failed} of {len(results)} report(s) built, {n_failed}"
+        f" failed, in {sum(result.seconds for result in results):.2f} s of build time."
+    )
+    return "\n".join(lines)
+
+
+def write_summary(results: list[BatchResult], output_file: Union[str, Path]) -> Path:
+    """
+    Write the results of a batch as a tab-separated table.
+
+    Parameters
+    ----------
+    results : list[BatchResult]
+        The results of the reports.
+    output_file : str | Path
+        The file to write.
+
+    Returns
+    -------
+    Path
+        The written file.
+    """
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    columns = ["name", "report_type", "status", "seconds", "report_dir", "log_file"]
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("\t".join(columns + ["error"]) + "\n")
+        for result in results:
+            row = [
+                result.name,
+                result.report_type,
+                "ok" if result.ok else "failed",
+                f"{result.seconds:.3f}",
+                str(result.report_dir or ""),
+                str(result.log_file or ""),
+                (result.error or "").replace("\t", " ").replace("\n", " "),
+            ]
+            f.write("\t".join(row) + "\n")
+    return output_file
+
+
+def main(manifest_path: Union[str, Path], jobs: Optional[int] = None) -> int:
+    """
+    Build the reports of a manifest and print the summary table.
+
+    Parameters
+    ----------
+    manifest_path : str | Path
+        The YAML manifest file.
+    jobs : int, optional
+        The number of reports built at the same time (default is None, the 'jobs'
+        setting of the manifest or 1).
+
+    Returns
+    -------
+    int
+        The exit code: 0 if all reports were built, 1 otherwise.
+    """
+    logger, logfile = get_logger(f"batch_{Path(manifest_path).stem}")
+    logger.info("logfile: %s", logfile)
+    entries, settings = read_manifest(manifest_path, logger)
+    results = run_batch(
+        entries,
+        logger,
+        jobs=jobs if jobs is not None else settings["jobs"],
+        log_folder=Path(logfile).parent,
+    )
+    summary_file = write_summary(results, settings["output_dir"] / SUMMARY_FILE)
+    print(format_summary(results))
+    print(f"Summary written to {summary_file}")
+    return 0 if all(result.ok for result in results) else 1
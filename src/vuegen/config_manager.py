@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 from . import report as r
+from .constants import TIMEOUT
 from .utils import assert_enum_value, get_logger, is_pyvis_html
+from .utils.images import ImageSettings
 
 
 class ConfigManager:
@@ -399,7 +401,9 @@ class ConfigManager:
 
         return yaml_config, base_dir_path
 
-    def initialize_report(self, config: dict) -> tuple[r.Report, dict]:
+    def initialize_report(
+        self, config: dict, stream: bool = False
+    ) -> tuple[r.Report, dict]:
         """
         Extracts report metadata from a YAML config file and returns a Report object and
         the raw metadata.
@@ -408,6 +412,10 @@ class ConfigManager:
         ----------
         config : dict
             The report metadata obtained from a YAML config file.
+        stream : bool, optional
+            Whether to create the sections one at a time while the report is
+            generated, instead of all of them now, by default False. The sections
+            of the report are then a SectionStream.
 
         Returns
         -------
@@ -430,9 +438,20 @@ class ConfigManager:
             description=config["report"].get("description"),
             graphical_abstract=config["report"].get("graphical_abstract"),
             logo=config["report"].get("logo"),
+            image_settings=self._get_image_settings(config["report"]),
         )
 
         # Create sections and subsections
+        if stream:
+            report.sections = r.SectionStream(
+                config.get("sections") or [], self._create_section
+            )
+            self.logger.info(
+                "Report '%s' initialized, its sections are created while it is"
+                " generated.",
+                report.title,
+            )
+            return report, config
         for section_data in config.get("sections", []):
             section = self._create_section(section_data)
             report.sections.append(section)
@@ -495,6 +514,11 @@ class ConfigManager:
             title=subsection_data["title"],
             components=[],
             description=subsection_data.get("description"),
+            layout=assert_enum_value(
+                r.SubsectionLayout,
+                subsection_data.get("layout", r.SubsectionLayout.DEFAULT),
+                self.logger,
+            ),
         )
 
         # Create components
@@ -538,6 +562,37 @@ class ConfigManager:
         elif component_type == r.ComponentType.CHATBOT:
             return self._create_chatbot_component(component_data)
 
+    def _get_image_settings(self, data: dict) -> Optional[dict]:
+        """
+        Get the validated image settings of the report or of a component.
+
+        Parameters
+        ----------
+        data : dict
+            The metadata of the report or of the component.
+
+        Returns
+        -------
+        dict, optional
+            The image settings, or None if none are given.
+
+        Raises
+        ------
+        ValueError
+            If a setting is unknown or invalid.
+        """
+        image_settings = data.get("image_settings")
+        if image_settings is None:
+            return None
+        try:
+            ImageSettings().merge(image_settings)
+        except (TypeError, ValueError) as e:
+            self.logger.error(
+                "Invalid image settings of '%s': %s", data.get("title"), e
+            )
+            raise ValueError(f"Invalid image settings: {e}") from e
+        return image_settings
+
     def _create_plot_component(self, component_data: dict) -> r.Plot:
         """
         Creates a Plot component.
@@ -573,6 +628,7 @@ class ConfigManager:
             plot_type=plot_type,
             csv_network_format=csv_network_format,
             caption=component_data.get("caption"),
+            image_settings=self._get_image_settings(component_data),
         )
 
     def _create_dataframe_component(self, component_data: dict) -> r.DataFrame:
@@ -601,6 +657,9 @@ class ConfigManager:
             file_format=file_format,
             delimiter=component_data.get("delimiter"),
             caption=component_data.get("caption"),
+            max_rows=component_data.get("max_rows"),
+            max_bytes=component_data.get("max_bytes"),
+            image_settings=self._get_image_settings(component_data),
         )
 
     def _create_markdown_component(self, component_data: dict) -> r.Markdown:
@@ -679,6 +738,11 @@ class ConfigManager:
             headers=component_data.get("headers"),
             params=component_data.get("params"),
             request_body=parsed_body,
+            timeout=component_data.get("timeout", TIMEOUT),
+            retries=component_data.get("retries", 0),
+            backoff_factor=component_data.get("backoff_factor", 0.5),
+            cache_ttl=component_data.get("cache_ttl"),
+            retry_methods=component_data.get("retry_methods"),
         )
 
     def _create_chatbot_component(self, component_data: dict) -> r.ChatBot:
@@ -703,4 +767,6 @@ class ConfigManager:
             caption=component_data.get("caption"),
             headers=component_data.get("headers"),
             params=component_data.get("params"),
+            history_size=component_data.get("history_size", 10),
+            max_message_chars=component_data.get("max_message_chars", 4000),
         )
@@ -0,0 +1,366 @@
+"""Check a whole report configuration before any report is generated.
+
+All problems of a configuration are collected in one pass and reported together:
+missing keys, invalid enumeration values and settings, missing or unreadable files
+with unsupported extensions, and titles which would give several sections or
+subsections the same page of a Streamlit report. Files are only checked with their
+metadata and extension, without reading them, so that configurations with many
+thousands of components are checked in a fraction of a second, before the
+expensive work of building the report. Run it from the command line with:
+
+.. code-block:: bash
+
+    vuegen validate config.yaml
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+import yaml
+
+from . import report as r
+from .utils import is_url
+from .utils.images import ImageSettings
+from .utils.variables import make_valid_identifier
+
+# Keys needed by each type of component, besides 'title' and 'component_type'
+REQUIRED_COMPONENT_KEYS = {
+    r.ComponentType.PLOT: ("file_path", "plot_type"),
+    r.ComponentType.DATAFRAME: ("file_path", "file_format"),
+    r.ComponentType.MARKDOWN: ("file_path",),
+    r.ComponentType.HTML: ("file_path",),
+    r.ComponentType.APICALL: ("api_url", "method"),
+    r.ComponentType.CHATBOT: ("api_url",),
+}
+# Supported file extensions of each plot type
+PLOT_EXTENSIONS = {
+    r.PlotType.STATIC: tuple(fmt.value_with_dot for fmt in r.ImageFormat),
+    r.PlotType.PLOTLY: (".json",),
+    r.PlotType.ALTAIR: (".json",),
+    r.PlotType.INTERACTIVE_NETWORK: tuple(
+        fmt.value_with_dot for fmt in r.NetworkFormat
+    ),
+}
+# Supported file extensions of the other components with a file
+COMPONENT_EXTENSIONS = {
+    r.ComponentType.DATAFRAME: tuple(fmt.value_with_dot for fmt in r.DataFrameFormat),
+    r.ComponentType.MARKDOWN: (".md",),
+    r.ComponentType.HTML: (".html",),
+}
+
+
+class ConfigValidationError(ValueError):
+    """
+    A report configuration with one or more problems.
+
+    Attributes
+    ----------
+    problems : list[str]
+        The problems of the configuration, each starting with where it is.
+    """
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__(
+            f"{len(problems)} problem(s) in the report configuration:\n"
+            + "\n".join(f"- {problem}" for problem in problems)
+        )
+
+
+def _where(parent: str, kind: str, index: int, data) -> str:
+    """Describe where a section, subsection or component is, by title or index."""
+    title = data.get("title") if isinstance(data, dict) else None
+    where = f"{kind} '{title}'" if title else f"{kind} {index}"
+    return f"{parent}, {where}" if parent else where
+
+
+class _Checker:
+    """Collect the problems of a configuration while walking through it."""
+
+    def __init__(self, base_dir: Path, report_type: Optional[str] = None):
+        self.base_dir = base_dir
+        # Pages are named after the titles only in Streamlit reports
+        self.check_pages = (
+            report_type is None or str(report_type).lower() == r.ReportType.STREAMLIT
+        )
+        self.problems = []
+        self.n_components = 0
+        self._section_dirs = {}
+        self._subsection_pages = {}
+        self._file_problems = {}
+
+    def add(self, where: str, problem: str):
+        self.problems.append(f"{where}: {problem}")
+
+    def check_mapping(self, data, where: str, required: Iterable[str]) -> bool:
+        """Check that data is a mapping with the required keys."""
+        if not isinstance(data, dict):
+            self.add(where, f"expected a mapping, got {type(data).__name__}")
+            return False
+        missing = [key for key in required if data.get(key) in (None, "")]
+        if missing:
+            self.add(where, f"missing {', '.join(repr(key) for key in missing)}")
+        return True
+
+    def check_enum(self, enum_class, value, where: str, key: str):
+        """Check that value is a member of enum_class and return it, or None."""
+        try:
+            return enum_class[str(value).upper()]
+        except KeyError:
+            expected = ", ".join(str(member.value) for member in enum_class)
+            self.add(where, f"invalid {key} '{value}', expected one of: {expected}")
+            return None
+
+    def check_image_settings(self, data: dict, where: str):
+        if "image_settings" not in data:
+            return
+        try:
+            ImageSettings().merge(data.get("image_settings"))
+        except (TypeError, ValueError) as e:
+            self.add(where, f"invalid image_settings: {e}")
+
+    def check_file(self, file_path: str, extensions: Iterable[str], where: str):
+        """Check that a local file exists and is readable, and its extension."""
+        file_path = str(file_path)
+        extension = os.path.splitext(file_path.split("?")[0])[1].lower()
+        if extension not in extensions:
+            self.add(
+                where,
+                f"unsupported file extension '{extension}' of {file_path}, expected"
+                f" one of: {', '.join(extensions)}",
+            )
+        # Many components of large reports share files, e.g. a description
+        if file_path not in self._file_problems:
+            self._file_problems[file_path] = self._find_file_problem(file_path)
+        if self._file_problems[file_path]:
+            self.add(where, self._file_problems[file_path])
+
+    def _find_file_problem(self, file_path: str) -> Optional[str]:
+        if is_url(file_path):
+            return None
+        path = os.path.join(self.base_dir, file_path)
+        if not os.path.isfile(path):
+            return f"file not found: {file_path}"
+        if not os.access(path, os.R_OK):
+            return f"file not readable: {file_path}"
+        return None
+
+    def check_title(self, names: dict, name: str, where: str, kind: str):
+        """Check that no other section or subsection has the same page name."""
+        if name in names:
+            self.add(
+                where,
+                f"the {kind} has the same name as {names[name]}, so their pages"
+                " collide in Streamlit reports",
+            )
+        else:
+            names[name] = where
+
+    def check_report(self, config):
+        if not self.check_mapping(config, "configuration", ["report"]):
+            return
+        if self.check_mapping(config["report"], "report", ["title"]):
+            self.check_image_settings(config["report"], "report")
+        sections = config.get("sections") or []
+        if isinstance(sections, (str, dict)):
+            self.add("configuration", "'sections' must be a list")
+            return
+        for i, section in enumerate(sections, start=1):
+            self.check_section(section, _where("", "section", i, section))
+
+    def check_section(self, section, where: str):
+        if not self.check_mapping(section, where, ["title"]):
+            return
+        if self.check_pages and section.get("title"):
+            name = make_valid_identifier(str(section["title"]).replace(" ", "_"))
+            self.check_title(self._section_dirs, name, where, "section")
+        for i, component in enumerate(section.get("components") or [], start=1):
+            self.check_component(component, _where(where, "component", i, component))
+        for i, subsection in enumerate(section.get("subsections") or [], start=1):
+            self.check_subsection(
+                subsection, _where(where, "subsection", i, subsection)
+            )
+
+    def check_subsection(self, subsection, where: str):
+        if not self.check_mapping(subsection, where, ["title"]):
+            return
+        if self.check_pages and subsection.get("title"):
+            name = make_valid_identifier(str(subsection["title"]))
+            self.check_title(self._subsection_pages, name, where, "subsection")
+        if "layout" in subsection:
+            self.check_enum(r.SubsectionLayout, subsection["layout"], where, "layout")
+        for i, component in enumerate(subsection.get("components") or [], start=1):
+            self.check_component(component, _where(where, "component", i, component))
+
+    def check_component(self, component, where: str):
+        self.n_components += 1
+        if not self.check_mapping(component, where, ["title", "component_type"]):
+            return
+        if component.get("component_type") in (None, ""):
+            return
+        component_type = self.check_enum(
+            r.ComponentType, component["component_type"], where, "component_type"
+        )
+        if component_type is None:
+            return
+        missing = [
+            key
+            for key in REQUIRED_COMPONENT_KEYS[component_type]
+            if component.get(key) in (None, "")
+        ]
+        if missing:
+            self.add(where, f"missing {', '.join(repr(key) for key in missing)}")
+        self.check_image_settings(component, where)
+
+        if component_type == r.ComponentType.PLOT:
+            self.check_plot(component, where)
+        elif component_type == r.ComponentType.DATAFRAME:
+            if component.get("file_format"):
+                self.check_enum(
+                    r.DataFrameFormat, component["file_format"], where, "file_format"
+                )
+        elif component_type == r.ComponentType.APICALL:
+            if component.get("request_body"):
+                try:
+                    json.loads(component["request_body"])
+                except (TypeError, json.JSONDecodeError) as e:
+                    self.add(where, f"invalid JSON in request_body: {e}")
+        if component_type in COMPONENT_EXTENSIONS and component.get("file_path"):
+            self.check_file(
+                component["file_path"], COMPONENT_EXTENSIONS[component_type], where
+            )
+
+    def check_plot(self, component: dict, where: str):
+        plot_type = None
+        if component.get("plot_type"):
+            plot_type = self.check_enum(
+                r.PlotType, component["plot_type"], where, "plot_type"
+            )
+        csv_network_format = component.get("csv_network_format")
+        if csv_network_format:
+            self.check_enum(
+                r.CSVNetworkFormat, csv_network_format, where, "csv_network_format"
+            )
+        if plot_type is None or not component.get("file_path"):
+            return
+        self.check_file(component["file_path"], PLOT_EXTENSIONS[plot_type], where)
+        extension = os.path.splitext(str(component["file_path"]))[1].lower()
+        if (
+            plot_type == r.PlotType.INTERACTIVE_NETWORK
+            and extension in (".csv", ".txt")
+            and not csv_network_format
+        ):
+            self.add(where, "missing 'csv_network_format' of the CSV network file")
+
+
+def validate_config(
+    config: dict,
+    base_dir: Optional[Union[str, Path]] = None,
+    report_type: Optional[str] = None,
+) -> List[str]:
+    """
+    Check a whole report configuration and return all its problems.
+
+    Parameters
+    ----------
+    config : dict
+        The report configuration, as loaded from its YAML file. Its sections may be
+        a LazyYamlList.
+    base_dir : str | Path, optional
+        The folder from which relative file paths are resolved (default is None,
+        the current working directory, as when the report is built).
+    report_type : str, optional
+        The type of the report to build. Titles giving two pages the same name are
+        only problems of Streamlit reports (default is None, checking them too).
+
+    Returns
+    -------
+    list[str]
+        The problems, each starting with where it is in the configuration. Empty if
+        the configuration is valid.
+    """
+    checker = _Checker(
+        Path(base_dir) if base_dir is not None else Path.cwd(), report_type
+    )
+    checker.check_report(config)
+    return checker.problems
+
+
+def check_config(
+    config: dict,
+    logger: logging.Logger,
+    base_dir: Optional[Union[str, Path]] = None,
+    report_type: Optional[str] = None,
+) -> None:
+    """
+    Check a whole report configuration and raise an error listing all its problems.
+
+    Parameters
+    ----------
+    config : dict
+        The report configuration, as loaded from its YAML file.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+    base_dir : str | Path, optional
+        The folder from which relative file paths are resolved (default is None,
+        the current working directory).
+    report_type : str, optional
+        The type of the report to build. Titles giving two pages the same name are
+        only problems of Streamlit reports (default is None, checking them too).
+
+    Raises
+    ------
+    ConfigValidationError
+        If the configuration has any problem.
+    """
+    problems = validate_config(config, base_dir=base_dir, report_type=report_type)
+    if problems:
+        error = ConfigValidationError(problems)
+        logger.error(str(error))
+        raise error
+    logger.info("Configuration checked, no problems found.")
+
+
+def main(config_path: Union[str, Path], report_type: Optional[str] = None) -> int:
+    """
+    Check a configuration file and print its problems.
+
+    Parameters
+    ----------
+    config_path : str | Path
+        The YAML configuration file.
+    report_type : str, optional
+        The type of the report to build. Titles giving two pages the same name are
+        only problems of Streamlit reports (default is None, checking them too).
+
+    Returns
+    -------
+    int
+        The exit code: 0 if the configuration is valid, 1 otherwise.
+    """
+    from .utils.lazy_yaml import load_yaml_config_lazily
+
+    start = time.perf_counter()
+    try:
+        config = load_yaml_config_lazily(config_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"{config_path}: {e}")
+        return 1
+    checker = _Checker(Path.cwd(), report_type)
+    try:
+        checker.check_report(config)
+    except yaml.YAMLError as e:
+        print(f"{config_path}: error parsing the YAML file: {e}")
+        return 1
+    seconds = time.perf_counter() - start
+    for problem in checker.problems:
+        print(f"- {problem}")
+    print(
+        f"{config_path}: {len(checker.problems)} problem(s) found in"
+        f" {checker.n_components} component(s), checked in {seconds:.2f} s."
+    )
+    return 1 if checker.problems else 0
@@ -9,3 +9,7 @@ LOGO_URL = (
     "vuegen/HEAD/docs/images/logo/vuegen_logo.svg"
 )
 TIMEOUT: int = 60
+API_MAX_WORKERS: int = 8
+# Caps on the data of interactive tables embedded in HTML reports
+TABLE_MAX_ROWS: int = 10_000
+TABLE_MAX_BYTES: int = 2**20
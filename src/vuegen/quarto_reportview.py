@@ -1,18 +1,74 @@
 """QuartoReportView class for generating Quarto reports."""
 
+import contextvars
+import hashlib
+import io
+import itertools
+import json
 import os
 import subprocess
 import sys
+import tempfile
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, TextIO, Union
 
-import networkx as nx
+import yaml
 
 from . import report as r
 from . import table_utils
-from .constants import GITHUB_ORG_URL, GITHUB_ORG_URL_BRACKETS, LOGO_URL, ORG, REPO_URL
+from .constants import (
+    GITHUB_ORG_URL,
+    GITHUB_ORG_URL_BRACKETS,
+    LOGO_URL,
+    ORG,
+    REPO_URL,
+    TABLE_MAX_BYTES,
+    TABLE_MAX_ROWS,
+)
 from .utils import create_folder, get_relative_file_path, is_url, sort_imports
+from .utils.assets import AssetStore
+from .utils.images import (
+    POSTPROCESS_IMAGE_CODE,
+    POSTPROCESS_IMAGE_FUNCTION,
+    ImageSettings,
+    postprocess_image,
+)
+from .utils.notebook import execute_notebooks, qmd_to_notebook
+from .utils.prerender import PrerenderTask, prerender_images
+from .utils.profiling import (
+    CHUNK_PROFILER_CLASS,
+    CHUNK_PROFILER_CODE,
+    PROFILE_SUFFIX,
+    PROFILE_SUMMARY_FILE,
+    clear_profiles,
+    profile_stage,
+    summarize_profiles,
+)
+from .utils.variables import make_valid_identifier
+
+# Folder in the static folder with the full tables of truncated DataFrames
+TABLES_DIR = "tables"
+
+# Files of Quarto website projects
+QUARTO_PROJECT_FILE = "_quarto.yml"
+QUARTO_INDEX_FILE = "index.qmd"
+QUARTO_OUTPUT_DIR = "_site"
+# Hashes of the pages rendered by the last build
+QUARTO_PROJECT_MANIFEST = "vuegen_pages.json"
+# Name of the chunk profiler in the generated qmd files
+PROFILER_VAR = "_vuegen_profiler"
+# Size in bytes above which the content of a qmd file is spooled to disk while the
+# sections are generated, before it is written after the imports of all sections
+QMD_SPOOL_SIZE = 8 * 2**20
+# Engines to render PDF reports: LaTeX (default) or the faster Typst
+PDF_ENGINES = ("latex", "typst")
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 class QuartoReportView(r.ReportView):
@@ -30,6 +86,21 @@ class QuartoReportView(r.ReportView):
         quarto_checks: bool = False,
         output_dir: Optional[Path] = BASE_DIR,
         static_dir: str = STATIC_FILES_DIR,
+        prefetch_remote: bool = False,
+        prerender_static: bool = False,
+        max_workers: Optional[int] = None,
+        table_row_count: bool = False,
+        table_max_rows: Optional[int] = TABLE_MAX_ROWS,
+        table_max_bytes: Optional[int] = TABLE_MAX_BYTES,
+        quarto_project: bool = False,
+        profile_chunks: bool = False,
+        profile_memory: bool = False,
+        execute_notebooks: bool = False,
+        dedup_assets: bool = False,
+        pdf_engine: str = "latex",
+        image_settings: Optional[dict] = None,
+        jobs: int = 1,
+        static_store: bool = False,
     ):
         """_summary_
 
@@ -44,10 +115,130 @@ class QuartoReportView(r.ReportView):
             Whether to test if all quarto dependencies are installed, by default False
         static_dir : str
             The folder where the static files will be saved.
+        prefetch_remote : bool, optional
+            Whether to download URL-backed component files to the static folder
+            when generating the report, by default False.
+        prerender_static : bool, optional
+            Whether to render the images of Plotly and Altair plots and of tables
+            of static reports in parallel before Quarto renders the report, instead
+            of in the Quarto chunks, by default False. Unchanged images are skipped.
+        max_workers : int, optional
+            The number of processes used to pre-render images and to render the
+            changed pages of Quarto projects, by default None (the number of CPUs).
+        table_row_count : bool, optional
+            Whether to add the number of rows and columns of a table below its
+            snapshot in static reports, counting the rows of CSV and TXT files, by
+            default False. Truncated snapshots always get a note.
+        table_max_rows : int, optional
+            The maximum number of rows of a table embedded in interactive reports,
+            by default TABLE_MAX_ROWS. Larger local tables are truncated and written
+            in full as a compressed file in the static folder, linked from the
+            report. None disables the limit.
+        table_max_bytes : int, optional
+            The maximum estimated size in bytes of the data of a table embedded in
+            interactive reports, by default TABLE_MAX_BYTES. None disables the limit.
+        quarto_project : bool, optional
+            Whether to generate a Quarto website project with one page per section
+            instead of a single qmd file, by default False. Only changed pages are
+            rendered again, at most max_workers at a time. Only supported for HTML
+            reports, and for Jupyter reports, which get one notebook per page.
+        profile_chunks : bool, optional
+            Whether to time each chunk when Quarto renders the report, by default
+            False. The wall time of the chunks is written to a JSON file per qmd
+            file and summarized in PROFILE_SUMMARY_FILE, slowest first. The timings
+            of earlier builds are removed.
+        profile_memory : bool, optional
+            Whether to also trace the peak memory of the chunks timed with
+            profile_chunks, by default False. Tracing slows down the chunks.
+        execute_notebooks : bool, optional
+            Whether to execute the notebooks of Jupyter reports, by default False.
+            Notebooks of Quarto projects are executed concurrently, at most
+            max_workers at a time.
+        dedup_assets : bool, optional
+            Whether to save the scripts and stylesheets of the network views and
+            HTML components once in the static folder and point all of them to these
+            copies, by default False. HTML reports are then no longer self-contained
+            but ship the static folder, instead of inlining a copy of the libraries
+            for each embedded file. Only supported for HTML and Reveal.js reports.
+        pdf_engine : str, optional
+            The engine used to render PDF reports, one of PDF_ENGINES, by default
+            "latex". "typst" uses the Typst format of Quarto, which needs no TeX
+            installation and renders faster, with the same footer.
+        image_settings : dict, optional
+            The resolution, maximum size and format of the images of static
+            reports, as ImageSettings fields, by default None. They override the
+            image settings of the report and are overridden by those of each
+            component.
+        jobs : int, optional
+            The number of threads generating the content of the components, such
+            as reading tables and networks and writing their static files, by
+            default 1. Also limits the processes pre-rendering images if
+            max_workers is not set.
+        static_store : bool, optional
+            Whether to name the static files of the components after the hash of
+            their content and settings, by default False. Components with the same
+            content share their files and files of previous builds are reused. A
+            manifest maps the components to their files.
         """
-        super().__init__(report=report, report_type=report_type)
+        super().__init__(
+            report=report, report_type=report_type, jobs=jobs, static_store=static_store
+        )
         self.quarto_checks = quarto_checks
         self.static_dir = static_dir
+        self.prefetch_remote = prefetch_remote
+        self.prerender_static = prerender_static
+        self.max_workers = max_workers
+        if max_workers is None and self.jobs > 1:
+            self.max_workers = self.jobs
+        self.table_row_count = table_row_count
+        self.table_max_rows = table_max_rows
+        self.table_max_bytes = table_max_bytes
+        self.quarto_project = quarto_project
+        self.profile_chunks = profile_chunks
+        self.profile_memory = profile_memory
+        self.execute_notebooks = execute_notebooks
+        self.dedup_assets = dedup_assets
+        if pdf_engine not in PDF_ENGINES:
+            self.report.logger.error(
+                "Invalid PDF engine '%s'. Valid engines are: %s",
+                pdf_engine,
+                ", ".join(PDF_ENGINES),
+            )
+            raise ValueError(
+                f"Invalid PDF engine '{pdf_engine}'. Valid engines are:"
+                f" {', '.join(PDF_ENGINES)}"
+            )
+        self.pdf_engine = pdf_engine
+        try:
+            self.image_settings = (
+                ImageSettings().merge(report.image_settings).merge(image_settings)
+            )
+        except (TypeError, ValueError) as e:
+            self.report.logger.error("Invalid image settings: %s", e)
+            raise ValueError(f"Invalid image settings: {e}") from e
+        if quarto_project and report_type not in [
+            r.ReportType.HTML,
+            r.ReportType.JUPYTER,
+        ]:
+            self.report.logger.warning(
+                "Quarto projects are only supported for HTML and Jupyter reports,"
+                " generating a single qmd file for the '%s' report.",
+                report_type,
+            )
+            self.quarto_project = False
+        if dedup_assets and report_type not in [
+            r.ReportType.HTML,
+            r.ReportType.REVEALJS,
+        ]:
+            self.report.logger.warning(
+                "Shared assets are only supported for HTML and Reveal.js reports,"
+                " ignoring them for the '%s' report.",
+                report_type,
+            )
+            self.dedup_assets = False
+        self._asset_store: Optional[AssetStore] = None
+        self._page_hashes = {}
+        self._prerender_tasks: List[PrerenderTask] = []
         self.output_dir = output_dir.resolve().absolute()
         # self.BUNDLED_EXECUTION = False
         self.quarto_path = "quarto"
@@ -104,6 +295,9 @@ class QuartoReportView(r.ReportView):
                 "Output directory already existed: '%s'", self.output_dir
             )
 
+        if self.profile_chunks:
+            clear_profiles(self.output_dir)
+
         # Create the static folder
         if create_folder(self.static_dir):
             self.report.logger.info(
@@ -115,6 +309,11 @@ class QuartoReportView(r.ReportView):
                 self.static_dir,
             )
 
+        self._prerender_tasks = []
+        self._open_static_store(self.static_dir)
+        if self.dedup_assets:
+            self._asset_store = AssetStore(self.static_dir, self.report.logger)
+
         try:
             # Create variable to check if the report is static or revealjs
             is_report_revealjs = self.report_type == r.ReportType.REVEALJS
@@ -125,7 +324,7 @@ class QuartoReportView(r.ReportView):
             # Create qmd content and imports for the report
             qmd_content = []
             # only one global import list for a single report (different to streamlit)
-            report_imports = []
+            report_imports = set()
 
             # Add description of the report
             if self.report.description:
@@ -139,102 +338,541 @@ class QuartoReportView(r.ReportView):
 
             # Add the sections and subsections to the report
             self.report.logger.info("Starting to generate sections for the report.")
-            for section in self.report.sections:
+            if self.quarto_project:
+                self._generate_project(qmd_content)
+            else:
+                # The imports of all sections come first, so the content is kept
+                # aside while the sections are generated
+                with tempfile.SpooledTemporaryFile(
+                    max_size=QMD_SPOOL_SIZE, mode="w+", encoding="utf-8", newline=""
+                ) as content_file:
+                    lines = self._iter_report_content(
+                        qmd_content, report_imports, is_report_revealjs
+                    )
+                    for idx, line in enumerate(lines):
+                        content_file.write(f"\n{line}" if idx else line)
+                    content_file.seek(0)
+                    self._write_qmd(
+                        self.output_dir / f"{self.BASE_DIR}.qmd",
+                        yaml_header,
+                        report_imports,
+                        content_file,
+                    )
+
+            if self._prerender_tasks:
+                with profile_stage("prerender_images"):
+                    prerender_images(
+                        self._prerender_tasks,
+                        static_dir=self.static_dir,
+                        logger=self.report.logger,
+                        max_workers=self.max_workers,
+                    )
+            if self._asset_store is not None and self._asset_store.html_files:
+                self._asset_store.write_report()
+            if self._static_store is not None:
+                self._static_store.write_manifest()
+
+        except Exception as e:
+            self.report.logger.error(
+                "An error occurred while generating the report: %s",
+                e,
+                exc_info=True,
+            )
+            raise
+
+    def _iter_report_content(
+        self,
+        qmd_content: List[str],
+        report_imports: set,
+        is_report_revealjs: bool,
+    ) -> Iterator[str]:
+        """
+        Iterate over the content lines of a single qmd report, generating its
+        sections one at a time.
+
+        Parameters
+        ----------
+        qmd_content : List[str]
+            The content lines before the sections, e.g. the report description.
+        report_imports : set
+            The set to which the imports of the sections are added.
+        is_report_revealjs : bool
+            A boolean indicating whether the report is in revealjs format.
+
+        Yields
+        ------
+        str
+            The content lines of the report.
+        """
+        yield from qmd_content
+        for section in self._iter_sections():
+            section_content, section_imports = self._generate_section(
+                section, is_report_revealjs
+            )
+            report_imports.update(section_imports)
+            yield from section_content
+
+    def _generate_section(
+        self, section: r.Section, is_report_revealjs: bool, add_title: bool = True
+    ) -> tuple[List[str], List[str]]:
+        """
+        Generate the content of a section with its components and subsections.
+
+        Parameters
+        ----------
+        section : Section
+            The section to generate content for.
+        is_report_revealjs : bool
+            A boolean indicating whether the report is in revealjs format.
+        add_title : bool, optional
+            Whether to add the section title as header, by default True. Pages of
+            Quarto projects show it as the page title instead.
+
+        Returns
+        -------
+        tuple : (List[str], List[str])
+            - list of section content lines (List[str])
+            - list of imports for the section (List[str])
+        """
+        section_content = []
+        section_imports = []
+        self.report.logger.debug(
+            "Processing section: '%s' - %d subsection(s)",
+            section.title,
+            len(section.subsections),
+        )
+        # Add section header and description
+        if add_title:
+            section_content.append(f"# {section.title}")
+        if section.description:
+            section_content.append(f"""{section.description}\n""")
+
+        # Add components of section to the report
+        # ! description can be a Markdown component, but it is treated
+        # ! differently. It won't be added to the section content.
+        if section.components:
+            self.report.logger.debug(
+                "Adding components of section folder to the report."
+            )
+            components_content, components_imports = self._combine_components(
+                section.components
+            )
+            if components_content:
+                section_content.append(f"## Overview {section.title}".strip())
+
+                if is_report_revealjs:
+                    # Add tabset for revealjs
+                    components_content = [
+                        "::: {.panel-tabset}\n",
+                        *components_content,
+                        ":::",
+                    ]
+                section_content.extend(components_content)
+
+            section_imports.extend(components_imports)
+
+        if section.subsections:
+            # Iterate through subsections and
+            # integrate them into the section file
+            for subsection in section.subsections:
                 self.report.logger.debug(
-                    "Processing section: '%s' - %d subsection(s)",
-                    section.title,
-                    len(section.subsections),
+                    "Processing subsection: '%s' - %d component(s)",
+                    subsection.title,
+                    len(subsection.components),
                 )
-                # Add section header and description
-                qmd_content.append(f"# {section.title}")
-                if section.description:
-                    qmd_content.append(f"""{section.description}\n""")
-
-                # Add components of section to the report
-                # ! description can be a Markdown component, but it is treated
-                # ! differently. It won't be added to the section content.
-                if section.components:
-                    self.report.logger.debug(
-                        "Adding components of section folder to the report."
-                    )
-                    section_content, section_imports = self._combine_components(
-                        section.components
+                # Generate content for the subsection
+                subsection_content, subsection_imports = self._generate_subsection(
+                    subsection,
+                    is_report_revealjs,
+                )
+                section_content.extend(subsection_content)
+                section_imports.extend(subsection_imports)
+        else:
+            self.report.logger.warning(
+                "No subsections found in section: '%s'. To show content "
+                "in the report, add subsections to the section.",
+                section.title,
+            )
+        return section_content, section_imports
+
+    def _write_qmd(
+        self,
+        fname_qmd: Path,
+        yaml_header: str,
+        imports: Iterable[str],
+        qmd_content: Union[List[str], TextIO],
+    ) -> str:
+        """
+        Write a qmd file with its YAML header, a chunk with the imports and the
+        content.
+
+        Parameters
+        ----------
+        fname_qmd : Path
+            The qmd file to write.
+        yaml_header : str
+            The YAML header of the file.
+        imports : Iterable[str]
+            The imports and setup statements of the components of the file.
+        qmd_content : List[str] | TextIO
+            The content lines of the file, or a file with the content, which is
+            copied line by line.
+
+        Returns
+        -------
+        str
+            The hash of the written text.
+        """
+        # Add globally set output folder
+        imports = [*imports, "from pathlib import Path", "report_dir = Path().cwd()"]
+
+        # ! set leads to random import order
+        # ! separate and sort import statements, separate from setup code
+        unique_imports, setup_statements = sort_imports(set(imports))
+        unique_imports += os.linesep
+        unique_imports.extend(setup_statements)
+        if self.profile_chunks:
+            # the profiler is defined in the file, the kernel runs in its folder
+            unique_imports += [
+                "",
+                CHUNK_PROFILER_CODE,
+                f"{PROFILER_VAR} = {CHUNK_PROFILER_CLASS}.install("
+                f"'{fname_qmd.stem}{PROFILE_SUFFIX}', memory={self.profile_memory})",
+            ]
+
+        # Format imports
+        formatted_imports = "\n".join(unique_imports)
+
+        header = (
+            f"{yaml_header}\n```{{python}}\n#| label: 'Imports'\n"
+            f"{formatted_imports}\n```\n\n"
+        )
+        if isinstance(qmd_content, list):
+            qmd_content = io.StringIO("\n".join(qmd_content))
+        lines = itertools.chain(io.StringIO(header), qmd_content)
+        if self.profile_chunks:
+            lines = self._add_chunk_profiling(lines)
+        digest = hashlib.sha256()
+        with profile_stage("write_file", file=fname_qmd.name):
+            with open(fname_qmd, "w", encoding="utf-8") as quarto_report:
+                for line in lines:
+                    quarto_report.write(line)
+                    digest.update(line.encode("utf-8"))
+        self.report.logger.info("Created qmd script to render the app: %s", fname_qmd)
+        return digest.hexdigest()
+
+    def _add_chunk_profiling(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Start the chunk profiler at the beginning of each Python chunk, after the
+        chunk options. The chunk is timed until its end, so that the display of its
+        last expression is not affected.
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            The lines of the qmd file, with their line breaks.
+
+        Yields
+        ------
+        str
+            The lines of the qmd file with the profiled chunks.
+        """
+        n_chunks = 0
+        # label of the chunk whose options are read, if any
+        label = None
+        for line in lines:
+            if label is not None:
+                if line.startswith("#|"):
+                    option = line[2:].strip()
+                    if option.startswith("label:"):
+                        label = option[len("label:") :].strip().strip("'\"")
+                    yield line
+                    continue
+                if label != "Imports":
+                    yield f"{PROFILER_VAR}.start({label!r})\n"
+                label = None
+            yield line
+            if line.strip() == "```{python}":
+                n_chunks += 1
+                label = f"chunk {n_chunks}"
+        if label is not None and label != "Imports":
+            yield f"\n{PROFILER_VAR}.start({label!r})"
+
+    def _generate_project(self, index_content: List[str]) -> None:
+        """
+        Write a Quarto website project: an index page with the report description,
+        one page per section and the `_quarto.yml` project file. The hash of each
+        page and of the files of its components is kept to render only the pages
+        which changed since the last build.
+
+        Parameters
+        ----------
+        index_content : List[str]
+            The content lines of the index page.
+        """
+        self._page_hashes = {}
+        pages = [QUARTO_INDEX_FILE]
+        index_text = self._create_page_header(self.report.title) + "\n".join(
+            index_content
+        )
+        with open(self.output_dir / QUARTO_INDEX_FILE, "w", encoding="utf-8") as f:
+            f.write(index_text)
+        self._page_hashes[QUARTO_INDEX_FILE] = {
+            "source": _hash_text(index_text),
+            "data": "",
+        }
+
+        for idx, section in enumerate(self._iter_sections(), start=1):
+            section_content, section_imports = self._generate_section(
+                section, is_report_revealjs=False, add_title=False
+            )
+            fname_page = f"{idx}_{make_valid_identifier(section.title).lower()}.qmd"
+            page_hash = self._write_qmd(
+                self.output_dir / fname_page,
+                self._create_page_header(section.title, jupyter=True),
+                section_imports,
+                section_content,
+            )
+            pages.append(fname_page)
+            self._page_hashes[fname_page] = {
+                "source": page_hash,
+                "data": self._hash_section_files(section),
+            }
+
+        project_text = yaml.safe_dump(
+            self._create_project_config(pages), sort_keys=False, allow_unicode=True
+        )
+        with open(self.output_dir / QUARTO_PROJECT_FILE, "w", encoding="utf-8") as f:
+            f.write(project_text)
+        self._page_hashes[QUARTO_PROJECT_FILE] = {
+            "source": _hash_text(project_text),
+            "data": "",
+        }
+        self.report.logger.info(
+            "Created Quarto project with %d page(s): %s", len(pages), self.output_dir
+        )
+
+    def _create_page_header(self, title: str, jupyter: bool = False) -> str:
+        """Create the YAML header of a page of a Quarto project."""
+        header = {"title": title}
+        if jupyter:
+            header["jupyter"] = "python3"
+        return (
+            f"---\n{yaml.safe_dump(header, sort_keys=False, allow_unicode=True)}---\n"
+        )
+
+    def _create_project_config(self, pages: List[str]) -> dict:
+        """
+        Create the `_quarto.yml` configuration of a Quarto website project.
+
+        Parameters
+        ----------
+        pages : List[str]
+            The qmd files of the pages, the index page first.
+
+        Returns
+        -------
+        dict
+            The project configuration.
+        """
+        project = {
+            "type": "website",
+            "output-dir": QUARTO_OUTPUT_DIR,
+            # only the generated pages, not other qmd files in the folder
+            "render": list(pages),
+        }
+        static_dir = Path(self.static_dir).resolve()
+        if static_dir.is_relative_to(self.output_dir):
+            # e.g. the HTML files of networks, which are only linked in iframes
+            project["resources"] = [
+                f"{static_dir.relative_to(self.output_dir).as_posix()}/**"
+            ]
+        return {
+            "project": project,
+            "execute": {"freeze": "auto", "echo": False, "output": "asis"},
+            "fig-align": "center",
+            "website": {
+                "title": self.report.title,
+                # no site search: on later builds, pages are rendered on their own
+                "search": False,
+                "sidebar": {"style": "docked", "contents": list(pages)},
+                "page-footer": {
+                    "center": (
+                        f"This report was generated with [VueGen]({REPO_URL}) |"
+                        f" Copyright 2025 [{ORG}]({GITHUB_ORG_URL})"
                     )
-                    if section_content:
-                        qmd_content.append(f"## Overview {section.title}".strip())
-
-                        if is_report_revealjs:
-                            # Add tabset for revealjs
-                            section_content = [
-                                "::: {.panel-tabset}\n",
-                                *section_content,
-                                ":::",
-                            ]
-                        qmd_content.extend(section_content)
-
-                    report_imports.extend(section_imports)
-
-                if section.subsections:
-                    # Iterate through subsections and
-                    # integrate them into the section file
-                    for subsection in section.subsections:
-                        self.report.logger.debug(
-                            "Processing subsection: '%s' - %d component(s)",
-                            subsection.title,
-                            len(subsection.components),
-                        )
-                        # Generate content for the subsection
-                        subsection_content, subsection_imports = (
-                            self._generate_subsection(
-                                subsection,
-                                is_report_revealjs,
-                            )
+                },
+            },
+            "format": {"html": {"toc": True, "toc-depth": 3, "page-layout": "full"}},
+        }
+
+    def _hash_section_files(self, section: r.Section) -> str:
+        """Hash the path, size and modification time of the local component files of
+        a section, so that pages are rendered again when their data changes."""
+        components = list(section.components)
+        for subsection in section.subsections:
+            components.extend(subsection.components)
+        file_stats = []
+        for component in components:
+            if component.file_path is None:
+                continue
+            if is_url(component.file_path) or not Path(component.file_path).exists():
+                file_stats.append([component.file_path])
+            else:
+                stat = Path(component.file_path).stat()
+                file_stats.append([component.file_path, stat.st_size, stat.st_mtime_ns])
+        return _hash_text(json.dumps(file_stats))
+
+    def _run_project(self) -> None:
+        """
+        Render the pages of a Quarto project which changed since the last build.
+
+        The whole project is rendered on the first build and when the project file
+        changed, reusing the frozen results of unchanged pages. Otherwise, only the
+        changed pages are rendered, concurrently with at most max_workers Quarto
+        processes (default: the number of CPUs). The renders of a project share
+        its site libraries, which are written by the first render: unless the
+        whole project was just rendered, the first changed page is rendered alone
+        and the other pages, which then only write their own files, concurrently.
+        """
+        manifest_path = self.output_dir / QUARTO_PROJECT_MANIFEST
+        previous = {}
+        if manifest_path.exists():
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        page_hashes = self._page_hashes
+        site_index = (
+            self.output_dir / QUARTO_OUTPUT_DIR / Path(QUARTO_INDEX_FILE)
+        ).with_suffix(".html")
+
+        changed_pages = [
+            page
+            for page, page_hash in page_hashes.items()
+            if page != QUARTO_PROJECT_FILE and previous.get(page) != page_hash
+        ]
+        render_all = (
+            not page_hashes
+            or not site_index.exists()
+            or previous.get(QUARTO_PROJECT_FILE) != page_hashes[QUARTO_PROJECT_FILE]
+        )
+        if render_all:
+            self._run_quarto([self.quarto_path, "render", str(self.output_dir)])
+            # pages with unchanged source but changed data were frozen
+            changed_pages = [
+                page
+                for page in changed_pages
+                if page in previous
+                and previous[page]["source"] == page_hashes[page]["source"]
+            ]
+        if changed_pages:
+            self.report.logger.info(
+                "Rendering %d changed page(s): %s", len(changed_pages), changed_pages
+            )
+            if not render_all:
+                # writes the site libraries shared by the pages
+                self._render_page(changed_pages[0])
+                changed_pages = changed_pages[1:]
+            if changed_pages:
+                max_workers = min(
+                    self.max_workers or os.cpu_count() or 1, len(changed_pages)
+                )
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = [
+                        # in a copy of the context, e.g. with the build profiler
+                        pool.submit(
+                            contextvars.copy_context().run, self._render_page, page
                         )
-                        qmd_content.extend(subsection_content)
-                        report_imports.extend(
-                            subsection_imports
-                        )  # even easier as it's global
-                else:
-                    self.report.logger.warning(
-                        "No subsections found in section: '%s'. To show content "
-                        "in the report, add subsections to the section.",
-                        section.title,
-                    )
-            # Add globally set output folder
-            report_imports.append("from pathlib import Path")
-            report_imports.append("report_dir = Path().cwd()")
+                        for page in changed_pages
+                    ]
+                for future in futures:
+                    future.result()
+        elif not render_all:
+            self.report.logger.info("All pages are up to date, nothing to render.")
+
+        if not site_index.exists():
+            raise FileNotFoundError(f"Report file could not be created: {site_index}")
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(page_hashes, f, indent=2)
+        self.report.logger.info(
+            "'%s' '%s' report rendered", self.report.title, self.report_type
+        )
 
-            # Remove duplicated imports
-            report_unique_imports = set(report_imports)
+    def _render_page(self, page: str) -> None:
+        """Render a page of a Quarto project."""
+        self._run_quarto([self.quarto_path, "render", str(self.output_dir / page)])
 
-            # ! set leads to random import order
-            # ! separate and sort import statements, separate from setup code
+    def _write_notebooks(self) -> None:
+        """
+        Convert the generated qmd files (one per page for Quarto projects) to
+        notebooks, without rendering them with Quarto, and execute the notebooks
+        concurrently if requested.
+        """
+        import nbformat
 
-            report_unique_imports, setup_statements = sort_imports(
-                report_unique_imports
+        if self.quarto_project:
+            qmd_files = [
+                page for page in self._page_hashes if page != QUARTO_PROJECT_FILE
+            ]
+        else:
+            qmd_files = [f"{self.BASE_DIR}.qmd"]
+
+        notebook_paths = []
+        for qmd_file in qmd_files:
+            qmd_path = self.output_dir / qmd_file
+            with open(qmd_path, "r", encoding="utf-8") as f:
+                notebook = qmd_to_notebook(f.read())
+            notebook_path = qmd_path.with_suffix(".ipynb")
+            nbformat.write(notebook, notebook_path)
+            notebook_paths.append(notebook_path)
+            self.report.logger.info("Created notebook: %s", notebook_path)
+
+        if self.execute_notebooks:
+            execute_notebooks(
+                notebook_paths,
+                logger=self.report.logger,
+                max_workers=self.max_workers,
             )
-            report_unique_imports += os.linesep
-            report_unique_imports.extend(setup_statements)
-
-            # Format imports
-            report_formatted_imports = "\n".join(report_unique_imports)
-
-            # Write the navigation and general content to a Python file
-            fname_qmd_report = self.output_dir / f"{self.BASE_DIR}.qmd"
-            with open(fname_qmd_report, "w", encoding="utf-8") as quarto_report:
-                quarto_report.write(yaml_header)
-                quarto_report.write(f"""\n```{{python}}
-#| label: 'Imports'
-{report_formatted_imports}
-```\n\n""")
-                quarto_report.write("\n".join(qmd_content))
+            self._summarize_chunk_profiles()
+        self.report.logger.info(
+            "'%s' '%s' report written", self.report.title, self.report_type
+        )
+
+    def _summarize_chunk_profiles(self) -> None:
+        """Write the summary of the chunk timings and log the slowest chunks."""
+        if not self.profile_chunks:
+            return
+        timings = summarize_profiles(self.output_dir)
+        self.report.logger.info(
+            "Chunk timings written to: %s", self.output_dir / PROFILE_SUMMARY_FILE
+        )
+        for timing in timings[:5]:
+            if timing["peak_memory"] is None:
                 self.report.logger.info(
-                    "Created qmd script to render the app: %s", fname_qmd_report
+                    "%.3f s: %s (%s)",
+                    timing["seconds"],
+                    timing["label"],
+                    timing["file"],
+                )
+            else:
+                self.report.logger.info(
+                    "%.3f s, peak %.1f MiB: %s (%s)",
+                    timing["seconds"],
+                    timing["peak_memory"] / 2**20,
+                    timing["label"],
+                    timing["file"],
                 )
 
-        except Exception as e:
+    def _run_quarto(self, args: List[str]) -> None:
+        """Run a Quarto command, logging and raising errors."""
+        self.report.logger.info("Running %r", args)
+        try:
+            with profile_stage("quarto", command=args):
+                subprocess.run(args, check=True)
+        except subprocess.CalledProcessError as e:
             self.report.logger.error(
-                "An error occurred while generating the report: %s",
+                "Error running '%s' %s report: %s",
+                self.report.title,
+                self.report_type,
                 e,
                 exc_info=True,
             )
@@ -253,6 +891,14 @@ class QuartoReportView(r.ReportView):
         if output_dir is not None:
             self.output_dir = Path(output_dir).resolve().absolute()
 
+        if self.report_type == r.ReportType.JUPYTER:
+            self._write_notebooks()
+            return
+        if self.quarto_project:
+            self._run_project()
+            self._summarize_chunk_profiles()
+            return
+
         file_path_to_qmd = Path(self.output_dir) / f"{self.BASE_DIR}.qmd"
         args = [self.quarto_path, "render", str(file_path_to_qmd)]
         self.report.logger.info(
@@ -269,43 +915,33 @@ class QuartoReportView(r.ReportView):
                 r.ReportType.ODT,
             ]
             and self.quarto_checks
+            and not self._is_typst_pdf()
         ):
             subprocess.run(
                 [self.quarto_path, "install", "tinytex", "--no-prompt"],
                 check=True,
             )
         try:
-            subprocess.run(
-                args,
-                check=True,
-            )
+            with profile_stage("quarto", command=args):
+                subprocess.run(
+                    args,
+                    check=True,
+                )
             if self.report_type == r.ReportType.REVEALJS:
                 out_path = file_path_to_qmd.with_name(
                     f"{file_path_to_qmd.stem}_revealjs.html"
                 )
-            elif self.report_type == r.ReportType.JUPYTER:
-                out_path = file_path_to_qmd.with_suffix(".html")
             else:
                 out_path = file_path_to_qmd.with_suffix(f".{self.report_type.lower()}")
             if not out_path.exists():
                 raise FileNotFoundError(f"Report file could not be created: {out_path}")
 
-            if self.report_type == r.ReportType.JUPYTER:
-                args = [self.quarto_path, "convert", str(file_path_to_qmd)]
-                subprocess.run(
-                    args,
-                    check=True,
-                )
-                self.report.logger.info(
-                    "Converted '%s' '%s' report to Jupyter Notebook after execution",
-                    self.report.title,
-                    self.report_type,
-                )
             self.report.logger.info(
                 "'%s' '%s' report rendered",
                 self.report.title,
                 self.report_type,
             )
+            self._summarize_chunk_profiles()
         except subprocess.CalledProcessError as e:
             self.report.logger.error(
                 "Error running '%s' %s report: %s",
@@ -463,6 +1099,26 @@ class QuartoReportView(r.ReportView):
                              target="_blank">{ORG}</a>
                         </footer>"""),
         }
+        if self._is_typst_pdf():
+            format_configs[r.ReportType.PDF] = textwrap.indent(
+                textwrap.dedent(f"""
+                      typst:
+                        toc: false
+                        fig-align: center
+                        margin:
+                          bottom: 40mm
+                        include-in-header:
+                            text: |
+                                #set page(footer: context [
+                                  #set text(size: 9pt)
+                                  This report was generated with
+                                  #link("{REPO_URL}")[VueGen] | © 2025
+                                  #link("{GITHUB_ORG_URL}")[{ORG}]
+                                  #h(1fr) #counter(page).display()
+                                ])"""),
+                "  ",
+            )
+
         # Create a key based on the report type and format
         key = self.report_type
 
@@ -472,12 +1128,20 @@ class QuartoReportView(r.ReportView):
         else:
             raise ValueError(f"Unsupported report type: {self.report_type}")
 
+        if self.dedup_assets:
+            # the shared assets are loaded from the static folder
+            config = config.replace("self-contained: true", "embed-resources: false")
+
         # Add the specific configuration to the YAML header
         yaml_header += config
         yaml_header += "\n---\n"
 
         return yaml_header
 
+    def _is_typst_pdf(self) -> bool:
+        """Whether the report is a PDF rendered with Typst instead of LaTeX."""
+        return self.report_type == r.ReportType.PDF and self.pdf_engine == "typst"
+
     def _combine_components(self, components: list[dict]) -> tuple[list, list]:
         """combine a list of components."""
 
@@ -491,28 +1155,34 @@ class QuartoReportView(r.ReportView):
             all_imports.extend(component_imports)
 
             # Handle different types of components
-            fct = self.components_fct_map.get(component.component_type, None)
-            if fct is None:
-                self.report.logger.warning(
-                    "Unsupported component type '%s'", component.component_type
-                )
-            elif (
-                component.component_type == r.ComponentType.MARKDOWN
-                and component.title.lower() == "description"
-            ):
-                self.report.logger.debug("Skipping description.md markdown of section.")
-            elif (
-                component.component_type == r.ComponentType.HTML
-                and self.is_report_static
-            ):
-                self.report.logger.debug("Skipping HTML component for static report.")
-            else:
-                content = fct(component)
+            content = self._get_component_content(component)
+            if content is not None:
                 all_contents.extend(content)
         # remove duplicates
         all_imports = list(set(all_imports))
         return all_contents, all_imports
 
+    def _generate_component(self, component: r.Component) -> Optional[List[str]]:
+        """Generate the content of a component, skipping the description of
+        sections and HTML components of static reports."""
+        if (
+            component.component_type == r.ComponentType.MARKDOWN
+            and component.title.lower() == "description"
+        ):
+            self.report.logger.debug("Skipping description.md markdown of section.")
+            return None
+        if component.component_type == r.ComponentType.HTML and self.is_report_static:
+            self.report.logger.debug("Skipping HTML component for static report.")
+            return None
+        return super()._generate_component(component)
+
+    def _prepare_sections(self, sections: List[r.Section]) -> None:
+        """Download the remote files of the components, if prefetch_remote is set,
+        before preparing them."""
+        if self.prefetch_remote:
+            self._prefetch_remote_files(self.static_dir, sections)
+        super()._prepare_sections(sections)
+
     def _generate_subsection(
         self,
         subsection,
@@ -543,7 +1213,13 @@ class QuartoReportView(r.ReportView):
         if subsection.description:
             subsection_content.append(f"""{subsection.description}\n""")
 
-        if is_report_revealjs:
+        # components are shown in tabs for revealjs slides, and for HTML reports
+        # if the subsection layout asks for tabs
+        use_tabset = is_report_revealjs or (
+            subsection.layout == r.SubsectionLayout.TABS
+            and self.report_type == r.ReportType.HTML
+        )
+        if use_tabset:
             subsection_content.append("::: {.panel-tabset}\n")
 
         (
@@ -552,7 +1228,7 @@ class QuartoReportView(r.ReportView):
         ) = self._combine_components(subsection.components)
         subsection_content.extend(all_components)
 
-        if is_report_revealjs:
+        if use_tabset:
             subsection_content.append(":::\n")
 
         self.report.logger.info(
@@ -582,47 +1258,113 @@ class QuartoReportView(r.ReportView):
         if self.is_report_static:
             # ? should that be in the output folder
             static_plot_path = (
-                Path(self.static_dir) / f"{plot.title.replace(' ', '_')}.png"
+                Path(self.static_dir) / f"{self._static_name(plot)}.png"
             ).resolve()
-            self.report.logger.debug("Static plot path: %s", static_plot_path)
+            # images are rendered as PNG, then downscaled or converted if needed
+            image = self._get_image_settings(plot)
+            static_image_path = static_plot_path.with_suffix(image.suffix)
+            self.report.logger.debug("Static plot path: %s", static_image_path)
         else:
             html_plot_file = (
-                Path(self.static_dir) / f"{plot.title.replace(' ', '_')}.html"
+                Path(self.static_dir) / f"{self._static_name(plot)}.html"
             ).absolute()
 
         # Add content for the different plot types
         try:
             if plot.plot_type == r.PlotType.STATIC:
+                image_path = plot.file_path
+                if (
+                    self.is_report_static
+                    and image.needs_postprocessing
+                    and not is_url(plot.file_path)
+                    and Path(plot.file_path).suffix.lower() in [".png", ".jpg", ".jpeg"]
+                ):
+                    # downscaled copy of the image in the static folder
+                    image_path = static_image_path
+                    with self._writing_static_file(plot, static_image_path) as write:
+                        if write:
+                            image_path = postprocess_image(
+                                plot.file_path,
+                                static_image_path,
+                                keep_input=True,
+                                **image.postprocess_kwargs(),
+                            )
                 plot_content.append(
-                    self._generate_image_content(plot.file_path, width="90%")
+                    self._generate_image_content(image_path, width="90%")
                 )
             elif plot.plot_type == r.PlotType.PLOTLY:
-                plot_content.append(self._generate_plot_code(plot))
-                if self.is_report_static:
+                if is_url(plot.file_path):
+                    plot_content.append(self._generate_plot_code(plot))
+                else:
+                    # Write the pre-filtered figure once, so it is loaded as is
+                    json_plot_file = (
+                        Path(self.static_dir) / f"{self._static_name(plot)}.json"
+                    ).resolve()
+                    with self._writing_static_file(plot, json_plot_file) as write:
+                        if write:
+                            plot.save_compact_plotly_json(json_plot_file)
+                    if self._use_prerender(plot):
+                        self._add_prerender_task(
+                            "plotly", json_plot_file, static_image_path, image=image
+                        )
+                    else:
+                        plot_content.append(
+                            self._generate_plot_code(plot, json_plot_file)
+                        )
+                if self._use_prerender(plot):
+                    plot_content.append(self._generate_image_content(static_image_path))
+                elif self.is_report_static:
                     fpath = static_plot_path.relative_to(self.output_dir).as_posix()
-                    plot_content.append(f"""fig_plotly.write_image("{fpath}")\n```\n""")
-                    plot_content.append(self._generate_image_content(static_plot_path))
+                    scale = f", scale={image.scale:g}" if image.scale else ""
+                    plot_content.append(
+                        f"""fig_plotly.write_image("{fpath}"{scale})\n"""
+                        f"{self._generate_postprocess_code(fpath, image)}```\n"
+                    )
+                    plot_content.append(self._generate_image_content(static_image_path))
                 else:
                     plot_content.append("""fig_plotly.show()\n```\n""")
+            elif plot.plot_type == r.PlotType.ALTAIR and self._use_prerender(plot):
+                self._add_prerender_task(
+                    "altair", plot.file_path, static_image_path, image=image
+                )
+                plot_content.append(self._generate_image_content(static_image_path))
             elif plot.plot_type == r.PlotType.ALTAIR:
                 plot_content.append(self._generate_plot_code(plot))
                 if self.is_report_static:
                     fpath = static_plot_path.relative_to(self.output_dir).as_posix()
-                    plot_content.append(f"""fig_altair.save("{fpath}")\n```\n""")
-                    plot_content.append(self._generate_image_content(static_plot_path))
+                    scale = f", scale_factor={image.scale:g}" if image.scale else ""
+                    plot_content.append(
+                        f"""fig_altair.save("{fpath}"{scale})\n"""
+                        f"{self._generate_postprocess_code(fpath, image)}```\n"
+                    )
+                    plot_content.append(self._generate_image_content(static_image_path))
                 else:
                     plot_content.append("""fig_altair\n```\n""")
             elif plot.plot_type == r.PlotType.INTERACTIVE_NETWORK:
-                networkx_graph = plot.read_network()
+                import networkx as nx
+
+                with profile_stage("read_network", file=str(plot.file_path)):
+                    networkx_graph = plot.read_network()
                 if isinstance(networkx_graph, tuple):
                     # If network_data is a tuple,
                     # separate the network and html file path
                     networkx_graph, html_plot_file = networkx_graph
+                    if self._asset_store is not None and not is_url(html_plot_file):
+                        html_plot_file = self._asset_store.localize_html(
+                            html_plot_file,
+                            Path(self.static_dir).absolute()
+                            / f"{self._static_name(plot)}.html",
+                        )
                 elif isinstance(networkx_graph, nx.Graph) and not self.is_report_static:
-                    # Get the pyvis object and create html
-                    _ = plot.create_and_save_pyvis_network(
-                        networkx_graph, html_plot_file
-                    )
+                    with self._writing_static_file(plot, html_plot_file) as write:
+                        if write:
+                            # Get the pyvis object and create html
+                            with profile_stage("write_network_html"):
+                                _ = plot.create_and_save_pyvis_network(
+                                    networkx_graph, html_plot_file
+                                )
+                            if self._asset_store is not None:
+                                self._asset_store.localize_html(html_plot_file)
 
                 # Add number of nodes and edges to the plot content
                 num_nodes = networkx_graph.number_of_nodes()
@@ -632,8 +1374,22 @@ class QuartoReportView(r.ReportView):
 
                 # Add code to generate network depending on the report type
                 if self.is_report_static:
-                    plot.save_network_image(networkx_graph, static_plot_path, "png")
-                    plot_content.append(self._generate_image_content(static_plot_path))
+                    with self._writing_static_file(plot, static_image_path) as write:
+                        if write:
+                            with profile_stage("write_network_image"):
+                                plot.save_network_image(
+                                    networkx_graph,
+                                    static_plot_path,
+                                    "png",
+                                    **({"dpi": image.dpi} if image.dpi else {}),
+                                )
+                            if image.needs_postprocessing:
+                                postprocess_image(
+                                    static_plot_path,
+                                    static_image_path,
+                                    **image.postprocess_kwargs(),
+                                )
+                    plot_content.append(self._generate_image_content(static_image_path))
                 else:
                     plot_content.append(self._generate_plot_code(plot, html_plot_file))
             else:
@@ -667,7 +1423,8 @@ class QuartoReportView(r.ReportView):
         plot : Plot
             The plot component to generate the code template for.
         output_file: str, optional
-            The output html file name to be displayed with a pyvis plot.
+            The output html file name to be displayed with a pyvis plot, or the
+            compact Plotly JSON file written to the static folder.
         Returns
         -------
         str
@@ -679,6 +1436,19 @@ class QuartoReportView(r.ReportView):
             #| label: '{plot.title} {plot.id}'
             #| fig-cap: ""
             """)
+        if plot.plot_type == r.PlotType.PLOTLY and output_file:
+            # The compact figure only contains 'data' and 'layout' sections
+            plot_rel_path = get_relative_file_path(
+                output_file, relative_to=self.output_dir
+            ).as_posix()
+            plot_code += textwrap.dedent(f"""
+                fig_plotly = pio.read_json(report_dir / '{plot_rel_path}')
+                fig_plotly.update_layout(autosize=False, width=950, height=400,
+                                         margin=dict(b=50, t=50, l=50, r=50)
+                                         )
+                """)
+            return plot_code
+
         # If the file path is a URL, generate code to fetch content via requests
         if is_url(plot.file_path):
             plot_code += textwrap.dedent(f"""
@@ -759,14 +1529,20 @@ with open(report_dir /'{plot_rel_path}', 'r') as plot_file:
         # Add title
         dataframe_content.append(f"### {dataframe.title}")
 
+        if self._use_prerender(dataframe):
+            dataframe_content.extend(self._generate_prerendered_dataframe(dataframe))
+            if dataframe.caption:
+                dataframe_content.append(f">{dataframe.caption}\n")
+            return dataframe_content
+
         # Append header for DataFrame loading
         dataframe_content.append(textwrap.dedent(f"""\
                 ```{{python}}
                 #| label: '{dataframe.title} {dataframe.id}'
                 #| fig-cap: ""
                 """))
-        # Mapping of file extensions to read functions
-        read_function_mapping = table_utils.read_function_mapping
+        # Mapping of file extensions to the names of the read functions
+        read_function_names = table_utils.read_function_names
         try:
             # Check if the file extension matches any DataFrameFormat value
             file_extension = Path(dataframe.file_path).suffix.lower()
@@ -810,13 +1586,77 @@ with open(report_dir /'{plot_rel_path}', 'r') as plot_file:
                 df_file_path = get_relative_file_path(
                     dataframe.file_path, relative_to=self.output_dir
                 ).as_posix()
+            # Rows embedded in interactive reports, by sheet: (row count, cap)
+            table_caps = {}
+            if not self.is_report_static:
+                table_caps = {
+                    sheet_name: self._get_table_cap(dataframe, sheet_name)
+                    for sheet_name in sheet_names or [None]
+                }
+            is_truncated = any(table_caps.values())
+            first_sheet = sheet_names[0] if sheet_names else None
             # Load the DataFrame using the correct function
-            read_function = read_function_mapping[file_extension]
-            dataframe_content.append(
-                f"""df = pd.{read_function.__name__}(report_dir / '{df_file_path}')\n"""
-            )
+            read_function = read_function_names[file_extension]
+            # Number of rows and columns of the tables shown as snapshots, by sheet
+            table_shapes = {}
+            if self.is_report_static:
+                table_shapes = self._get_table_shapes(dataframe, sheet_names)
+                # Read only the rows and columns shown in the table snapshots, all
+                # the sheets of a workbook in one pass
+                dataframe_content.append(
+                    self._generate_table_preview_code(
+                        dataframe, df_file_path, sheet_name=sheet_names or None
+                    )
+                )
+            elif is_truncated and sheet_names:
+                # Parse the workbook once, reading only the rows embedded in the
+                # report, and keep the embedded rows of each sheet
+                dataframe_content.append(
+                    self._generate_table_preview_code(
+                        dataframe,
+                        df_file_path,
+                        sheet_name=sheet_names,
+                        max_rows=self._get_workbook_rows(dataframe, table_caps),
+                        max_cols=None,
+                    )
+                    + self._generate_sheet_cap_code(table_caps[first_sheet])
+                )
+            elif is_truncated:
+                # Read only the rows embedded in the report
+                dataframe_content.append(
+                    self._generate_table_preview_code(
+                        dataframe,
+                        df_file_path,
+                        sheet_name=first_sheet,
+                        max_rows=(table_caps[first_sheet] or (None, None))[1],
+                        max_cols=None,
+                    )
+                )
+            elif sheet_names:
+                # Parse the workbook once, the chunks of the sheets share the dict
+                dataframe_content.append(
+                    f"df_sheets = pd.{read_function}"
+                    f"(report_dir / '{df_file_path}', sheet_name=None)\n"
+                    f"df = df_sheets[{sheet_names[0]!r}]\n"
+                )
+            else:
+                dataframe_content.append(
+                    f"df = pd.{read_function}" f"(report_dir / '{df_file_path}')\n"
+                )
             # Display the dataframe
-            dataframe_content.extend(self._show_dataframe(dataframe))
+            dataframe_content.extend(
+                self._show_dataframe(
+                    dataframe, truncated=table_caps.get(first_sheet) is not None
+                )
+            )
+            dataframe_content.extend(
+                self._generate_table_shape_note(table_shapes.get(first_sheet))
+            )
+            dataframe_content.extend(
+                self._generate_table_cap_note(
+                    dataframe, first_sheet, table_caps.get(first_sheet)
+                )
+            )
 
             # Add further sheets
             if sheet_names:
@@ -827,14 +1667,33 @@ with open(report_dir /'{plot_rel_path}', 'r') as plot_file:
                     #| label: '{dataframe.title} {dataframe.id} {sheet_name}'
                     #| fig-cap: ""
                     """))
-                    dataframe_content.append(
-                        f"df = pd.{read_function.__name__}"
-                        f"(report_dir / '{df_file_path}', "
-                        f"sheet_name='{sheet_name}')\n"
-                    )
+                    if self.is_report_static:
+                        dataframe_content.append(
+                            f"df = df_sheets[{sheet_name!r}]"
+                            f".iloc[:, :{table_utils.PREVIEW_MAX_COLS}]\n"
+                        )
+                    elif is_truncated:
+                        dataframe_content.append(
+                            f"df = df_sheets[{sheet_name!r}]\n"
+                            + self._generate_sheet_cap_code(table_caps[sheet_name])
+                        )
+                    else:
+                        dataframe_content.append(f"df = df_sheets[{sheet_name!r}]\n")
                     # Display the dataframe
                     dataframe_content.extend(
-                        self._show_dataframe(dataframe, suffix=sheet_name)
+                        self._show_dataframe(
+                            dataframe,
+                            suffix=sheet_name,
+                            truncated=table_caps.get(sheet_name) is not None,
+                        )
+                    )
+                    dataframe_content.extend(
+                        self._generate_table_shape_note(table_shapes.get(sheet_name))
+                    )
+                    dataframe_content.extend(
+                        self._generate_table_cap_note(
+                            dataframe, sheet_name, table_caps.get(sheet_name)
+                        )
                     )
 
         except Exception as e:
@@ -916,7 +1775,428 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
         )
         return markdown_content
 
-    def _show_dataframe(self, dataframe, suffix: Optional[str] = None) -> List[str]:
+    def _use_prerender(self, component: r.Component) -> bool:
+        """Check if the image of a component is rendered before running Quarto."""
+        return (
+            self.is_report_static
+            and self.prerender_static
+            and component.file_path is not None
+            and not is_url(component.file_path)
+        )
+
+    def _add_prerender_task(
+        self,
+        kind: str,
+        source: str,
+        output: Path,
+        image: Optional[ImageSettings] = None,
+        **options,
+    ) -> None:
+        """Register an image to render before running Quarto."""
+        self._prerender_tasks.append(
+            PrerenderTask(
+                kind=kind,
+                source=Path(source).resolve().as_posix(),
+                output=Path(output).resolve().as_posix(),
+                options=options,
+                image=asdict(image or ImageSettings()),
+            )
+        )
+
+    def _static_settings(self, component: r.Component) -> dict:
+        """Settings of the view which change the static files of a component."""
+        return {
+            **super()._static_settings(component),
+            "image": asdict(self._get_image_settings(component)),
+            "dedup_assets": self.dedup_assets,
+        }
+
+    def _get_image_settings(self, component: r.Component) -> ImageSettings:
+        """Image settings of the report, overridden by those of the component."""
+        return self.image_settings.merge(getattr(component, "image_settings", None))
+
+    def _generate_postprocess_code(self, fpath: str, image: ImageSettings) -> str:
+        """Code to downscale or convert an image rendered in a chunk, if needed."""
+        if not image.needs_postprocessing:
+            return ""
+        output = Path(fpath).with_suffix(image.suffix).as_posix()
+        kwargs = "".join(
+            f", {key}={value!r}" for key, value in image.postprocess_kwargs().items()
+        )
+        return f"""{POSTPROCESS_IMAGE_FUNCTION}("{fpath}", "{output}"{kwargs})\n"""
+
+    def _generate_prerendered_dataframe(self, dataframe) -> List[str]:
+        """
+        Register the images of a DataFrame (one per sheet of an Excel file) to render
+        before running Quarto, and reference them in the report.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            The DataFrame component to render.
+
+        Returns
+        -------
+        list : List[str]
+            The list of content lines for the DataFrame.
+        """
+        dataframe_content = []
+        file_extension = Path(dataframe.file_path).suffix.lower()
+        sheet_names = [None]
+        if file_extension in [
+            r.DataFrameFormat.XLS.value_with_dot,
+            r.DataFrameFormat.XLSX.value_with_dot,
+        ]:
+            sheet_names = table_utils.get_sheet_names(dataframe.file_path)
+
+        table_shapes = self._get_table_shapes(
+            dataframe, None if sheet_names == [None] else sheet_names
+        )
+        for idx, sheet_name in enumerate(sheet_names):
+            fpath_df_image = Path(self.static_dir) / self._static_name(dataframe)
+            options = {}
+            if sheet_name is not None:
+                options["sheet_name"] = sheet_name
+            if idx > 0:
+                # same names as for the images exported in the Quarto chunks
+                dataframe_content.append(f"#### {sheet_name}")
+                fpath_df_image = fpath_df_image.with_stem(
+                    fpath_df_image.stem + f"_{sheet_name.replace(' ', '_')}"
+                )
+            image = self._get_image_settings(dataframe)
+            fpath_df_image = fpath_df_image.with_suffix(image.suffix)
+            self._add_prerender_task(
+                "dataframe", dataframe.file_path, fpath_df_image, image=image, **options
+            )
+            dataframe_content.append(self._generate_image_content(fpath_df_image))
+            dataframe_content.extend(
+                self._generate_table_shape_note(table_shapes.get(sheet_name))
+            )
+        return dataframe_content
+
+    def _generate_table_preview_code(
+        self,
+        dataframe,
+        df_file_path: str,
+        sheet_name: Optional[str] = None,
+        max_rows: Optional[int] = table_utils.PREVIEW_MAX_ROWS,
+        max_cols: Optional[int] = table_utils.PREVIEW_MAX_COLS,
+    ) -> str:
+        """
+        Generate the code reading only the first rows and columns of a DataFrame,
+        e.g. those shown in the table snapshot of a static report: `nrows` and
+        `usecols` for CSV and TXT files, the selected columns of the first row
+        groups for Parquet files and `nrows` for Excel sheets.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            The DataFrame component to read.
+        df_file_path : str
+            The URL or the path of the file relative to the output folder.
+        sheet_name : str | list[str], optional
+            The sheet of an Excel file (default is None, the first sheet). For a
+            list of sheets, the workbook is parsed once into `df_sheets`, a dict of
+            the sheets, and `df` is the first one.
+        max_rows : int, optional
+            The number of rows to read (default is PREVIEW_MAX_ROWS). None reads all
+            rows.
+        max_cols : int, optional
+            The number of columns to read (default is PREVIEW_MAX_COLS). None reads
+            all columns.
+
+        Returns
+        -------
+        str
+            The code assigning the table preview to `df`.
+        """
+        file_extension = Path(dataframe.file_path).suffix.lower()
+        read_function = table_utils.read_function_names[file_extension]
+        if is_url(dataframe.file_path):
+            path_code = repr(df_file_path)
+        else:
+            path_code = f"report_dir / '{df_file_path}'"
+        rows_arg = "" if max_rows is None else f", nrows={max_rows}"
+        cols_slice = "" if max_cols is None else f".iloc[:, :{max_cols}]"
+
+        if file_extension in [
+            r.DataFrameFormat.XLS.value_with_dot,
+            r.DataFrameFormat.XLSX.value_with_dot,
+        ]:
+            sheet_arg = f", sheet_name={sheet_name!r}" if sheet_name else ""
+            if isinstance(sheet_name, list):
+                return (
+                    f"df_sheets = pd.{read_function}({path_code}{sheet_arg}"
+                    f"{rows_arg})\ndf = df_sheets[{sheet_name[0]!r}]{cols_slice}\n"
+                )
+            return (
+                f"df = pd.{read_function}({path_code}{sheet_arg}"
+                f"{rows_arg}){cols_slice}\n"
+            )
+        if is_url(dataframe.file_path):
+            # The columns of remote files are not known when generating the report
+            if file_extension == r.DataFrameFormat.PARQUET.value_with_dot:
+                rows_slice = "" if max_rows is None else max_rows
+                cols_slice = "" if max_cols is None else max_cols
+                return (
+                    f"df = pd.{read_function}({path_code})"
+                    f".iloc[:{rows_slice}, :{cols_slice}]\n"
+                )
+            return f"df = pd.{read_function}({path_code}" f"{rows_arg}){cols_slice}\n"
+        if file_extension == r.DataFrameFormat.PARQUET.value_with_dot:
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(dataframe.file_path)
+            columns_arg = ""
+            if max_cols is not None:
+                columns = parquet_file.schema_arrow.names[:max_cols]
+                columns_arg = f", columns={columns!r}"
+            if max_rows is None or parquet_file.metadata.num_rows == 0:
+                return f"df = pd.read_parquet({path_code}{columns_arg})\n"
+            # whole row groups are read, batches may end before max_rows rows
+            row_groups = table_utils.get_first_row_groups(
+                parquet_file.metadata, max_rows
+            )
+            return (
+                f"df = pq.ParquetFile({path_code}).read_row_groups({row_groups}"
+                f"{columns_arg}).slice(0, {max_rows}).to_pandas()\n"
+            )
+        usecols_arg = ""
+        if max_cols is not None:
+            n_cols = len(
+                table_utils.read_function_mapping[file_extension](
+                    dataframe.file_path, nrows=0
+                ).columns
+            )
+            usecols_arg = f", usecols=range({min(n_cols, max_cols)})"
+        return f"df = pd.{read_function}({path_code}{rows_arg}" f"{usecols_arg})\n"
+
+    def _get_workbook_rows(
+        self, dataframe, table_caps: dict[str, Optional[tuple[int, int]]]
+    ) -> Optional[int]:
+        """
+        Get the number of rows to read from each sheet of a truncated workbook: the
+        embedded rows of the truncated sheets and all rows of the others.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            The DataFrame component of the workbook.
+        table_caps : dict[str, tuple[int, int] | None]
+            The number of rows and of embedded rows of each sheet, None if the sheet
+            is not truncated, as returned by `_get_table_cap`.
+
+        Returns
+        -------
+        int | None
+            The number of rows, None if all rows have to be read.
+        """
+        n_rows = [cap[1] for cap in table_caps.values() if cap is not None]
+        if any(cap is None for cap in table_caps.values()):
+            shapes = table_utils.get_sheet_shapes(dataframe.file_path)
+            n_rows += [
+                shapes[sheet_name][0]
+                for sheet_name, cap in table_caps.items()
+                if cap is None
+            ]
+        if any(rows is None for rows in n_rows):
+            return None
+        return max(n_rows)
+
+    @staticmethod
+    def _generate_sheet_cap_code(table_cap: Optional[tuple[int, int]]) -> str:
+        """Code keeping the embedded rows of a truncated sheet in `df`, if any."""
+        if table_cap is None:
+            return ""
+        return f"df = df.iloc[:{table_cap[1]}]\n"
+
+    def _get_table_limits(self, dataframe) -> tuple[Optional[int], Optional[int]]:
+        """Get the row and byte limits of a DataFrame, the component settings taking
+        precedence over those of the report view. 0 or None disables a limit."""
+        max_rows = (
+            dataframe.max_rows
+            if dataframe.max_rows is not None
+            else self.table_max_rows
+        )
+        max_bytes = (
+            dataframe.max_bytes
+            if dataframe.max_bytes is not None
+            else self.table_max_bytes
+        )
+        return max_rows or None, max_bytes or None
+
+    def _get_table_cap(
+        self, dataframe, sheet_name: Optional[str] = None
+    ) -> Optional[tuple[int, int]]:
+        """
+        Get the number of rows of a local table embedded in an interactive report,
+        if the table exceeds the row or byte limit. The row count is read from the
+        file metadata and the bytes per row are estimated from the first rows.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            The DataFrame component shown in the report.
+        sheet_name : str, optional
+            The sheet of an Excel file (default is None, the first sheet).
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The number of rows of the table and the number of rows to embed, or None
+            if the whole table is embedded.
+        """
+        max_rows, max_bytes = self._get_table_limits(dataframe)
+        if is_url(dataframe.file_path) or (max_rows is None and max_bytes is None):
+            return None
+        sheet = 0 if sheet_name is None else sheet_name
+        n_rows, _ = table_utils.get_table_shape(dataframe.file_path, sheet_name=sheet)
+        if n_rows is None:
+            return None
+        cap = n_rows
+        if max_rows is not None:
+            cap = min(cap, max_rows)
+        if max_bytes is not None and cap > 0:
+            row_bytes = table_utils.estimate_row_bytes(
+                dataframe.file_path, sheet_name=sheet
+            )
+            if row_bytes > 0:
+                cap = min(cap, max(1, int(max_bytes // row_bytes)))
+        if cap >= n_rows:
+            return None
+        self.report.logger.info(
+            "Embedding %d of %d rows of table '%s' in the report.",
+            cap,
+            n_rows,
+            dataframe.title,
+        )
+        return n_rows, cap
+
+    def _generate_table_cap_note(
+        self,
+        dataframe,
+        sheet_name: Optional[str],
+        table_cap: Optional[tuple[int, int]],
+    ) -> List[str]:
+        """
+        Write the full table of a truncated DataFrame as a compressed file in the
+        static folder and generate a note with the limits and a link to the file.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            The DataFrame component shown in the report.
+        sheet_name : str, optional
+            The sheet of an Excel file, None for the first sheet.
+        table_cap : tuple[int, int], optional
+            The number of rows of the table and of the embedded rows, as returned by
+            `_get_table_cap`. None if the table is not truncated.
+
+        Returns
+        -------
+        list : List[str]
+            The note, or no lines if the table is not truncated.
+        """
+        if table_cap is None:
+            return []
+        n_rows, cap = table_cap
+        sidecar = table_utils.write_table_sidecar(
+            dataframe.file_path,
+            Path(self.static_dir) / TABLES_DIR,
+            sheet_name=sheet_name,
+        )
+        sidecar_rel = get_relative_file_path(
+            sidecar, relative_to=self.output_dir
+        ).as_posix()
+        max_rows, max_bytes = self._get_table_limits(dataframe)
+        limits = []
+        if max_rows is not None:
+            limits.append(f"{max_rows:,} rows")
+        if max_bytes is not None:
+            limits.append(f"{max_bytes:,} bytes")
+        return [
+            f"*Showing the first {cap:,} of {n_rows:,} rows (limit:"
+            f" {' or '.join(limits)}). Full table: [{sidecar.name}]({sidecar_rel})*\n"
+        ]
+
+    def _get_table_shapes(
+        self, dataframe, sheet_names: Optional[List[str]] = None
+    ) -> dict[Optional[str], tuple[Optional[int], Optional[int]]]:
+        """
+        Get the number of rows and columns of the tables of a DataFrame shown as
+        snapshots, by sheet name (None for a table without sheets). The shape is
+        read from the file metadata (Parquet, Excel), or by counting lines (CSV,
+        TXT). Unless table_row_count is set, the lines are only counted up to the
+        snapshot size, and the number of rows of larger tables is None.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            The DataFrame component shown in the report.
+        sheet_names : list[str], optional
+            The sheets of an Excel file with several sheets (default is None).
+
+        Returns
+        -------
+        dict
+            The shape of each table, empty for remote files.
+        """
+        if is_url(dataframe.file_path):
+            return {}
+        file_extension = Path(dataframe.file_path).suffix.lower()
+        if file_extension in [
+            r.DataFrameFormat.XLS.value_with_dot,
+            r.DataFrameFormat.XLSX.value_with_dot,
+        ]:
+            # The workbook is opened once for all its sheets
+            shapes = table_utils.get_sheet_shapes(dataframe.file_path)
+            if not sheet_names:
+                return {None: next(iter(shapes.values()), (None, None))}
+            return {name: shapes.get(name, (None, None)) for name in sheet_names}
+        max_rows = None if self.table_row_count else table_utils.PREVIEW_MAX_ROWS
+        return {
+            None: table_utils.get_table_shape(dataframe.file_path, max_rows=max_rows)
+        }
+
+    def _generate_table_shape_note(
+        self, shape: Optional[tuple[Optional[int], Optional[int]]]
+    ) -> List[str]:
+        """
+        Generate a note telling that the snapshot of a table in a static report
+        only shows part of it, with the number of rows and columns of the table.
+        With table_row_count, the note is added below all snapshots.
+
+        Parameters
+        ----------
+        shape : tuple[Optional[int], Optional[int]], optional
+            The number of rows and columns of the table, from _get_table_shapes.
+            None for a remote file, whose shape is not known.
+
+        Returns
+        -------
+        list : List[str]
+            The note, or no lines if the whole table is shown.
+        """
+        if not self.is_report_static:
+            return []
+        max_rows = table_utils.PREVIEW_MAX_ROWS
+        max_cols = table_utils.PREVIEW_MAX_COLS
+        if shape is None or shape[1] is None:
+            return [f"*Showing at most {max_rows} rows and {max_cols} columns.*\n"]
+        n_rows, n_cols = shape
+        is_truncated = n_rows is None or n_rows > max_rows or n_cols > max_cols
+        if not is_truncated and not self.table_row_count:
+            return []
+        if n_rows is None:
+            rows = f"the first {max_rows} rows"
+        else:
+            rows = f"{min(n_rows, max_rows)} of {n_rows:,} rows"
+        cols = f"{min(n_cols, max_cols)} of {n_cols:,} columns"
+        return [f"*Showing {rows} and {cols}.*\n"]
+
+    def _show_dataframe(
+        self, dataframe, suffix: Optional[str] = None, truncated: bool = False
+    ) -> List[str]:
         """
         Appends either a static image or an interactive representation of a DataFrame
         to the content list.
@@ -928,6 +2208,9 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
         suffix : str, optional
             A suffix to append to the DataFrame image file name like a sheet name
             or another identifier (default is None).
+        truncated : bool, optional
+            Whether the rows of the table were limited to the caps of the report
+            (default is False). Only then the downsampling of itables is disabled.
 
         Returns
         -------
@@ -937,7 +2220,7 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
         dataframe_content = []
         if self.is_report_static:
             # Generate path for the DataFrame image
-            fpath_df_image = Path(self.static_dir) / dataframe.title.replace(" ", "_")
+            fpath_df_image = Path(self.static_dir) / self._static_name(dataframe)
             if suffix:
                 fpath_df_image = fpath_df_image.with_stem(
                     fpath_df_image.stem + f"_{suffix.replace(' ', '_')}"
@@ -946,17 +2229,30 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
             fpath_df_image_rel_static = get_relative_file_path(
                 fpath_df_image, relative_to=self.output_dir
             )
+            image = self._get_image_settings(dataframe)
+            dpi = f", dpi={image.dpi}" if image.dpi else ""
             dataframe_content.append(
                 f"df.dfi.export('{fpath_df_image_rel_static}',"
-                " max_rows=10, max_cols=5, table_conversion='matplotlib')\n```\n"
+                f" max_rows={table_utils.PREVIEW_MAX_ROWS},"
+                f" max_cols={table_utils.PREVIEW_MAX_COLS},"
+                f" table_conversion='matplotlib'{dpi})\n"
+                + self._generate_postprocess_code(
+                    fpath_df_image_rel_static.as_posix(), image
+                )
+                + "```\n"
             )
             # Use helper method to add centered image content
-            dataframe_content.append(self._generate_image_content(fpath_df_image))
+            dataframe_content.append(
+                self._generate_image_content(fpath_df_image.with_suffix(image.suffix))
+            )
         else:
-            # Append code to display the DataFrame interactively
+            # Append code to display the DataFrame interactively. The rows of
+            # truncated tables are already limited, so itables does not downsample
+            # them again. Other tables keep the default limit of itables.
+            max_bytes_arg = ", maxBytes=0" if truncated else ""
             dataframe_content.append(
                 'show(df, classes="display nowrap compact", '
-                "lengthMenu=[3, 5, 10])\n```\n"
+                f"lengthMenu=[3, 5, 10]{max_bytes_arg})\n```\n"
             )
 
         return dataframe_content
@@ -985,6 +2281,15 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
             # Embed the HTML in an iframe
             if is_url(html.file_path):
                 html_file_path = html.file_path
+            elif self._asset_store is not None:
+                html_file_path = get_relative_file_path(
+                    self._asset_store.localize_html(
+                        html.file_path,
+                        Path(self.static_dir).absolute()
+                        / f"{self._static_name(html)}.html",
+                    ),
+                    relative_to=self.output_dir,
+                )
             else:
                 html_file_path = get_relative_file_path(
                     html.file_path, relative_to=self.output_dir
@@ -1091,6 +2396,24 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
         component_type = component.component_type
         component_imports = []
 
+        # Pre-rendered images are only referenced in the report
+        if component_type in [
+            r.ComponentType.PLOT,
+            r.ComponentType.DATAFRAME,
+        ] and self._use_prerender(component):
+            return component_imports
+
+        # Images rendered in the chunks are downscaled or converted by a function
+        # defined in the report
+        if (
+            self.is_report_static
+            and component_type in [r.ComponentType.PLOT, r.ComponentType.DATAFRAME]
+            and getattr(component, "plot_type", None)
+            in [None, r.PlotType.PLOTLY, r.PlotType.ALTAIR]
+            and self._get_image_settings(component).needs_postprocessing
+        ):
+            component_imports.append(POSTPROCESS_IMAGE_CODE)
+
         # Add relevant imports based on component type and visualization tool
         if component_type == r.ComponentType.PLOT:
             plot_type = getattr(component, "plot_type", None)
@@ -1101,6 +2424,13 @@ with open(report_dir / '{md_rel_path.as_posix()}', 'r') as markdown_file:
                 component_imports.extend(components_imports["static_dataframe"])
             else:
                 component_imports.extend(components_imports["interactive_dataframe"])
+            # Local Parquet files are read by row groups with pyarrow
+            file_extension = Path(component.file_path).suffix.lower()
+            if (
+                file_extension == r.DataFrameFormat.PARQUET.value_with_dot
+                and not is_url(component.file_path)
+            ):
+                component_imports.append("import pyarrow.parquet as pq")
         elif component_type == r.ComponentType.MARKDOWN:
             component_imports.extend(components_imports["markdown"])
 
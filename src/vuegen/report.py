@@ -1,27 +1,59 @@
 """Contains all comonent classes and Report related base classes for VueGen."""
 
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
 import logging
 import os
+import pickle
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import auto
+from pathlib import Path
 
 try:
     from enum import StrEnum
 except ImportError:
     from strenum import StrEnum
 
-from typing import ClassVar, List, Optional
-
-import matplotlib.pyplot as plt
-import networkx as nx
-import pandas as pd
-import requests
-from pyvis.network import Network
-
-from vuegen.constants import TIMEOUT
-
-from .utils import cyjs_to_networkx, fetch_file_stream, pyvishtml_to_networkx
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from vuegen.constants import API_MAX_WORKERS, TIMEOUT
+
+from .utils import cyjs_to_networkx, fetch_file_stream, is_url, pyvishtml_to_networkx
+from .utils.figures import write_compact_plotly_json
+from .utils.profiling import profile_component
+from .utils.remote import (
+    API_CACHE_DIR,
+    RemoteAssetCache,
+    ResponseCache,
+    get_cache_dir,
+    get_session,
+)
+from .utils.static_store import StaticStore
+
+# Heavy libraries are imported where they are used, so that importing VueGen, e.g.
+# to show the help of the command line, stays fast
+if TYPE_CHECKING:
+    import networkx as nx
+    import requests
+    from pyvis.network import Network
 
 
 class ReportType(StrEnum):
@@ -116,6 +148,36 @@ class ImageFormat(StrEnum):
         return f".{self.name.lower()}"
 
 
+class SubsectionLayout(StrEnum):
+    """Enum representing how the components of a subsection are laid out."""
+
+    DEFAULT = auto()
+    TABS = auto()
+    EXPANDERS = auto()
+
+
+def _add_slots(cls: type) -> type:
+    """
+    Recreate a dataclass with __slots__ instead of an instance __dict__, like
+    dataclass(slots=True), which needs Python 3.10. The defaults of the fields are
+    kept by the generated __init__, so they can be removed from the class.
+    """
+    names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    cls_dict["__slots__"] = tuple(name for name in names if name not in inherited)
+    for name in names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_add_slots
 @dataclass
 class Component:
     """
@@ -171,8 +233,13 @@ class Plot(Component):
     csv_network_format : CSVNetworkFormat, optional
         The format of the CSV file for network plots (EDGELIST or ADJLIST)
         (default is None).
+    image_settings : dict, optional
+        The resolution, size and format of the image of the plot in static reports,
+        overriding the settings of the report (default is None).
     """
 
+    __slots__ = ("plot_type", "csv_network_format", "image_settings")
+
     def __init__(
         self,
         title: str,
@@ -181,6 +248,7 @@ class Plot(Component):
         file_path: str = None,
         caption: str = None,
         csv_network_format: Optional[CSVNetworkFormat] = None,
+        image_settings: Optional[dict] = None,
     ):
         """
         Initializes a Plot object.
@@ -197,6 +265,7 @@ class Plot(Component):
         # Set specific attributes for the Plot class
         self.plot_type = plot_type
         self.csv_network_format = csv_network_format
+        self.image_settings = image_settings
 
     def read_network(self) -> nx.Graph:
         """
@@ -216,6 +285,9 @@ class Plot(Component):
         RuntimeError
             If there is an error while reading the network file.
         """
+        import networkx as nx
+        import pandas as pd
+
         # Mapping of file extensions to NetworkX and custom loading functions
         file_extension_map = {
             NetworkFormat.GML.value_with_dot: nx.read_gml,
@@ -345,6 +417,9 @@ class Plot(Component):
         dpi : int, optional
             The resolution of the image in dots per inch (default is 300).
         """
+        import networkx as nx
+        from matplotlib.figure import Figure
+
         self.logger.debug("Try to save network as PyVis network: %s.", output_file)
         # Check if the output file path is valid
         if not os.path.isdir(os.path.dirname(output_file)):
@@ -371,10 +446,11 @@ class Plot(Component):
             )
 
         try:
-            # Draw the graph and save it as an image file
-            nx.draw(G, with_labels=False)
-            plt.savefig(output_file, format=format, dpi=dpi)
-            plt.clf()
+            # Draw the graph on its own figure, as the current figure of pyplot is
+            # shared by the threads generating components
+            fig = Figure()
+            nx.draw(G, ax=fig.add_axes((0, 0, 1, 1)), with_labels=False)
+            fig.savefig(output_file, format=format, dpi=dpi)
             self.logger.info("Network image saved successfully at: %s.", output_file)
         except Exception as e:
             self.logger.error("Failed to save the network image: %s.", e, exc_info=True)
@@ -397,6 +473,9 @@ class Plot(Component):
         net : pyvis.network.Network
             A PyVis network object.
         """
+        import networkx as nx
+        from pyvis.network import Network
+
         self.logger.debug("Try to save network as PyVis network: %s.", output_file)
         # Check if the network object and output file path are valid
         if not isinstance(G, nx.Graph):
@@ -453,6 +532,37 @@ class Plot(Component):
             )
             raise RuntimeError("Failed to create and save the PyVis network.") from e
 
+    def save_compact_plotly_json(self, output_file: str) -> None:
+        """
+        Saves the Plotly figure of the plot as a compact JSON file, keeping only the
+        sections needed for rendering. Numeric arrays are stored using Plotly's typed
+        array encoding if the installed Plotly version supports it.
+
+        Parameters
+        ----------
+        output_file : str
+            The file path where the compact JSON should be saved.
+        """
+        self.logger.debug("Try to save compact Plotly JSON: %s.", output_file)
+        if not os.path.isdir(os.path.dirname(output_file)):
+            self.logger.error(
+                "Directory for saving Plotly JSON does not exist: %s.",
+                os.path.dirname(output_file),
+            )
+            raise FileNotFoundError(
+                "The directory for saving the file does not exist: "
+                f"{os.path.dirname(output_file)}."
+            )
+        try:
+            plot_json = json.load(fetch_file_stream(self.file_path))
+            write_compact_plotly_json(plot_json, output_file)
+            self.logger.info("Compact Plotly JSON saved as: %s.", output_file)
+        except Exception as e:
+            self.logger.error(
+                "Failed to save compact Plotly JSON: %s.", e, exc_info=True
+            )
+            raise RuntimeError("Failed to save the compact Plotly JSON.") from e
+
     def _add_size_attribute(self, G: nx.Graph) -> nx.Graph:
         """
         Adds a 'size' attribute to the nodes of a NetworkX graph
@@ -513,8 +623,19 @@ class DataFrame(Component):
     delimiter : Optional[str]
         The delimiter to use if the file is a delimited text format
         (e.g., ';', '\t', etc).
+    max_rows : Optional[int]
+        The maximum number of rows embedded in interactive HTML reports, overriding
+        the limit of the report view (default is None).
+    max_bytes : Optional[int]
+        The maximum size in bytes of the data embedded in interactive HTML reports,
+        overriding the limit of the report view (default is None).
+    image_settings : Optional[dict]
+        The resolution, size and format of the table snapshot in static reports,
+        overriding the settings of the report (default is None).
     """
 
+    __slots__ = ("file_format", "delimiter", "max_rows", "max_bytes", "image_settings")
+
     def __init__(
         self,
         title: str,
@@ -523,6 +644,9 @@ class DataFrame(Component):
         file_path: str = None,
         caption: str = None,
         delimiter: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        image_settings: Optional[dict] = None,
     ):
         """
         Initializes a DataFrame object.
@@ -536,6 +660,9 @@ class DataFrame(Component):
         )
         self.file_format = file_format
         self.delimiter = delimiter
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.image_settings = image_settings
 
 
 class Markdown(Component):
@@ -543,6 +670,8 @@ class Markdown(Component):
     A Markdown text component within a subsection of a report.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         title: str,
@@ -567,6 +696,8 @@ class Html(Component):
     An html component within a subsection of a report.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         title: str,
@@ -603,8 +734,39 @@ class APICall(Component):
         Query parameters to include in the API request (default is None).
     request_body : Optional[dict]
         The request body for methods like POST or PUT (default is None).
+    timeout : float
+        Timeout of the request in seconds (default is TIMEOUT).
+    retries : int
+        Number of times a failed request is retried, for connection errors,
+        timeouts and the status codes in RETRY_STATUS_CODES (default is 0).
+    backoff_factor : float
+        Retry n waits backoff_factor * 2**(n-1) seconds (default is 0.5).
+    cache_ttl : Optional[float]
+        Time in seconds a response is reused from the on-disk cache, if a cache is
+        passed to make_api_request (default is None, no caching).
+    retry_methods : tuple[str, ...]
+        The HTTP methods whose requests may be retried and cached (default is
+        REPLAYABLE_METHODS). Requests with other methods, e.g. POST, may not be
+        idempotent and are sent once, uncached, unless their method is added here.
     """
 
+    __slots__ = (
+        "api_url",
+        "method",
+        "headers",
+        "params",
+        "request_body",
+        "timeout",
+        "retries",
+        "backoff_factor",
+        "cache_ttl",
+        "retry_methods",
+    )
+
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    # Methods whose requests can be sent again without side effects
+    REPLAYABLE_METHODS = ("GET", "HEAD")
+
     def __init__(
         self,
         title: str,
@@ -615,6 +777,11 @@ class APICall(Component):
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
         request_body: Optional[dict] = None,
+        timeout: float = TIMEOUT,
+        retries: int = 0,
+        backoff_factor: float = 0.5,
+        cache_ttl: Optional[float] = None,
+        retry_methods: Optional[Iterable[str]] = None,
     ):
         super().__init__(
             title=title,
@@ -629,9 +796,22 @@ class APICall(Component):
         # NOTE: request_body is usually dynamically set before the call for POST/PUT
         # but we'll include it here if needed for values from a config file
         self.request_body = request_body or {}
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.cache_ttl = cache_ttl
+        self.retry_methods = tuple(
+            method.upper()
+            for method in (
+                retry_methods if retry_methods is not None else self.REPLAYABLE_METHODS
+            )
+        )
 
     def make_api_request(
-        self, dynamic_request_body: Optional[dict] = None
+        self,
+        dynamic_request_body: Optional[dict] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
     ) -> Optional[dict]:
         """
         Sends an HTTP request to the specified API and returns the JSON response.
@@ -642,43 +822,99 @@ class APICall(Component):
         dynamic_request_body : Optional[dict]
             A dictionary to use as the JSON request body for this specific call.
             Overrides the instance's request_body if provided.
+        session : Optional[requests.Session]
+            The session used to send the request, so connections can be reused
+            (default is None, the shared session of vuegen.utils.remote).
+        cache : Optional[ResponseCache]
+            An on-disk cache of responses, used if cache_ttl is set and the method
+            is in retry_methods (default is None).
 
         Returns
         -------
         response : Optional[dict]
             The JSON response from the API, or None if the request fails.
         """
+        import requests
+
         request_body_to_send = (
             dynamic_request_body
             if dynamic_request_body is not None
             else self.request_body
         )
-        try:
-            self.logger.info("Making %s request to API: %s", self.method, self.api_url)
-            self.logger.debug("Headers: %s", self.headers)
-            self.logger.debug("Params: %s", self.params)
+        # Validate the request body based on the method
+        json_body = (
+            request_body_to_send
+            if self.method in ["POST", "PUT", "PATCH"] and request_body_to_send
+            else None
+        )
 
-            response = requests.request(
+        # Requests which may not be idempotent are neither replayed nor cached
+        replayable = self.method in self.retry_methods
+        if not replayable and (self.retries or self.cache_ttl):
+            self.logger.warning(
+                "Not retrying nor caching the %s request to %s, as %s is not in"
+                " retry_methods.",
                 self.method,
                 self.api_url,
-                headers=self.headers,
-                params=self.params,
-                # Validate the request body based on the method
-                json=(
-                    request_body_to_send
-                    if self.method in ["POST", "PUT", "PATCH"] and request_body_to_send
-                    else None
-                ),
-                timeout=TIMEOUT,
+                self.method,
             )
-            response.raise_for_status()
-            self.logger.info(
-                "Request successful with status code %d.", response.status_code
+        retries = self.retries if replayable else 0
+
+        cache_key = None
+        if cache is not None and self.cache_ttl and replayable:
+            cache_key = cache.make_key(
+                self.method, self.api_url, self.headers, self.params, json_body
             )
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            self.logger.error("API request failed: %s", e, exc_info=True)
-            return None
+            cached_response = cache.get(cache_key, ttl=self.cache_ttl)
+            if cached_response is not None:
+                self.logger.info("Using cached response for API: %s", self.api_url)
+                return cached_response
+
+        if session is None:
+            session = get_session()
+        for attempt in range(retries + 1):
+            try:
+                self.logger.info(
+                    "Making %s request to API: %s", self.method, self.api_url
+                )
+                self.logger.debug("Headers: %s", self.headers)
+                self.logger.debug("Params: %s", self.params)
+
+                response = session.request(
+                    self.method,
+                    self.api_url,
+                    headers=self.headers,
+                    params=self.params,
+                    json=json_body,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                self.logger.info(
+                    "Request successful with status code %d.", response.status_code
+                )
+                data = response.json()
+                break
+            except requests.exceptions.RequestException as e:
+                status_code = getattr(e.response, "status_code", None)
+                retryable = not isinstance(e, requests.exceptions.JSONDecodeError) and (
+                    status_code is None or status_code in self.RETRY_STATUS_CODES
+                )
+                if not retryable or attempt == retries:
+                    self.logger.error("API request failed: %s", e, exc_info=True)
+                    return None
+                delay = self.backoff_factor * 2**attempt
+                self.logger.warning(
+                    "API request failed (attempt %d of %d): %s. Retrying in %.1f s.",
+                    attempt + 1,
+                    retries + 1,
+                    e,
+                    delay,
+                )
+                time.sleep(delay)
+
+        if cache_key is not None:
+            cache.set(cache_key, data)
+        return data
 
 
 class ChatBot(Component):
@@ -698,8 +934,16 @@ class ChatBot(Component):
         Headers to include in the API request (default is None).
     params : Optional[dict]
         Query parameters to include in the API request (default is None).
+    history_size : int
+        The number of past messages sent as context to a streaming chatbot API
+        (default is 10).
+    max_message_chars : int
+        The maximum number of characters of each message sent as context
+        (default is 4000).
     """
 
+    __slots__ = ("model", "history_size", "max_message_chars", "api_call")
+
     def __init__(
         self,
         title: str,
@@ -709,6 +953,8 @@ class ChatBot(Component):
         model: Optional[str] = None,
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
+        history_size: int = 10,
+        max_message_chars: int = 4000,
     ):
         super().__init__(
             title=title,
@@ -717,6 +963,8 @@ class ChatBot(Component):
             caption=caption,
         )
         self.model = model
+        self.history_size = history_size
+        self.max_message_chars = max_message_chars
         self.api_call = APICall(
             title=title,
             logger=logger,
@@ -728,6 +976,7 @@ class ChatBot(Component):
         )
 
 
+@_add_slots
 @dataclass
 class Subsection:
     """
@@ -750,6 +999,9 @@ class Subsection:
     file_path : str, optional
         Relative file path to the section file in sections folder.
         Used for building reports (default is None).
+    layout : SubsectionLayout, optional
+        How the components are laid out. With tabs or expanders, each component is
+        only rendered once selected (default is SubsectionLayout.DEFAULT).
     """
 
     _id_counter: ClassVar[int] = 0
@@ -758,6 +1010,7 @@ class Subsection:
     components: List["Component"] = field(default_factory=list)
     description: Optional[str] = None
     file_path: Optional[str] = None
+    layout: SubsectionLayout = SubsectionLayout.DEFAULT
 
     def __post_init__(self):
         self.id = self._generate_id()
@@ -770,6 +1023,7 @@ class Subsection:
 
 # ? Section is a subclass of Subsection (adding subsections).
 # ? Distinction might not be necessary
+@_add_slots
 @dataclass
 class Section:
     """
@@ -812,6 +1066,54 @@ class Section:
         return cls._id_counter
 
 
+class SectionStream:
+    """
+    The sections of a streamed report, created from their configuration each time
+    they are iterated, so that a section is released once it was generated. Used
+    instead of the list of sections of a report for very large reports.
+
+    Parameters
+    ----------
+    section_configs : Iterable[dict]
+        The configurations of the sections, e.g. a LazyYamlList parsing them one
+        at a time from the configuration file.
+    create_section : Callable[[dict], Section]
+        The function creating a section from its configuration.
+
+    Attributes
+    ----------
+    counts : tuple[int, int, int], optional
+        The number of sections, subsections and components counted during the last
+        complete iteration, None before, so that they are known without creating
+        the sections again.
+    """
+
+    def __init__(
+        self,
+        section_configs: Iterable[dict],
+        create_section: Callable[[dict], Section],
+    ):
+        self.section_configs = section_configs
+        self.create_section = create_section
+        self.counts: Optional[Tuple[int, int, int]] = None
+
+    def __iter__(self) -> Iterator[Section]:
+        n_sections = n_subsections = n_components = 0
+        for section_config in self.section_configs:
+            section = self.create_section(section_config)
+            n_sections += 1
+            n_subsections += len(section.subsections)
+            n_components += len(section.components) + sum(
+                len(subsection.components) for subsection in section.subsections
+            )
+            yield section
+        self.counts = (n_sections, n_subsections, n_components)
+
+    def __len__(self) -> int:
+        return len(self.section_configs)
+
+
+@_add_slots
 @dataclass
 class Report:
     """
@@ -824,13 +1126,17 @@ class Report:
     logger : logging.Logger
         Logger object for tracking warnings, errors, and info messages.
     sections : List[Section]
-        A list of sections that belong to the report.
+        A list of sections that belong to the report, or a SectionStream for
+        streamed reports.
     description : str, optional
         Description of the report (default is None).
     graphical_abstract : str, optional
         Path to the graphical abstract image (default is None).
     logo : str, optional
         The file path to the logo image (default is None).
+    image_settings : dict, optional
+        The resolution, size and format of the images of static reports, e.g.
+        {"dpi": 150, "max_size": 1600, "format": "jpeg"} (default is None).
     """
 
     title: str
@@ -839,6 +1145,104 @@ class Report:
     description: Optional[str] = None
     graphical_abstract: Optional[str] = None
     logo: Optional[str] = None
+    image_settings: Optional[dict] = None
+
+    # Version of the files written by to_file, increased when the model changes
+    FILE_VERSION: ClassVar[int] = 1
+
+    def _iter_model(self) -> Iterator:
+        """
+        Iterate over the sections, subsections and components of the report,
+        including the APICall of each ChatBot.
+        """
+        for section in self.sections:
+            yield section
+            for component in section.components:
+                yield from _iter_component(component)
+            for subsection in section.subsections:
+                yield subsection
+                for component in subsection.components:
+                    yield from _iter_component(component)
+
+    def to_file(self, file_path: Union[str, Path]) -> Path:
+        """
+        Save the report to a binary file, so that it can be built again, e.g. in
+        another format or process, without creating it from its configuration.
+        The sections of a streamed report are all created and saved.
+
+        Parameters
+        ----------
+        file_path : str | Path
+            The file to write.
+
+        Returns
+        -------
+        Path
+            The written file.
+        """
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        report = {f.name: getattr(self, f.name) for f in fields(self)}
+        report["sections"] = list(self.sections)
+        with open(file_path, "wb") as f:
+            pickle.dump(
+                {"version": self.FILE_VERSION, "report": report},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        self.logger.info("Report saved to %s", file_path)
+        return file_path
+
+    @classmethod
+    def from_file(
+        cls, file_path: Union[str, Path], logger: Optional[logging.Logger] = None
+    ) -> "Report":
+        """
+        Load a report saved with to_file. The id counters of the component classes
+        are moved past the loaded ids, so that new objects get unique ids. Only load
+        files you trust, as they are unpickled.
+
+        Parameters
+        ----------
+        file_path : str | Path
+            The file written by to_file.
+        logger : logging.Logger, optional
+            The logger of the report and its components (default is None, the
+            loggers of the same names as when the report was saved).
+
+        Returns
+        -------
+        Report
+            The loaded report.
+
+        Raises
+        ------
+        ValueError
+            If the file was not written by to_file of this version of VueGen.
+        """
+        with open(file_path, "rb") as f:
+            data = pickle.load(f)
+        if not isinstance(data, dict) or data.get("version") != cls.FILE_VERSION:
+            msg = f"{file_path} is not a report file of version {cls.FILE_VERSION}."
+            (logger or logging.getLogger(__name__)).error(msg)
+            raise ValueError(msg)
+
+        report = cls(**data["report"])
+        if logger is not None:
+            report.logger = logger
+        for obj in report._iter_model():
+            if logger is not None and isinstance(obj, Component):
+                obj.logger = logger
+            obj_type = type(obj)
+            obj_type._id_counter = max(obj_type._id_counter, obj.id)
+        return report
+
+
+def _iter_component(component: Component) -> Iterator[Component]:
+    """Iterate over a component and the APICall of a ChatBot."""
+    yield component
+    if isinstance(component, ChatBot):
+        yield component.api_call
 
 
 class ReportView(ABC):
@@ -855,12 +1259,277 @@ class ReportView(ABC):
         The report that this ABC is associated with.
     report_type : ReportType
         The report type. It should be one of the values of the ReportType Enum.
+    jobs : int
+        The number of threads generating the content of the components
+        concurrently. With 1, components are generated one after the other while
+        the report files are written.
+    static_store : bool
+        Whether the static files of the components are named after the hash of
+        their content and settings, written once and reused by later builds,
+        instead of being named after the titles of the components.
 
     """
 
-    def __init__(self, report: "Report", report_type: "ReportType"):
+    # Component types which write files named after their title to the static folder
+    STATIC_FILE_COMPONENTS = (
+        ComponentType.PLOT,
+        ComponentType.DATAFRAME,
+        ComponentType.HTML,
+    )
+
+    def __init__(
+        self,
+        report: "Report",
+        report_type: "ReportType",
+        jobs: int = 1,
+        static_store: bool = False,
+    ):
         self.report = report
         self.report_type = report_type
+        self.jobs = max(1, jobs)
+        self.static_store = static_store
+        self.components_fct_map = {}
+        self._static_store: Optional[StaticStore] = None
+        self._static_names: Dict[int, str] = {}
+        self._used_static_names = set()
+        self._component_contents: Dict[int, Optional[List[str]]] = {}
+
+    def _prefetch_remote_files(
+        self, static_dir: str, sections: Optional[Iterable[Section]] = None
+    ) -> None:
+        """
+        Download the files of URL-backed components to the static folder and point
+        the components to the local copies, so the report does not fetch them again.
+
+        Local copies from a previous build are revalidated using the ETag and
+        Last-Modified headers stored in a manifest next to them.
+
+        Parameters
+        ----------
+        static_dir : str
+            The folder where the static files of the report are saved.
+        sections : Iterable[Section], optional
+            The sections whose files are downloaded (default is None, all sections
+            of the report).
+        """
+        cache = RemoteAssetCache(static_dir, self.report.logger)
+        for component in self._iter_components(sections):
+            if component.file_path and is_url(component.file_path):
+                local_path = cache.fetch(component.file_path)
+                component.file_path = local_path.resolve().as_posix()
+        cache.save_manifest()
+
+    def _run_api_calls(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_workers: int = API_MAX_WORKERS,
+        sections: Optional[Iterable[Section]] = None,
+    ) -> Dict[int, Optional[dict]]:
+        """
+        Run the requests of all APICall components of the report concurrently,
+        using a shared session and an on-disk response cache. The cache is kept
+        out of the report, which would otherwise publish the responses.
+
+        Parameters
+        ----------
+        cache_dir : str | Path, optional
+            The folder of the cached responses (default is None, API_CACHE_DIR in
+            the cache folder of the user, see get_cache_dir).
+        max_workers : int, optional
+            The maximum number of concurrent requests (default is API_MAX_WORKERS).
+        sections : Iterable[Section], optional
+            The sections whose API calls are run (default is None, all sections of
+            the report).
+
+        Returns
+        -------
+        dict
+            The JSON response (or None if the request failed) of each APICall,
+            by component id.
+        """
+        apicalls = [
+            component
+            for component in self._iter_components(sections)
+            if component.component_type == ComponentType.APICALL
+        ]
+        if not apicalls:
+            return {}
+        self.report.logger.info("Running %d API call(s).", len(apicalls))
+        session = get_session()
+        if cache_dir is None:
+            cache_dir = get_cache_dir() / API_CACHE_DIR
+        cache = ResponseCache(cache_dir)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(apicalls))) as pool:
+            futures = {
+                apicall.id: pool.submit(
+                    apicall.make_api_request, session=session, cache=cache
+                )
+                for apicall in apicalls
+            }
+        return {apicall_id: future.result() for apicall_id, future in futures.items()}
+
+    def _iter_components(
+        self, sections: Optional[Iterable[Section]] = None
+    ) -> Iterator[Component]:
+        """Iterate over the components of the sections and their subsections, by
+        default of all sections of the report."""
+        for section in self.report.sections if sections is None else sections:
+            yield from section.components
+            for subsection in section.subsections:
+                yield from subsection.components
+
+    def _iter_sections(self) -> Iterator[Section]:
+        """
+        Iterate over the sections of the report to generate them, preparing their
+        components with `_prepare_sections` first. The sections of a streamed report
+        are created, prepared and generated one at a time, so that only one section
+        is in memory.
+        """
+        self._used_static_names = set()
+        if isinstance(self.report.sections, SectionStream):
+            for section in self.report.sections:
+                self._prepare_sections([section])
+                yield section
+        else:
+            self._prepare_sections(self.report.sections)
+            yield from self.report.sections
+
+    def _prepare_sections(self, sections: List[Section]) -> None:
+        """
+        Prepare the components of sections before generating them: name their
+        static files and, with several jobs, generate their content concurrently.
+        Views extend it, e.g. to download remote files.
+
+        Parameters
+        ----------
+        sections : List[Section]
+            The sections to prepare.
+        """
+        self._assign_static_names(sections)
+        self._generate_components(sections)
+
+    def _assign_static_names(self, sections: List[Section]) -> None:
+        """
+        Name the static files of each component after its title. Components whose
+        title is already used get a number appended, in the order of the report, so
+        that no two components write the same file, whatever the order in which
+        they are generated. Names used by previous sections are kept.
+        """
+        self._static_names = {}
+        for component in self._iter_components(sections):
+            if component.component_type not in self.STATIC_FILE_COMPONENTS:
+                continue
+            stem = name = component.title.replace(" ", "_")
+            number = 1
+            while name in self._used_static_names:
+                number += 1
+                name = f"{stem}_{number}"
+            self._used_static_names.add(name)
+            self._static_names[id(component)] = name
+
+    def _static_name(self, component: Component) -> str:
+        """The name, without extension, of the static files of a component."""
+        if self._static_store is not None:
+            return self._static_store.asset_name(
+                component, self._static_settings(component)
+            )
+        return self._static_names.get(id(component), component.title.replace(" ", "_"))
+
+    def _static_settings(self, component: Component) -> dict:
+        """
+        The settings of the view which change the static files of a component,
+        hashed into their names by the static store.
+        """
+        return {"report_type": str(self.report_type)}
+
+    def _open_static_store(self, static_dir: str) -> None:
+        """Start the static store of a build in static_dir, if it is enabled."""
+        self._static_store = (
+            StaticStore(static_dir, self.report.logger) if self.static_store else None
+        )
+
+    def _writing_static_file(
+        self, component: Component, file_path: Path
+    ) -> ContextManager[bool]:
+        """
+        Claim a static file of a component before writing it. The context yields
+        whether to write it: with the static store, files already written in this
+        build or kept from a previous one are skipped.
+        """
+        if self._static_store is None:
+            return contextlib.nullcontext(True)
+        return self._static_store.writing(self._static_name(component), file_path)
+
+    def _generate_component(self, component: Component) -> Optional[List[str]]:
+        """
+        Generate the content of a component with its function in
+        components_fct_map.
+
+        Parameters
+        ----------
+        component : Component
+            The component to generate.
+
+        Returns
+        -------
+        list[str], optional
+            The content lines of the component, or None if it is skipped.
+        """
+        fct = self.components_fct_map.get(component.component_type, None)
+        if fct is None:
+            self.report.logger.warning(
+                "Unsupported component type '%s'", component.component_type
+            )
+            return None
+        with profile_component(component):
+            return fct(component)
+
+    def _generate_components(self, sections: List[Section]) -> None:
+        """
+        Generate the content of the components of sections concurrently with `jobs`
+        threads, keeping it until the report files are assembled in the order of
+        the report. Does nothing with a single job: the components are then
+        generated while assembling the files.
+        """
+        self._component_contents = {}
+        components = list(self._iter_components(sections))
+        if self.jobs == 1 or len(components) < 2:
+            return
+        self.report.logger.debug(
+            "Generating %d component(s) with %d thread(s).",
+            len(components),
+            min(self.jobs, len(components)),
+        )
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(components))) as pool:
+            # the threads run in a copy of the context, e.g. with the build profiler
+            futures = {
+                id(component): pool.submit(
+                    contextvars.copy_context().run, self._generate_component, component
+                )
+                for component in components
+            }
+            self._component_contents = {
+                key: future.result() for key, future in futures.items()
+            }
+
+    def _get_component_content(self, component: Component) -> Optional[List[str]]:
+        """
+        Get the content of a component, generated beforehand by
+        `_generate_components` or now.
+
+        Parameters
+        ----------
+        component : Component
+            The component to get the content of.
+
+        Returns
+        -------
+        list[str], optional
+            The content lines of the component, or None if it is skipped.
+        """
+        if id(component) in self._component_contents:
+            return self._component_contents.pop(id(component))
+        return self._generate_component(component)
 
     @abstractmethod
     def generate_report(self, output_dir: str = "sections") -> None:
@@ -935,7 +1604,7 @@ class WebAppReportView(ReportView):
         """
 
     @abstractmethod
-    def _generate_sections(self, output_dir: str) -> None:
+    def _generate_sections(self, output_dir: str, report_manag_content: list) -> None:
         """
         Creates sections and subsections for the report.
 
@@ -943,6 +1612,8 @@ class WebAppReportView(ReportView):
         ----------
         output_dir : str
             The folder where section files will be saved.
+        report_manag_content : list
+            A list to store the content of the app navigation.
 
         Notes
         -----
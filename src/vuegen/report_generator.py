@@ -1,15 +1,306 @@
 """Main API entry point for generating reports using VueGen."""
 
+import contextlib
 import logging
 import shutil
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
 from .config_manager import ConfigManager
+from .config_validation import check_config
+from .constants import TABLE_MAX_BYTES, TABLE_MAX_ROWS
 from .quarto_reportview import QuartoReportView
-from .report import ReportType
+from .report import Report, ReportType, SectionStream
 from .streamlit_reportview import StreamlitReportView
 from .utils import assert_enum_value, get_logger, load_yaml_config, write_yaml_config
+from .utils.lazy_yaml import load_yaml_config_lazily
+from .utils.profiling import BuildProfiler, profile_stage
+
+
+@dataclass
+class BuildResult:
+    """
+    The outcome of building a report with build_report.
+
+    Attributes
+    ----------
+    report_dir : Path
+        The folder of the generated report.
+    config_path : Path, optional
+        The configuration file of the report, if one was read or written.
+    report : Report
+        The report that was built.
+    n_sections : int
+        The number of sections of the report.
+    n_subsections : int
+        The number of subsections of the report.
+    n_components : int
+        The number of components of the report, in sections and subsections.
+    timings : dict[str, float]
+        The time in seconds of each stage: 'config' (loading the configuration and
+        creating the Report), 'generate' and 'run'.
+    profile : dict, optional
+        The summary of the nested build stages and components, if the build was
+        profiled.
+    """
+
+    report_dir: Path
+    config_path: Optional[Path]
+    report: Report
+    n_sections: int = 0
+    n_subsections: int = 0
+    n_components: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    profile: Optional[dict] = None
+
+    @property
+    def seconds(self) -> float:
+        """The total time of the build in seconds."""
+        return sum(self.timings.values())
+
+
+def build_report(
+    report_type: str,
+    report: Optional[Report] = None,
+    config: Optional[dict] = None,
+    config_path: Optional[Union[str, Path]] = None,
+    dir_path: Optional[Union[str, Path]] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    logger: Optional[logging.Logger] = None,
+    max_depth: int = 2,
+    write_config: bool = False,
+    run: bool = True,
+    profile: bool = False,
+    stream: bool = False,
+    validate: bool = True,
+    **view_options,
+) -> BuildResult:
+    """
+    Build a report from a Report object, a configuration dict, a configuration file
+    or a directory, without writing and re-reading the configuration in between.
+
+    Parameters
+    ----------
+    report_type : str
+        The report type. It should be one of the values of the ReportType Enum.
+    report : Report, optional
+        A report which is already built. Its logger is used if no logger is given.
+    config : dict, optional
+        The report configuration, as read from a YAML configuration file.
+    config_path : str | Path, optional
+        Path to the YAML configuration file.
+    dir_path : str | Path, optional
+        Path to the directory from which to generate the configuration.
+    output_dir : str | Path, optional
+        The directory where the report folder will be generated (default is None,
+        the current directory).
+    logger : logging.Logger, optional
+        A logger object to track warnings, errors, and info messages (default is
+        None, a logger writing to the 'logs' folder of output_dir).
+    max_depth : int, optional
+        The maximum depth of the directory structure of dir_path (default is 2,
+        sections and subsections).
+    write_config : bool, optional
+        Whether to write the configuration generated from dir_path or given as
+        config to a YAML file in output_dir (default is False).
+    run : bool, optional
+        Whether to run the report after generating it, e.g. rendering it with
+        Quarto (default is True).
+    profile : bool, optional
+        Whether to record the time of the nested build stages and of each component
+        and write them to BUILD_PROFILE_FILE and, as a Chrome trace, to
+        BUILD_TRACE_FILE in the report folder (default is False).
+    stream : bool, optional
+        Whether to create, generate and release the sections one at a time, parsing
+        the sections of config_path one at a time too, so that the memory used does
+        not grow with the size of the report (default is False). Ignored if a
+        report is given.
+    validate : bool, optional
+        Whether to check the whole configuration before creating the report, so
+        that all its problems, e.g. missing files or invalid values, are reported
+        together before any work (default is True). Ignored if a report is given.
+    **view_options
+        Options of the report view, as documented in get_report, e.g.
+        streamlit_autorun or prerender_static.
+
+    Returns
+    -------
+    BuildResult
+        The report folder, configuration file, counts of the report parts and the
+        time of each stage.
+
+    Raises
+    ------
+    ValueError
+        If not exactly one of 'report', 'config', 'config_path' and 'dir_path' is
+        provided, or if output_dir is a file.
+    ConfigValidationError
+        If validate is True and the configuration has problems. It is a
+        ValueError.
+    RuntimeError
+        If Quarto is needed but not installed.
+    """
+    output_dir = Path(".") if output_dir is None else Path(output_dir)
+    if output_dir.is_file():
+        raise ValueError("The output_dir parameter should be a directory, not a file.")
+
+    # Initialize logger only if it's not provided
+    if logger is None and report is not None:
+        logger = report.logger
+    if logger is None:
+        logger, _ = get_logger("report", folder=output_dir / "logs")
+
+    sources = [report, config, config_path, dir_path]
+    if sum(source is not None for source in sources) != 1:
+        msg = (
+            "Provide exactly one of 'report', 'config', 'config_path' or 'dir_path'"
+            " to build a report."
+        )
+        logger.error(msg)
+        raise ValueError(msg)
+
+    if not output_dir.exists():
+        logger.info("Creating output directory: %s", output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Validate and convert the report type to its enum value
+    report_type = assert_enum_value(ReportType, report_type, logger)
+
+    timings = {}
+    profiler = BuildProfiler() if profile else None
+    with profiler.activate() if profiler is not None else contextlib.nullcontext():
+        start = time.perf_counter()
+        with profile_stage("config"):
+            if report is None:
+                # Create the config manager object
+                config_manager = ConfigManager(logger, max_depth=max_depth)
+                if dir_path is not None:
+                    # Generate configuration from the provided directory
+                    # config has under report a title based on the directory name
+                    with profile_stage("scan_directory", directory=str(dir_path)):
+                        config, _ = config_manager.create_yamlconfig_fromdir(dir_path)
+                elif config_path is not None:
+                    # Load the YAML configuration file with the report metadata
+                    with profile_stage("load_config", file=str(config_path)):
+                        if stream:
+                            config = load_yaml_config_lazily(config_path)
+                        else:
+                            config = load_yaml_config(config_path)
+                if write_config and config_path is None:
+                    with profile_stage("write_config"):
+                        config_path = write_yaml_config(config, output_dir)
+                    logger.info("Configuration file generated at %s", config_path)
+                if validate:
+                    with profile_stage("validate_config"):
+                        check_config(config, logger, report_type=report_type)
+                # Load report object and metadata
+                with profile_stage("initialize_report"):
+                    report, _ = config_manager.initialize_report(config, stream=stream)
+        timings["config"] = time.perf_counter() - start
+
+        report_dir = output_dir / (
+            "streamlit_report"
+            if report_type == ReportType.STREAMLIT
+            else "quarto_report"
+        )
+        report_view = _create_report_view(report, report_type, report_dir, view_options)
+        start = time.perf_counter()
+        with profile_stage("generate", report_type=str(report_type)):
+            report_view.generate_report()
+        timings["generate"] = time.perf_counter() - start
+        if run:
+            start = time.perf_counter()
+            with profile_stage("run", report_type=str(report_type)):
+                report_view.run_report()
+            timings["run"] = time.perf_counter() - start
+
+    n_sections, n_subsections, n_components = _count_report_parts(report)
+    result = BuildResult(
+        report_dir=report_dir,
+        config_path=Path(config_path) if config_path is not None else None,
+        report=report,
+        n_sections=n_sections,
+        n_subsections=n_subsections,
+        n_components=n_components,
+        timings=timings,
+    )
+    if profiler is not None:
+        result.profile = profiler.summary()
+        summary_file, trace_file = profiler.write(report_dir)
+        logger.info(
+            "Build profile written to %s and Chrome trace to %s",
+            summary_file,
+            trace_file,
+        )
+    logger.info(
+        "Built '%s' report with %d component(s) in %.2f s: %s",
+        report_type,
+        result.n_components,
+        result.seconds,
+        result.report_dir,
+    )
+    return result
+
+
+def _count_report_parts(report: Report) -> Tuple[int, int, int]:
+    """
+    Count the sections, subsections and components of a report. Those of a streamed
+    report were counted while it was generated, instead of creating its sections
+    again.
+    """
+    if isinstance(report.sections, SectionStream) and report.sections.counts:
+        return report.sections.counts
+    n_sections = n_subsections = n_components = 0
+    for section in report.sections:
+        n_sections += 1
+        n_subsections += len(section.subsections)
+        n_components += len(section.components) + sum(
+            len(subsection.components) for subsection in section.subsections
+        )
+    return n_sections, n_subsections, n_components
+
+
+def _create_report_view(
+    report: Report, report_type: ReportType, report_dir: Path, view_options: dict
+) -> Union[StreamlitReportView, QuartoReportView]:
+    """Create the report view of a report type, generating into report_dir."""
+    if report_type == ReportType.STREAMLIT:
+        return StreamlitReportView(
+            report=report,
+            report_type=report_type,
+            streamlit_autorun=view_options.get("streamlit_autorun", False),
+            static_dir=report_dir / "static",
+            sections_dir=report_dir / "sections",
+            prefetch_remote=view_options.get("prefetch_remote", False),
+            jobs=view_options.get("jobs", 1),
+            static_store=view_options.get("static_store", False),
+        )
+
+    # Check if Quarto is installed, Jupyter notebooks are written directly
+    if (
+        report_type != ReportType.JUPYTER
+        and shutil.which("quarto") is None
+        and not hasattr(sys, "_MEIPASS")  # ? and not getattr(sys, "frozen", False)
+    ):
+        msg = (
+            "Quarto is not installed. Please install Quarto before generating this "
+            "report type."
+        )
+        report.logger.error(msg)
+        raise RuntimeError(msg)
+    quarto_options = {
+        key: value for key, value in view_options.items() if key != "streamlit_autorun"
+    }
+    return QuartoReportView(
+        report=report,
+        report_type=report_type,
+        output_dir=report_dir,
+        static_dir=report_dir / "static",
+        **quarto_options,
+    )
 
 
 def get_report(
@@ -21,6 +312,23 @@ def get_report(
     quarto_checks: bool = False,
     output_dir: Path = None,
     max_depth: int = 2,  # section and subsection folders
+    prefetch_remote: bool = False,
+    prerender_static: bool = False,
+    table_row_count: bool = False,
+    table_max_rows: Optional[int] = TABLE_MAX_ROWS,
+    table_max_bytes: Optional[int] = TABLE_MAX_BYTES,
+    quarto_project: bool = False,
+    profile_chunks: bool = False,
+    profile_memory: bool = False,
+    execute_notebooks: bool = False,
+    dedup_assets: bool = False,
+    pdf_engine: str = "latex",
+    image_settings: Optional[dict] = None,
+    profile: bool = False,
+    jobs: int = 1,
+    stream: bool = False,
+    validate: bool = True,
+    static_store: bool = False,
 ) -> tuple[str, str]:
     """
     Generate and run a report based on the specified engine.
@@ -49,6 +357,71 @@ def get_report(
         The maximum depth of the directory structure to consider when generating the
         report. The default is 2, which means it will include sections and subsections.
         The parater is only used when 'dir_path' is used.
+    prefetch_remote : bool, optional
+        Whether to download URL-backed component files into the static folder of the
+        report when generating it (default is False).
+    prerender_static : bool, optional
+        Whether to render the images of plots and tables of static reports (PDF, DOCX,
+        ODT, PPTX) in parallel before running Quarto, skipping unchanged images
+        (default is False).
+    table_row_count : bool, optional
+        Whether to show the number of rows and columns of each table below its
+        snapshot in static reports, counting the rows of CSV and TXT files
+        (default is False, only noting the shape of truncated snapshots, without
+        counting the rows of CSV and TXT files).
+    table_max_rows : int, optional
+        The maximum number of rows of a table embedded in interactive Quarto reports
+        (default is TABLE_MAX_ROWS). Larger tables are truncated and written in full
+        as a compressed file linked from the report. None or 0 disables the limit.
+    table_max_bytes : int, optional
+        The maximum estimated size in bytes of the data of a table embedded in
+        interactive Quarto reports (default is TABLE_MAX_BYTES). None or 0 disables
+        the limit.
+    quarto_project : bool, optional
+        Whether to generate HTML reports as a Quarto website project with one page
+        per section, rendering only the pages which changed since the last build
+        (default is False).
+    profile_chunks : bool, optional
+        Whether to time each chunk when Quarto renders the report. The wall time of
+        the chunks is written next to the qmd files and summarized in
+        'render_profile.txt', slowest first (default is False).
+    profile_memory : bool, optional
+        Whether to also record the peak memory of the chunks timed with
+        profile_chunks, which slows them down (default is False).
+    execute_notebooks : bool, optional
+        Whether to execute the notebooks of Jupyter reports, which are otherwise
+        written without outputs (default is False).
+    dedup_assets : bool, optional
+        Whether to save the scripts and stylesheets of the networks and HTML files
+        of html and revealjs reports once in the static folder and point all of them
+        to these copies. A size report is written to 'static/lib/asset_report.json'
+        (default is False).
+    pdf_engine : str, optional
+        The engine used to render pdf reports: "latex" or "typst", which needs no
+        TeX installation and renders faster (default is "latex").
+    image_settings : dict, optional
+        The resolution, maximum size and format of the images of static reports,
+        e.g. {"dpi": 150, "max_size": 1600, "format": "jpeg"}. They override the
+        image settings of the report in the configuration file (default is None).
+    profile : bool, optional
+        Whether to write the time of the build stages and components to
+        'build_profile.json' and a Chrome trace to 'build_trace.json' in the report
+        folder (default is False).
+    jobs : int, optional
+        The number of threads generating the content of the components, e.g.
+        reading tables and networks and writing their static files. The report is
+        the same as with one thread (default is 1).
+    stream : bool, optional
+        Whether to parse, generate and write the sections one at a time, so that
+        very large reports are built with little memory (default is False).
+    validate : bool, optional
+        Whether to check the whole configuration and report all its problems
+        before building the report (default is True).
+    static_store : bool, optional
+        Whether to name the static files of the components after the hash of their
+        content and settings, so that identical files are written once and files
+        of previous builds are reused. 'static/static_manifest.json' maps the
+        components to their files (default is False).
 
     Raises
     ------
@@ -59,80 +432,38 @@ def get_report(
     -------
     tuple[str, str]
         The path to the generated report and the path to the configuration file.
-    """
-    if output_dir is None:
-        output_dir = Path(".")
-    else:
-        output_dir = Path(output_dir)
-        if output_dir.is_file():
-            raise ValueError(
-                "The output_dir parameter should be a directory, not a file."
-            )
-        if not output_dir.exists():
-            logger.info("Creating output directory: %s", output_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Initialize logger only if it's not provided
-    if logger is None:
-        _folder = "logs"
-        if output_dir:
-            _folder = output_dir / _folder
-        logger, _ = get_logger("report", folder=_folder)
-
-    # Create the config manager object
-    config_manager = ConfigManager(logger, max_depth=max_depth)
 
-    if dir_path:
-        # Generate configuration from the provided directory
-        yaml_data, _ = config_manager.create_yamlconfig_fromdir(dir_path)
-        # yaml_data has under report a title created based on the directory name
-        config_path = write_yaml_config(yaml_data, output_dir)
-        logger.info("Configuration file generated at %s", config_path)
-
-    # Load the YAML configuration file with the report metadata
-    report_config = load_yaml_config(config_path)
-
-    # Load report object and metadata
-    report, _ = config_manager.initialize_report(report_config)
-
-    # Validate and convert the report type to its enum value
-    report_type = assert_enum_value(ReportType, report_type, logger)
-
-    # Create and run ReportView object based on its type
-    if report_type == ReportType.STREAMLIT:
-        report_dir = output_dir / "streamlit_report"
-        sections_dir = report_dir / "sections"
-        static_files_dir = report_dir / "static"
-        st_report = StreamlitReportView(
-            report=report,
-            report_type=report_type,
-            streamlit_autorun=streamlit_autorun,
-            static_dir=static_files_dir,
-            sections_dir=sections_dir,
-        )
-        st_report.generate_report()
-        st_report.run_report()
-    else:
-        # Check if Quarto is installed
-        if shutil.which("quarto") is None and not hasattr(
-            sys, "_MEIPASS"
-        ):  # ? and not getattr(sys, "frozen", False)
-            msg = (
-                "Quarto is not installed. Please install Quarto before generating this "
-                "report type."
-            )
-            logger.error(msg)
-            raise RuntimeError(msg)
-        report_dir = output_dir / "quarto_report"
-        static_files_dir = report_dir / "static"
-        quarto_report = QuartoReportView(
-            report=report,
-            report_type=report_type,
-            quarto_checks=quarto_checks,
-            output_dir=report_dir,
-            static_dir=static_files_dir,
-        )
-        quarto_report.generate_report()
-        quarto_report.run_report()
+    See Also
+    --------
+    build_report : Build a report from a configuration dict or a Report object.
+    """
+    result = build_report(
+        report_type=report_type,
+        logger=logger,
+        config_path=config_path,
+        dir_path=dir_path,
+        output_dir=output_dir,
+        max_depth=max_depth,
+        write_config=True,
+        streamlit_autorun=streamlit_autorun,
+        prefetch_remote=prefetch_remote,
+        quarto_checks=quarto_checks,
+        prerender_static=prerender_static,
+        table_row_count=table_row_count,
+        table_max_rows=table_max_rows,
+        table_max_bytes=table_max_bytes,
+        quarto_project=quarto_project,
+        profile_chunks=profile_chunks,
+        profile_memory=profile_memory,
+        execute_notebooks=execute_notebooks,
+        dedup_assets=dedup_assets,
+        pdf_engine=pdf_engine,
+        image_settings=image_settings,
+        profile=profile,
+        jobs=jobs,
+        stream=stream,
+        validate=validate,
+        static_store=static_store,
+    )
     # ? Could be also the path to the report file for quarto based reports
-    return report_dir, config_path
+    return result.report_dir, result.config_path
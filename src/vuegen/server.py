@@ -0,0 +1,777 @@
+"""Build reports on demand from a long-running local service.
+
+Each run of the command line pays the imports of the table and plotting libraries
+and starts with cold caches. The service starts its worker processes once, imports
+these libraries in them up front and keeps them, with their process-wide caches
+such as the shared HTTP session, for all the builds it is sent. Build jobs are
+queued and built by a bounded number of workers, and their status and timings are
+available while they run:
+
+.. code-block:: bash
+
+    vuegen serve --port 8765 --workers 2 --output_dir reports --token <token>
+    curl -X POST localhost:8765/jobs -H "Authorization: Bearer <token>" \\
+        -H "Content-Type: application/json" \\
+        -d '{"config": "configs/cohort_config.yaml", "report_types": ["html", "pdf"]}'
+    curl localhost:8765/jobs/<job id> -H "Authorization: Bearer <token>"
+
+A job may run code on the machine, e.g. in the chunks of a Quarto report, so the
+service only answers requests with the token of the service in their
+Authorization header, generated and logged when the service starts unless one is
+given. Jobs are only accepted as JSON bodies of at most MAX_JOB_BYTES, requests
+from web pages of other sites are refused, and a service listening on a local
+address only answers requests addressed to a local host name, against DNS
+rebinding. A service listening on other addresses needs a given token.
+
+The service answers JSON on these endpoints:
+
+- ``POST /jobs`` queues a job, answering 202 with the job, 400 if the job is
+  invalid, 413 if it is too large, 415 if it is not JSON or 503 if the queue is
+  full.
+- ``GET /jobs`` lists the jobs, newest last, and ``GET /jobs/<id>`` gives one job.
+- ``GET /health`` gives the number of workers and of queued and running builds.
+
+Requests without the token are answered 401, and requests from other sites or to
+other hosts 403.
+
+A job has exactly one of 'config', the path to a YAML configuration file or an
+inline configuration, and 'directory'. Its other keys are 'name', 'report_types'
+(one type or a list, default 'streamlit'), 'output_dir' and the options of a report
+in a batch manifest, except 'streamlit_autorun'. Each report type is built in its
+own worker, into <output_dir>/<report_type>, where output_dir defaults to
+<service output_dir>/<job id>. Relative paths are resolved from the folder the
+service was started in, its root, and paths outside of it are refused.
+"""
+
+import hmac
+import importlib
+import ipaddress
+import json
+import logging
+import multiprocessing
+import os
+import secrets
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+from .batch import REPORT_OPTIONS, BatchEntry, BatchResult, build_entry
+from .report import ReportType
+from .utils import get_logger
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Keys of a job which are not options of its reports
+JOB_KEYS = ("name", "config", "directory", "report_types", "output_dir")
+# Options of the reports of a job. Running a Streamlit app would block a worker.
+JOB_OPTIONS = tuple(
+    option
+    for option in REPORT_OPTIONS
+    if option not in ("report_type", "streamlit_autorun")
+)
+# Modules imported by each worker process when it starts, if installed
+WARM_MODULES = (
+    "vuegen.report_generator",
+    "pandas",
+    "matplotlib.pyplot",
+    "plotly.io",
+    "altair",
+    "networkx",
+    "pyvis.network",
+    "nbformat",
+    "requests",
+)
+# Number of finished jobs whose status is kept, the oldest are forgotten first
+MAX_FINISHED_JOBS = 1000
+# Size in bytes of the largest job accepted, e.g. with an inline configuration
+MAX_JOB_BYTES = 10 * 2**20
+
+
+class QueueFullError(RuntimeError):
+    """The service has as many builds waiting for a worker as it accepts."""
+
+
+def _is_loopback(host: Optional[str]) -> bool:
+    """Whether a host name or address, e.g. of a Host header, is the local host."""
+    if not host:
+        return False
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host.strip("[]")).is_loopback
+    except ValueError:
+        return False
+
+
+def _hostname(url: str) -> Optional[str]:
+    """The host name of a URL, or of a Host header prefixed with '//', if valid."""
+    try:
+        return urlsplit(url).hostname
+    except ValueError:
+        return None
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat(timespec="milliseconds")
+
+
+@dataclass
+class Job:
+    """
+    A build job of the service: one configuration built as one or more report
+    types.
+
+    Attributes
+    ----------
+    id : str
+        The unique identifier of the job.
+    name : str
+        The name of the job, used for the log files of its reports.
+    entries : list[BatchEntry]
+        The reports to build, one per report type.
+    submitted : float
+        The time the job was queued, in seconds since the epoch.
+    started : float, optional
+        The time the first report of the job started to be built.
+    finished : float, optional
+        The time the last report of the job was built or failed.
+    results : dict[str, BatchResult]
+        The outcome of each built or failed report, by report type.
+    workers : dict[str, int]
+        The process identifier of the worker which built each report, by report
+        type.
+    futures : dict[str, Future]
+        The build of each report in the worker processes, by report type.
+    """
+
+    id: str
+    name: str
+    entries: List[BatchEntry]
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    results: Dict[str, BatchResult] = field(default_factory=dict)
+    workers: Dict[str, int] = field(default_factory=dict)
+    futures: Dict[str, Future] = field(default_factory=dict, repr=False)
+
+    @property
+    def status(self) -> str:
+        """One of 'queued', 'running', 'done' and 'failed'."""
+        if self.finished is not None:
+            results = list(self.results.values())
+            return "done" if all(result.ok for result in results) else "failed"
+        futures = list(self.futures.values())
+        if self.results or any(future.running() for future in futures):
+            return "running"
+        return "queued"
+
+    def to_dict(self) -> dict:
+        """The status and timings of the job and of each of its reports."""
+        reports = []
+        for entry in self.entries:
+            result = self.results.get(entry.report_type)
+            if result is None:
+                future = self.futures.get(entry.report_type)
+                status = "running" if future and future.running() else "queued"
+                reports.append({"report_type": entry.report_type, "status": status})
+                continue
+            reports.append(
+                {
+                    "report_type": result.report_type,
+                    "status": "ok" if result.ok else "failed",
+                    "seconds": round(result.seconds, 3),
+                    "timings": {k: round(v, 3) for k, v in result.timings.items()},
+                    "report_dir": str(result.report_dir) if result.report_dir else None,
+                    "log_file": result.log_file,
+                    "worker": self.workers.get(entry.report_type),
+                    "error": result.error,
+                }
+            )
+        end = self.finished if self.finished is not None else time.time()
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "submitted": _isoformat(self.submitted),
+            "started": _isoformat(self.started),
+            "finished": _isoformat(self.finished),
+            "queue_seconds": (
+                round(self.started - self.submitted, 3)
+                if self.started is not None
+                else None
+            ),
+            "seconds": round(end - self.submitted, 3),
+            "reports": reports,
+        }
+
+
+def parse_job(
+    data: dict,
+    job_id: str,
+    output_dir: Path,
+    base_dir: Path,
+    logger: logging.Logger,
+) -> Job:
+    """
+    Read a job sent to the service.
+
+    Parameters
+    ----------
+    data : dict
+        The job, as decoded from the JSON body of the request.
+    job_id : str
+        The identifier of the job.
+    output_dir : Path
+        The folder of the service in which the job folders are created.
+    base_dir : Path
+        The root folder of the service, from which relative paths are resolved.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+
+    Returns
+    -------
+    Job
+        The job, with one report per report type.
+
+    Raises
+    ------
+    ValueError
+        If the job is not a mapping, has not exactly one of 'config' and
+        'directory', has an unknown option or report type, or a path outside of
+        base_dir.
+    """
+    base_dir = Path(base_dir).resolve()
+
+    def fail(msg: str):
+        logger.error(msg)
+        raise ValueError(msg)
+
+    def resolve(path: Optional[str], key: str) -> Optional[Path]:
+        if path is None:
+            return None
+        if not isinstance(path, str):
+            fail(f"The '{key}' of a job should be a path.")
+        resolved = (base_dir / path).resolve()
+        if resolved != base_dir and base_dir not in resolved.parents:
+            fail(f"The '{key}' of a job is outside of the service folder: {path}")
+        return resolved
+
+    if not isinstance(data, dict):
+        fail(f"A job should be a JSON object, got {type(data).__name__}.")
+    unknown = set(data) - set(JOB_KEYS) - set(JOB_OPTIONS)
+    if unknown:
+        fail(
+            f"Unknown option(s) {', '.join(sorted(unknown))} in the job. Valid"
+            f" options are: {', '.join(JOB_KEYS + JOB_OPTIONS)}."
+        )
+    config = data.get("config")
+    dir_path = resolve(data.get("directory"), "directory")
+    if (config is None) == (dir_path is None):
+        fail("A job needs exactly one of 'config' and 'directory'.")
+    if config is not None and not isinstance(config, (str, dict)):
+        fail("The 'config' of a job should be a file path or a configuration.")
+    config_path = resolve(config, "config") if isinstance(config, str) else None
+
+    report_types = data.get("report_types") or ["streamlit"]
+    if isinstance(report_types, str):
+        report_types = [report_types]
+    valid_types = [str(member.value) for member in ReportType]
+    invalid = [
+        report_type
+        for report_type in report_types
+        if str(report_type).lower() not in valid_types
+    ]
+    if invalid:
+        fail(
+            f"Invalid report type(s) {', '.join(map(str, invalid))} in the job."
+            f" Valid report types are: {', '.join(valid_types)}."
+        )
+    report_types = list(dict.fromkeys(str(rt).lower() for rt in report_types))
+
+    if config_path is not None or dir_path is not None:
+        default_name = (config_path or dir_path).stem
+    else:
+        default_name = "config"
+    name = str(data.get("name") or default_name)
+    job_dir = resolve(data.get("output_dir"), "output_dir") or output_dir / job_id
+    options = {key: value for key, value in data.items() if key in JOB_OPTIONS}
+    entries = [
+        BatchEntry(
+            # Unique, as it names the log file and the logger of the report
+            name=f"{name}_{job_id}",
+            output_dir=job_dir / report_type,
+            config_path=config_path,
+            dir_path=dir_path,
+            config=config if isinstance(config, dict) else None,
+            options={**options, "report_type": report_type},
+        )
+        for report_type in report_types
+    ]
+    return Job(id=job_id, name=name, entries=entries)
+
+
+def _warm_worker():
+    """Import the modules used to build reports when a worker process starts."""
+    for module in WARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+    try:
+        from .utils.remote import get_session
+
+        get_session()
+    except ImportError:
+        pass
+
+
+def _build_in_worker(
+    entry: BatchEntry, log_folder: Union[str, Path]
+) -> tuple[float, int, BatchResult]:
+    """Build a report, returning when and in which process it started too."""
+    return time.time(), os.getpid(), build_entry(entry, log_folder)
+
+
+class BuildService:
+    """
+    Queue build jobs and build their reports in warm worker processes.
+
+    Parameters
+    ----------
+    output_dir : str | Path
+        The folder in which the job folders are created.
+    logger : logging.Logger
+        A logger object to track the jobs.
+    workers : int, optional
+        The number of reports built at the same time, each in its own worker
+        process (default is 2).
+    max_queued : int, optional
+        The number of reports which may wait for a worker. Jobs which would exceed
+        it are refused (default is 100).
+    log_folder : str | Path, optional
+        The folder of the log files of the reports (default is "logs").
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        logger: logging.Logger,
+        workers: int = 2,
+        max_queued: int = 100,
+        log_folder: Union[str, Path] = "logs",
+    ):
+        self.base_dir = Path.cwd().resolve()
+        self.output_dir = self.base_dir / Path(output_dir).expanduser()
+        self.logger = logger
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.log_folder = self.base_dir / Path(log_folder)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._pool = self._start_pool()
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        # Forking a process serving requests from threads is unsafe
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        # Start and warm up all the workers before the first job
+        for _ in range(self.workers):
+            pool.submit(os.getpid)
+        return pool
+
+    def _submit(self, entry: BatchEntry) -> Future:
+        try:
+            return self._pool.submit(_build_in_worker, entry, self.log_folder)
+        except BrokenProcessPool:
+            # e.g. a worker killed by the system, whose builds failed
+            self.logger.warning("A worker process died, starting new workers.")
+            self._pool.shutdown(wait=False)
+            self._pool = self._start_pool()
+            return self._pool.submit(_build_in_worker, entry, self.log_folder)
+
+    def submit(self, data: dict) -> Job:
+        """
+        Queue a job.
+
+        Parameters
+        ----------
+        data : dict
+            The job, as documented in the module.
+
+        Returns
+        -------
+        Job
+            The queued job.
+
+        Raises
+        ------
+        ValueError
+            If the job is invalid.
+        QueueFullError
+            If the job would exceed the number of reports waiting for a worker.
+        """
+        job = parse_job(
+            data, uuid.uuid4().hex[:12], self.output_dir, self.base_dir, self.logger
+        )
+        with self._lock:
+            n_queued = self._count_builds()[0]
+            if n_queued + len(job.entries) > self.max_queued:
+                msg = (
+                    f"The queue is full: {n_queued} report(s) are waiting for a"
+                    f" worker. Retry the job '{job.name}' later."
+                )
+                self.logger.error(msg)
+                raise QueueFullError(msg)
+            self._jobs[job.id] = job
+            for entry in job.entries:
+                job.futures[entry.report_type] = self._submit(entry)
+            self._forget_finished_jobs()
+        # Outside of the lock, as the callback runs at once if the build is done
+        for entry in job.entries:
+            job.futures[entry.report_type].add_done_callback(
+                partial(self._on_done, job, entry)
+            )
+        self.logger.info(
+            "Queued job %s '%s' (%s).",
+            job.id,
+            job.name,
+            ", ".join(entry.report_type for entry in job.entries),
+        )
+        return job
+
+    def _on_done(self, job: Job, entry: BatchEntry, future: Future):
+        """Record the outcome of a report of a job, called when its build ends."""
+        try:
+            started, worker, result = future.result()
+        except Exception as e:  # e.g. a worker killed by the system
+            started, worker = None, None
+            result = BatchResult(
+                name=entry.name,
+                report_type=entry.report_type,
+                error="".join(traceback.format_exception_only(type(e), e)).strip(),
+            )
+        with self._lock:
+            job.results[entry.report_type] = result
+            if worker is not None:
+                job.workers[entry.report_type] = worker
+            if started is not None:
+                job.started = min(started, job.started or started)
+            if len(job.results) == len(job.entries):
+                job.finished = time.time()
+        if result.ok:
+            self.logger.info(
+                "Job %s: built %s report in %.2f s.",
+                job.id,
+                entry.report_type,
+                result.seconds,
+            )
+        else:
+            self.logger.error(
+                "Job %s: %s report failed after %.2f s: %s (log: %s)",
+                job.id,
+                entry.report_type,
+                result.seconds,
+                result.error,
+                result.log_file,
+            )
+
+    def _count_builds(self) -> tuple[int, int]:
+        """The numbers of queued and running reports. Call with the lock held."""
+        n_queued = n_running = 0
+        for job in self._jobs.values():
+            for future in job.futures.values():
+                if future.running():
+                    n_running += 1
+                elif not future.done():
+                    n_queued += 1
+        return n_queued, n_running
+
+    def _forget_finished_jobs(self):
+        """Keep the last MAX_FINISHED_JOBS finished jobs. Call with the lock held."""
+        finished = [job.id for job in self._jobs.values() if job.finished is not None]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """The job with the given identifier, if it is known."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        """The known jobs, in the order they were queued."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def health(self) -> dict:
+        """The number of workers and of queued and running reports."""
+        with self._lock:
+            n_queued, n_running = self._count_builds()
+            n_jobs = len(self._jobs)
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "queued": n_queued,
+            "running": n_running,
+            "max_queued": self.max_queued,
+            "jobs": n_jobs,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers, cancelling the queued reports."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Answer the requests to the service of the server, in JSON."""
+
+    server_version = "VueGen"
+
+    @property
+    def service(self) -> BuildService:
+        return self.server.service
+
+    def do_GET(self):
+        if not self._check_request():
+            return
+        path = self.path.split("?")[0].rstrip("/")
+        if path == "/health":
+            self._send_json(HTTPStatus.OK, self.service.health())
+        elif path == "/jobs":
+            jobs = [job.to_dict() for job in self.service.jobs()]
+            self._send_json(HTTPStatus.OK, {"jobs": jobs})
+        elif path.startswith("/jobs/"):
+            job_id = path[len("/jobs/") :]
+            job = self.service.get(job_id)
+            if job is None:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {job_id}")
+            else:
+                self._send_json(HTTPStatus.OK, job.to_dict())
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+
+    def do_POST(self):
+        if not self._check_request():
+            return
+        if self.path.split("?")[0].rstrip("/") != "/jobs":
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+            return
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type.lower() != "application/json":
+            self._send_error(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                f"A job should be sent as application/json, got: {content_type!r}",
+            )
+            return
+        length = self.headers.get("Content-Length", "")
+        if not length.isdigit():
+            self._send_error(
+                HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {length!r}"
+            )
+            return
+        if int(length) > MAX_JOB_BYTES:
+            self._send_error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"A job should have at most {MAX_JOB_BYTES} bytes, got: {length}",
+            )
+            return
+        try:
+            data = json.loads(self.rfile.read(int(length)) or b"{}")
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+            return
+        try:
+            job = self.service.submit(data)
+        except QueueFullError as e:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+        else:
+            self._send_json(
+                HTTPStatus.ACCEPTED, job.to_dict(), location=f"/jobs/{job.id}"
+            )
+
+    def _check_request(self) -> bool:
+        """
+        Check that the request is not sent by a web page of another site nor, on
+        a local address, addressed to another host, and that it has the token of
+        the service. Answers the request otherwise.
+        """
+        origin = self.headers.get("Origin")
+        if origin is not None and not _is_loopback(_hostname(origin)):
+            self._send_error(HTTPStatus.FORBIDDEN, f"Origin not allowed: {origin}")
+            return False
+        host = self.headers.get("Host", "")
+        if self.server.local_only and not _is_loopback(_hostname(f"//{host}")):
+            self._send_error(HTTPStatus.FORBIDDEN, f"Host not allowed: {host}")
+            return False
+        scheme, _, token = self.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.strip().encode("utf-8"), self.server.token.encode("utf-8")
+        ):
+            self._send_error(
+                HTTPStatus.UNAUTHORIZED,
+                "Missing or invalid token in the Authorization header.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+            return False
+        return True
+
+    def _send_json(
+        self,
+        status: HTTPStatus,
+        body: dict,
+        location: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        content = json.dumps(body, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        if location is not None:
+            self.send_header("Location", location)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_error(
+        self,
+        status: HTTPStatus,
+        message: str,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self._send_json(status, {"error": message}, headers=headers)
+
+    def log_message(self, format, *args):
+        self.service.logger.debug("%s %s", self.address_string(), format % args)
+
+
+def create_server(
+    service: BuildService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    token: Optional[str] = None,
+) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server of a build service, without starting it.
+
+    Parameters
+    ----------
+    service : BuildService
+        The service which builds the jobs.
+    host : str, optional
+        The address to listen on (default is DEFAULT_HOST, only local clients).
+    port : int, optional
+        The port to listen on, 0 for any free port (default is DEFAULT_PORT).
+    token : str, optional
+        The token which the requests have to send in their Authorization header
+        (default is None, a random token, only allowed on local addresses).
+
+    Returns
+    -------
+    ThreadingHTTPServer
+        The server, with its token as server.token. Start it with serve_forever.
+
+    Raises
+    ------
+    ValueError
+        If host is not a local address and no token is given.
+    """
+    local_only = _is_loopback(host)
+    if not token and not local_only:
+        msg = (
+            f"The service would listen on {host}, which is not a local address,"
+            " without a token. Give a token to serve other machines."
+        )
+        service.logger.error(msg)
+        raise ValueError(msg)
+    server = ThreadingHTTPServer((host, port), _RequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.token = token or secrets.token_urlsafe(32)
+    server.local_only = local_only
+    return server
+
+
+def main(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    output_dir: Union[str, Path] = ".",
+    workers: int = 2,
+    max_queued: int = 100,
+    token: Optional[str] = None,
+) -> int:
+    """
+    Run the build service until it is interrupted.
+
+    Parameters
+    ----------
+    host : str, optional
+        The address to listen on (default is DEFAULT_HOST, only local clients).
+    port : int, optional
+        The port to listen on (default is DEFAULT_PORT).
+    output_dir : str | Path, optional
+        The folder in which the job folders are created (default is the current
+        directory).
+    workers : int, optional
+        The number of reports built at the same time (default is 2).
+    max_queued : int, optional
+        The number of reports which may wait for a worker (default is 100).
+    token : str, optional
+        The token which the requests have to send in their Authorization header
+        (default is None, a random token which is logged, only allowed on local
+        addresses).
+
+    Returns
+    -------
+    int
+        The exit code.
+    """
+    logger, logfile = get_logger("serve")
+    logger.info("logfile: %s", logfile)
+    if not token and not _is_loopback(host):
+        logger.error(
+            "Refusing to serve on %s, which is not a local address, without a"
+            " token. Give one with --token.",
+            host,
+        )
+        return 1
+    service = BuildService(
+        output_dir,
+        logger,
+        workers=workers,
+        max_queued=max_queued,
+        log_folder=Path(logfile).parent,
+    )
+    server = create_server(service, host, port, token=token)
+    logger.info(
+        "Serving build jobs on http://%s:%d with %d worker(s).",
+        *server.server_address[:2],
+        service.workers,
+    )
+    if not token:
+        logger.info("Send the header 'Authorization: Bearer %s'.", server.token)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping the service, cancelling the queued reports.")
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
@@ -10,10 +10,9 @@ import textwrap
 from pathlib import Path
 from typing import List
 
-from streamlit.web import cli as stcli
-
 from . import report as r
 from . import table_utils
+from .constants import TIMEOUT
 from .utils import (
     create_folder,
     generate_footer,
@@ -21,17 +20,19 @@ from .utils import (
     is_url,
     sort_imports,
 )
+from .utils.profiling import profile_stage
 from .utils.variables import make_valid_identifier
 
 
 def write_python_file(fpath: str, imports: list[str], contents: list[str]) -> None:
     """Write a Python file with the given imports and contents."""
-    with open(fpath, "w", encoding="utf-8") as f:
-        # Write imports at the top of the file
-        f.write("\n".join(imports) + "\n\n")
+    with profile_stage("write_file", file=Path(fpath).name):
+        with open(fpath, "w", encoding="utf-8") as f:
+            # Write imports at the top of the file
+            f.write("\n".join(imports) + "\n\n")
 
-        # Write the subsection content (descriptions, plots)
-        f.write("\n".join(contents))
+            # Write the subsection content (descriptions, plots)
+            f.write("\n".join(contents))
 
 
 class StreamlitReportView(r.WebAppReportView):
@@ -51,6 +52,9 @@ class StreamlitReportView(r.WebAppReportView):
         streamlit_autorun: bool = False,
         static_dir: str = STATIC_FILES_DIR,
         sections_dir: str = SECTIONS_DIR,
+        prefetch_remote: bool = False,
+        jobs: int = 1,
+        static_store: bool = False,
     ):
         """Initialize ReportView with the report and report type.
 
@@ -67,8 +71,23 @@ class StreamlitReportView(r.WebAppReportView):
         static_dir : str, optional
             The folder where the static files will be saved,
             by default STATIC_FILES_DIR.
+        prefetch_remote : bool, optional
+            Whether to download URL-backed component files to the static folder
+            when generating the report, by default False. Otherwise the app fetches
+            them at runtime and caches them for REMOTE_CACHE_TTL seconds.
+        jobs : int, optional
+            The number of threads generating the content of the components, such
+            as reading tables and networks and writing their static files, by
+            default 1.
+        static_store : bool, optional
+            Whether to name the static files of the components after the hash of
+            their content and settings, by default False. Components with the same
+            content share their files and files of previous builds are reused. A
+            manifest maps the components to their files.
         """
-        super().__init__(report=report, report_type=report_type)
+        super().__init__(
+            report=report, report_type=report_type, jobs=jobs, static_store=static_store
+        )
         self.streamlit_autorun = streamlit_autorun
         self.bundled_execution = False
         if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
@@ -88,6 +107,8 @@ class StreamlitReportView(r.WebAppReportView):
 
         self.static_dir = static_dir
         self.section_dir = sections_dir
+        self.prefetch_remote = prefetch_remote
+        self.apicall_responses = {}
 
     def generate_report(self, output_dir: str = None) -> None:
         """
@@ -126,6 +147,7 @@ class StreamlitReportView(r.WebAppReportView):
                 "Output directory for static content already existed: '%s'",
                 self.static_dir,
             )
+        self._open_static_store(self.static_dir)
 
         try:
             self.report.logger.debug("Processing app navigation code.")
@@ -166,71 +188,11 @@ class StreamlitReportView(r.WebAppReportView):
                 report_manag_content=report_manag_content,
             )
 
-            for section in self.report.sections:
-                # Create a folder for each section
-                subsection_page_vars = []
-                section_name_var = make_valid_identifier(
-                    section.title.replace(" ", "_")
-                )
-                section_dir_path = Path(output_dir) / section_name_var
-
-                if create_folder(section_dir_path):
-                    self.report.logger.debug(
-                        "Created section directory: %s", section_dir_path
-                    )
-                else:
-                    self.report.logger.debug(
-                        "Section directory already existed: %s", section_dir_path
-                    )
-                # add an overview page to section for it's section components
-                # they will be written when the components are parsed
-                # using `_generate_sections`
-                if section.components:
-                    _fname = (
-                        f"0_overview_{make_valid_identifier(section.title).lower()}.py"
-                    )
-                    subsection_file_path = (
-                        Path(section_name_var) / _fname
-                    ).as_posix()  # Make sure it's Posix Paths
-                    section.file_path = subsection_file_path
-                    # Create a Page object for each subsection and
-                    # add it to the home page content
-                    report_manag_content.append(
-                        f"{section_name_var}_overview = "
-                        f"st.Page('{subsection_file_path}'"
-                        f", title='Overview {section.title}')"
-                    )
-                    subsection_page_vars.append(f"{section_name_var}_overview")
-
-                for subsection in section.subsections:
-                    # ! could add a non-integer to ensure it's a valid identifier
-                    subsection_name_var = make_valid_identifier(subsection.title)
-                    if not subsection_name_var.isidentifier():
-                        msg = (
-                            "Subsection name is not a valid Python identifier: "
-                            f"{subsection_name_var}"
-                        )
-                        self.report.logger.error(msg)
-                        raise ValueError(
-                            msg,
-                        )
-                    subsection_file_path = (
-                        Path(section_name_var) / f"{subsection_name_var}.py"
-                    ).as_posix()  # Make sure it's Posix Paths
-                    subsection.file_path = subsection_file_path
-                    # Create a Page object for each subsection and
-                    # add it to the home page content
-                    report_manag_content.append(
-                        f"{subsection_name_var} = st.Page('{subsection_file_path}', "
-                        f"title='{subsection.title}')"
-                    )
-                    subsection_page_vars.append(subsection_name_var)
-
-                # Add all subsection Page objects to the corresponding section
-                report_manag_content.append(
-                    f"sections_pages['{section.title}'] = "
-                    f"[{', '.join(subsection_page_vars)}]\n"
-                )
+            # Create Python files for each section and its subsections and plots,
+            # adding their pages to the app navigation
+            self._generate_sections(
+                output_dir=output_dir, report_manag_content=report_manag_content
+            )
 
             # Add navigation object to the home page content
             report_manag_content.append(textwrap.dedent("""\
@@ -262,9 +224,6 @@ close-streamlit-app-with-button-click/35132/5
                     "Created app navigation script: %s", self.REPORT_MANAG_SCRIPT
                 )
 
-            # Create Python files for each section and its subsections and plots
-            self._generate_sections(output_dir=output_dir)
-
             # Save README.md to the output directory
             fpath = self.section_dir.parent / "README.md"
             with open(fpath, "w", encoding="utf-8") as f:
@@ -282,6 +241,8 @@ close-streamlit-app-with-button-click/35132/5
                     Folder cannot be moved from above path, but can be executed
                     from anywhere on the system.
                     """))
+            if self._static_store is not None:
+                self._static_store.write_manifest()
 
         except Exception as e:
             self.report.logger.error(
@@ -329,13 +290,16 @@ close-streamlit-app-with-button-click/35132/5
                     ]
                     sys.argv = args
 
+                    from streamlit.web import cli as stcli
+
                     sys.exit(stcli.main())
                 else:
                     self.report.logger.debug("Run using subprocess.")
-                    subprocess.run(
-                        [sys.executable, "-m", "streamlit", "run", target_file],
-                        check=True,
-                    )
+                    with profile_stage("streamlit", file=target_file):
+                        subprocess.run(
+                            [sys.executable, "-m", "streamlit", "run", target_file],
+                            check=True,
+                        )
             except KeyboardInterrupt:
                 print("Streamlit process interrupted.")
             except subprocess.CalledProcessError as e:
@@ -483,19 +447,99 @@ close-streamlit-app-with-button-click/35132/5
             )
             raise
 
-    def _generate_sections(self, output_dir: str) -> None:
+    def _add_section_pages(
+        self, section: r.Section, output_dir: Path, report_manag_content: list
+    ) -> None:
+        """
+        Create the folder of a section, set the file paths of its pages and add the
+        pages to the app navigation.
+
+        Parameters
+        ----------
+        section : Section
+            The section to add.
+        output_dir : Path
+            The folder where section files will be saved.
+        report_manag_content : list
+            A list to store the content that will be written to the report manager
+            file.
+        """
+        # Create a folder for each section
+        subsection_page_vars = []
+        section_name_var = make_valid_identifier(section.title.replace(" ", "_"))
+        section_dir_path = Path(output_dir) / section_name_var
+
+        if create_folder(section_dir_path):
+            self.report.logger.debug("Created section directory: %s", section_dir_path)
+        else:
+            self.report.logger.debug(
+                "Section directory already existed: %s", section_dir_path
+            )
+        # add an overview page to section for it's section components
+        # they will be written when the components are parsed
+        if section.components:
+            _fname = f"0_overview_{make_valid_identifier(section.title).lower()}.py"
+            subsection_file_path = (
+                Path(section_name_var) / _fname
+            ).as_posix()  # Make sure it's Posix Paths
+            section.file_path = subsection_file_path
+            # Create a Page object for each subsection and
+            # add it to the home page content
+            report_manag_content.append(
+                f"{section_name_var}_overview = "
+                f"st.Page('{subsection_file_path}'"
+                f", title='Overview {section.title}')"
+            )
+            subsection_page_vars.append(f"{section_name_var}_overview")
+
+        for subsection in section.subsections:
+            # ! could add a non-integer to ensure it's a valid identifier
+            subsection_name_var = make_valid_identifier(subsection.title)
+            if not subsection_name_var.isidentifier():
+                msg = (
+                    "Subsection name is not a valid Python identifier: "
+                    f"{subsection_name_var}"
+                )
+                self.report.logger.error(msg)
+                raise ValueError(
+                    msg,
+                )
+            subsection_file_path = (
+                Path(section_name_var) / f"{subsection_name_var}.py"
+            ).as_posix()  # Make sure it's Posix Paths
+            subsection.file_path = subsection_file_path
+            # Create a Page object for each subsection and
+            # add it to the home page content
+            report_manag_content.append(
+                f"{subsection_name_var} = st.Page('{subsection_file_path}', "
+                f"title='{subsection.title}')"
+            )
+            subsection_page_vars.append(subsection_name_var)
+
+        # Add all subsection Page objects to the corresponding section
+        report_manag_content.append(
+            f"sections_pages['{section.title}'] = "
+            f"[{', '.join(subsection_page_vars)}]\n"
+        )
+
+    def _generate_sections(self, output_dir: str, report_manag_content: list) -> None:
         """
         Generates Python files for each section in the report, including subsections
-        and its components (plots, dataframes, markdown).
+        and its components (plots, dataframes, markdown), and adds their pages to
+        the app navigation.
 
         Parameters
         ----------
         output_dir : str
             The folder where section files will be saved.
+        report_manag_content : list
+            A list to store the content that will be written to the report manager
+            file.
         """
         self.report.logger.info("Starting to generate sections for the report.")
         try:
-            for section in self.report.sections:
+            for section in self._iter_sections():
+                self._add_section_pages(section, output_dir, report_manag_content)
                 self.report.logger.debug(
                     # Continue
                     "Processing section '%s': '%s' - %s subsection(s)",
@@ -569,6 +613,15 @@ close-streamlit-app-with-button-click/35132/5
             self.report.logger.error("Error generating sections: %s", e, exc_info=True)
             raise
 
+    def _prepare_sections(self, sections: List[r.Section]) -> None:
+        """Download the remote files of the components, if prefetch_remote is set,
+        and run the requests of all their API calls at once, instead of one per
+        component, before preparing them."""
+        if self.prefetch_remote:
+            self._prefetch_remote_files(self.static_dir, sections)
+        self.apicall_responses = self._run_api_calls(sections=sections)
+        super()._prepare_sections(sections)
+
     def _combine_components(self, components: list[dict]) -> tuple[list, list, bool]:
         """combine a list of components."""
 
@@ -582,15 +635,10 @@ close-streamlit-app-with-button-click/35132/5
             all_imports.extend(component_imports)
 
             # Handle different types of components
-            fct = self.components_fct_map.get(component.component_type, None)
-            if fct is None:
-                self.report.logger.warning(
-                    "Unsupported component type '%s' ", component.component_type
-                )
-            else:
+            content = self._get_component_content(component)
+            if content is not None:
                 if component.component_type == r.ComponentType.CHATBOT:
                     has_chatbot = True
-                content = fct(component)
                 all_contents.extend(content)
         # remove duplicates
         all_imports = list(set(all_imports))
@@ -598,6 +646,80 @@ close-streamlit-app-with-button-click/35132/5
         all_imports.extend(setup_statements)
         return all_contents, all_imports, has_chatbot
 
+    def _combine_components_lazily(
+        self, components: list, layout: r.SubsectionLayout, key: int
+    ) -> tuple[list, list]:
+        """
+        Combine a list of components into tabs or expanders which are rendered lazily.
+
+        Each component is wrapped in a function decorated with ``st.fragment``, so
+        interacting with a component reruns only this component. Only the selected
+        tab, or the expanders which are switched on, are rendered.
+
+        Parameters
+        ----------
+        components : list
+            The components to combine. Chatbots are not supported.
+        layout : r.SubsectionLayout
+            The layout of the components, either tabs or expanders.
+        key : int
+            A key unique to the subsection page, used for the widget keys.
+
+        Returns
+        -------
+        tuple : (list, list)
+            - list of content lines (List[str])
+            - list of imports (List[str])
+        """
+        all_contents = []
+        all_imports = []
+        fragments = []
+
+        for idx, component in enumerate(components, start=1):
+            all_imports.extend(self._generate_component_imports(component))
+
+            content = self._get_component_content(component)
+            if content is None:
+                continue
+            # ids are only unique per component class, so use the position instead
+            fragment_name = f"component_{idx}"
+            fragment_content = [f"@st.fragment\ndef {fragment_name}():"]
+            if component.component_type == r.ComponentType.DATAFRAME:
+                # unique and stable keys for the widgets of the component
+                fragment_content.append(f"    df_index = {idx}")
+            fragment_content.append(textwrap.indent("\n".join(content), "    "))
+            all_contents.append("\n".join(fragment_content) + "\n")
+            fragments.append((component.title, fragment_name))
+
+        if layout == r.SubsectionLayout.TABS:
+            titles = ", ".join(repr(title) for title, _ in fragments)
+            names = ", ".join(name for _, name in fragments)
+            all_contents.append(textwrap.dedent(f"""\
+                component_titles = [{titles}]
+                component_fragments = [{names}]
+                selected_component = st.radio(
+                    "Select a component",
+                    options=range(len(component_titles)),
+                    format_func=lambda i: component_titles[i],
+                    horizontal=True,
+                    label_visibility="collapsed",
+                    key="subsection_{key}_component",
+                )
+                component_fragments[selected_component]()
+                """))
+        elif layout == r.SubsectionLayout.EXPANDERS:
+            for i, (title, name) in enumerate(fragments):
+                all_contents.append(textwrap.dedent(f"""\
+                    with st.expander({title!r}, expanded={i == 0}):
+                        if st.toggle("Show", value={i == 0}, key="show_{name}"):
+                            {name}()
+                    """))
+
+        all_imports = list(set(all_imports))
+        all_imports, setup_statements = sort_imports(all_imports)
+        all_imports.extend(setup_statements)
+        return all_contents, all_imports
+
     def _generate_subsection(self, subsection) -> tuple[List[str], List[str]]:
         """
         Generate code to render components (plots, dataframes, markdown) in the given
@@ -627,9 +749,25 @@ close-streamlit-app-with-button-click/35132/5
             subsection_content.append(
                 self._format_text(text=subsection.description, type="paragraph")
             )
-        all_components, subsection_imports, has_chatbot = self._combine_components(
-            subsection.components
+        has_chatbot = any(
+            component.component_type == r.ComponentType.CHATBOT
+            for component in subsection.components
         )
+        if subsection.layout == r.SubsectionLayout.DEFAULT or has_chatbot:
+            if subsection.layout != r.SubsectionLayout.DEFAULT:
+                self.report.logger.warning(
+                    "Layout '%s' is not supported for subsection '%s' with a chatbot."
+                    " Using the default layout.",
+                    subsection.layout,
+                    subsection.title,
+                )
+            all_components, subsection_imports, has_chatbot = self._combine_components(
+                subsection.components
+            )
+        else:
+            all_components, subsection_imports = self._combine_components_lazily(
+                subsection.components, layout=subsection.layout, key=subsection.id
+            )
         subsection_content.extend(all_components)
 
         if not has_chatbot:
@@ -683,11 +821,24 @@ close-streamlit-app-with-button-click/35132/5
                     f" caption='{plot.caption}', use_column_width=True)\n"
                 )
             elif plot.plot_type == r.PlotType.PLOTLY:
-                plot_content.append(self._generate_plot_code(plot))
+                if is_url(plot.file_path):
+                    plot_content.append(self._generate_plot_code(plot))
+                else:
+                    # Write the pre-filtered figure once, so the app can load it as is
+                    json_plot_file = (
+                        Path(self.static_dir) / f"{self._static_name(plot)}.json"
+                    ).resolve()
+                    with self._writing_static_file(plot, json_plot_file) as write:
+                        if write:
+                            plot.save_compact_plotly_json(json_plot_file)
+                    plot_content.append(
+                        self._generate_plot_code(plot, output_file=json_plot_file)
+                    )
             elif plot.plot_type == r.PlotType.ALTAIR:
                 plot_content.append(self._generate_plot_code(plot))
             elif plot.plot_type == r.PlotType.INTERACTIVE_NETWORK:
-                networkx_graph = plot.read_network()
+                with profile_stage("read_network", file=str(plot.file_path)):
+                    networkx_graph = plot.read_network()
                 if isinstance(networkx_graph, tuple):
                     # If network_data is a tuple, separate the network
                     # and html file path
@@ -696,11 +847,14 @@ close-streamlit-app-with-button-click/35132/5
                     # Otherwise,
                     # create and save a new pyvis network from the netowrkx graph
                     html_plot_file = (
-                        Path(self.static_dir) / f"{plot.title.replace(' ', '_')}.html"
+                        Path(self.static_dir) / f"{self._static_name(plot)}.html"
                     ).resolve()
-                    _ = plot.create_and_save_pyvis_network(
-                        networkx_graph, html_plot_file
-                    )
+                    with self._writing_static_file(plot, html_plot_file) as write:
+                        if write:
+                            with profile_stage("write_network_html"):
+                                _ = plot.create_and_save_pyvis_network(
+                                    networkx_graph, html_plot_file
+                                )
 
                 # Add number of nodes and edges to the plot content
                 num_nodes = networkx_graph.number_of_nodes()
@@ -708,11 +862,9 @@ close-streamlit-app-with-button-click/35132/5
 
                 # Determine whether the file path is a URL or a local file
                 if is_url(html_plot_file):
-                    plot_content.append(textwrap.dedent(f"""
-                            response = requests.get('{html_plot_file}')
-                            response.raise_for_status()
-                            html_content = response.text
-                            """))
+                    plot_content.append(
+                        f"\nhtml_content = fetch_url('{html_plot_file}')\n"
+                    )
                 else:
                     fpath = get_relative_file_path(
                         html_plot_file, relative_to=self.section_dir
@@ -756,7 +908,7 @@ close-streamlit-app-with-button-click/35132/5
         )
         return plot_content
 
-    def _generate_plot_code(self, plot) -> str:
+    def _generate_plot_code(self, plot, output_file: str = "") -> str:
         """
         Create the plot code based on its visualization tool.
 
@@ -765,18 +917,26 @@ close-streamlit-app-with-button-click/35132/5
         plot : Plot
             The plot component to generate the code template for.
         output_file: str, optional
-            The output html file name to be displayed with a pyvis plot.
+            The compact Plotly JSON file written to the static folder. If given, the
+            figure is loaded from it without further processing.
         Returns
         -------
         str
             The generated plot code as a string.
         """
-        # If the file path is a URL, generate code to fetch content via requests
+        if plot.plot_type == r.PlotType.PLOTLY and output_file:
+            plot_rel_path = get_relative_file_path(
+                output_file, relative_to=self.section_dir
+            ).as_posix()
+            return textwrap.dedent(f"""
+                file_path = (section_dir / '{plot_rel_path}').resolve().as_posix()
+                with open(file_path, 'r') as plot_file:
+                    plot_json = json.load(plot_file)
+                st.plotly_chart(plot_json, use_container_width=True)\n""")
+
+        # If the file path is a URL, generate code to fetch content with a cache
         if is_url(plot.file_path):
-            plot_code = textwrap.dedent(f"""
-                response = requests.get('{plot.file_path}')
-                response.raise_for_status()
-                plot_json = json.loads(response.text)\n""")
+            plot_code = f"\nplot_json = json.loads(fetch_url('{plot.file_path}'))\n"
         else:  # If it's a local file
             plot_rel_path = get_relative_file_path(
                 plot.file_path, relative_to=self.section_dir
@@ -835,8 +995,8 @@ close-streamlit-app-with-button-click/35132/5
             )
         )
 
-        # Mapping of file extensions to read functions
-        read_function_mapping = table_utils.read_function_mapping
+        # Mapping of file extensions to the names of the read functions
+        read_function_names = table_utils.read_function_names
 
         try:
             # Check if the file extension matches any DataFrameFormat value
@@ -882,7 +1042,7 @@ close-streamlit-app-with-button-click/35132/5
             df_file_path = get_relative_file_path(
                 dataframe.file_path, relative_to=self.section_dir
             ).as_posix()
-            read_function = read_function_mapping[file_extension].__name__
+            read_function = read_function_names[file_extension]
             if file_extension in [
                 r.DataFrameFormat.XLS.value_with_dot,
                 r.DataFrameFormat.XLSX.value_with_dot,
@@ -973,13 +1133,11 @@ close-streamlit-app-with-button-click/35132/5
             )
         )
         try:
-            # If the file path is a URL, generate code to fetch content via requests
+            # If the file path is a URL, generate code to fetch content with a cache
             if is_url(markdown.file_path):
-                markdown_content.append(textwrap.dedent(f"""
-                        response = requests.get('{markdown.file_path}')
-                        response.raise_for_status()
-                        markdown_content = response.text
-                        """))
+                markdown_content.append(
+                    f"\nmarkdown_content = fetch_url('{markdown.file_path}')\n"
+                )
             else:  # If it's a local file
                 md_rel_path = get_relative_file_path(
                     markdown.file_path, relative_to=self.section_dir
@@ -1040,12 +1198,8 @@ close-streamlit-app-with-button-click/35132/5
 
         try:
             if is_url(html.file_path):
-                # If it's a URL, fetch content dynamically
-                textwrap.dedent(html_content.append(f"""
-                        response = requests.get('{html.file_path}')
-                        response.raise_for_status()
-                        html_content = response.text
-                        """))
+                # If it's a URL, fetch content dynamically with a cache
+                html_content.append(f"html_content = fetch_url('{html.file_path}')\n")
             else:  # If it's a local file
                 html_rel_path = get_relative_file_path(
                     html.file_path, relative_to=self.section_dir
@@ -1106,7 +1260,10 @@ close-streamlit-app-with-button-click/35132/5
             )
         )
         try:
-            apicall_response = apicall.make_api_request()
+            if apicall.id in self.apicall_responses:
+                apicall_response = self.apicall_responses[apicall.id]
+            else:
+                apicall_response = apicall.make_api_request()
             apicall_content.append(f"""st.write({apicall_response})\n""")
         except Exception as e:
             self.report.logger.error(
@@ -1144,7 +1301,9 @@ close-streamlit-app-with-button-click/35132/5
 
         The function distinguishes between two chatbot modes:
         - **Ollama-style streaming API**: Identified by the presence of `chatbot.model`.
-          Uses streaming JSON chunks from the server to simulate a real-time response.
+          Streams the JSON chunks of the server to the chat as they arrive, sending
+          the last `chatbot.history_size` messages (truncated to
+          `chatbot.max_message_chars` characters) as context.
         - **Standard API**: Assumes a simple POST request with a prompt and a full JSON
           response with text,
         and other fields like links, HTML graphs, etc.
@@ -1214,53 +1373,48 @@ close-streamlit-app-with-button-click/35132/5
             # all other codeblocks pasted in need to be on this indentation level
             code_block = textwrap.dedent(f"""
                 {init_messages_block}
-                # Function to send prompt to Ollama API
-                def generate_query(messages):
-                    response = requests.post(
+                # Stream the answer of the Ollama API as the tokens arrive
+                def stream_answer(messages):
+                    with remote.get_session().post(
                         "{chatbot.api_call.api_url}",
                         json={{"model": "{chatbot.model}",
                                 "messages": messages,
                                 "stream": True}},
-                    )
-                    response.raise_for_status()
-                    return response
-
-                # Parse streaming response from Ollama
-                def parse_api_response(response):
-                    try:
-                        output = ""
+                        stream=True,
+                        timeout={TIMEOUT},
+                    ) as response:
+                        response.raise_for_status()
                         for line in response.iter_lines():
+                            if not line:
+                                continue
                             body = json.loads(line)
                             if "error" in body:
                                 raise Exception(f"API error: {{body['error']}}")
+                            yield body.get("message", {{}}).get("content", "")
                             if body.get("done", False):
-                                return {{"role": "assistant", "content": output}}
-                            output += body.get("message", {{}}).get("content", "")
-                    except Exception as e:
-                        return {{"role": "assistant", "content":
-                                f"Error while processing API response: {{str(e)}}"}}
-
-                # Simulated typing effect for responses
-                def response_generator(msg_content):
-                    for word in msg_content.split():
-                        yield word + " "
-                        time.sleep(0.1)
-                    yield "\\n"
+                                break
+
+                # Send only the last messages, truncated, as context to the model
+                def bounded_history(messages,
+                                    max_messages={chatbot.history_size},
+                                    max_chars={chatbot.max_message_chars}):
+                    return [{{"role": msg["role"],
+                              "content": str(msg["content"])[:max_chars]}}
+                            for msg in messages[-max_messages:]]
                 {render_messages_block}
                 {handle_prompt_block}
-                    # Retrieve question and generate answer
-                    combined = "\\n".join(msg["content"]
-                                for msg in st.session_state.messages
-                                if msg["role"] == "user")
-                    messages = [{{"role": "user", "content": combined}}]
-                    with st.spinner('Generating answer...'):
-                        response = generate_query(messages)
-                        parsed_response = parse_api_response(response)
-
-                    # Add the assistant's response to the session state and display it
-                    st.session_state.messages.append(parsed_response)
+                    # Generate the answer and display it while it is streamed
+                    messages = bounded_history(st.session_state.messages)
                     with st.chat_message("assistant"):
-                        st.write_stream(response_generator(parsed_response["content"]))
+                        try:
+                            answer = st.write_stream(stream_answer(messages))
+                        except Exception as e:
+                            answer = f"Error while processing API response: {{str(e)}}"
+                            st.write(answer)
+
+                    # Add the assistant's response to the session state
+                    st.session_state.messages.append({{"role": "assistant",
+                                                      "content": answer}})
                 """)
             chatbot_content.append(code_block)
 
@@ -1272,10 +1426,11 @@ close-streamlit-app-with-button-click/35132/5
                 # Function to send prompt to standard API
                 def generate_query(prompt):
                     try:
-                        response = requests.post(
+                        response = remote.get_session().post(
                             "{chatbot.api_call.api_url}",
                             json={{"prompt": prompt}},
-                            headers={chatbot.api_call.headers}
+                            headers={chatbot.api_call.headers},
+                            timeout={TIMEOUT},
                         )
                         response.raise_for_status()
                         return response.json()
@@ -1348,21 +1503,24 @@ close-streamlit-app-with-button-click/35132/5
         # Dictionary to hold the imports for each component type
         components_imports = {
             "plot": {
-                r.PlotType.ALTAIR: [
-                    "import json",
-                    "import altair as alt",
-                    "import requests",
-                ],
-                r.PlotType.PLOTLY: ["import json", "import requests"],
-                r.PlotType.INTERACTIVE_NETWORK: ["import requests"],
+                r.PlotType.ALTAIR: ["import json", "import altair as alt"],
+                r.PlotType.PLOTLY: ["import json"],
             },
             "dataframe": [
                 "import pandas as pd",
                 "from st_aggrid import AgGrid, GridOptionsBuilder",
                 "from vuegen import table_utils",
             ],
-            "markdown": ["import requests"],
-            "chatbot": ["import time", "import json", "import requests"],
+            "remote": [
+                "from vuegen.utils import remote",
+                "fetch_url = st.cache_data(ttl=remote.REMOTE_CACHE_TTL,"
+                " show_spinner=False)(remote.fetch_text)",
+            ],
+            "chatbot": [
+                "import json",
+                "import requests",
+                "from vuegen.utils import remote",
+            ],
         }
 
         component_type = component.component_type
@@ -1377,13 +1535,21 @@ close-streamlit-app-with-button-click/35132/5
             plot_type = getattr(component, "plot_type", None)
             if plot_type in components_imports["plot"]:
                 component_imports.extend(components_imports["plot"][plot_type])
-        elif component_type == r.ComponentType.MARKDOWN:
-            component_imports.extend(components_imports["markdown"])
         elif component_type == r.ComponentType.CHATBOT:
             component_imports.extend(components_imports["chatbot"])
         elif component_type == r.ComponentType.DATAFRAME:
             component_imports.extend(components_imports["dataframe"])
             component_imports.append("df_index = 1")
 
+        # Remote files are fetched through a shared session and cached by Streamlit,
+        # except for static plots which are passed as URLs to st.image
+        if (
+            component.file_path
+            and is_url(component.file_path)
+            and getattr(component, "plot_type", None) != r.PlotType.STATIC
+            and component_type != r.ComponentType.DATAFRAME
+        ):
+            component_imports.extend(components_imports["remote"])
+
         # Return the list of import statements
         return component_imports
@@ -1,24 +1,65 @@
 """Reading tabular data using pandas."""
 
-import pandas as pd
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import itertools
+import os
+import shutil
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Union
 
 from . import report as r
 
-# Mapping of file extensions to read functions
-read_function_mapping = {
-    r.DataFrameFormat.CSV.value_with_dot: pd.read_csv,
-    r.DataFrameFormat.PARQUET.value_with_dot: pd.read_parquet,
-    r.DataFrameFormat.TXT.value_with_dot: pd.read_table,
-    r.DataFrameFormat.XLS.value_with_dot: pd.read_excel,
-    r.DataFrameFormat.XLSX.value_with_dot: pd.read_excel,
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Size of the table snapshots of static reports
+PREVIEW_MAX_ROWS = 10
+PREVIEW_MAX_COLS = 5
+
+# Mapping of file extensions to the names of the pandas read functions
+read_function_names = {
+    r.DataFrameFormat.CSV.value_with_dot: "read_csv",
+    r.DataFrameFormat.PARQUET.value_with_dot: "read_parquet",
+    r.DataFrameFormat.TXT.value_with_dot: "read_table",
+    r.DataFrameFormat.XLS.value_with_dot: "read_excel",
+    r.DataFrameFormat.XLSX.value_with_dot: "read_excel",
 }
 
 
+class _ReadFunctionMapping(Mapping):
+    """Mapping of file extensions to read functions, importing pandas on the first
+    lookup only."""
+
+    def __getitem__(self, suffix: str) -> Callable[..., pd.DataFrame]:
+        import pandas as pd
+
+        return getattr(pd, read_function_names[suffix])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(read_function_names)
+
+    def __len__(self) -> int:
+        return len(read_function_names)
+
+
+# Mapping of file extensions to read functions
+read_function_mapping = _ReadFunctionMapping()
+
+
 def get_sheet_names(
     file_path: str,
 ) -> list[str]:
     """Get the sheet names of an Excel file.
 
+    Local files are opened without loading the content of the sheets, using openpyxl
+    in read-only mode (xlsx) or xlrd on demand (xls).
+
     Parameters
     ----------
     file_path : str
@@ -29,4 +70,321 @@ def get_sheet_names(
     list[str]
         List of sheet names.
     """
+    if isinstance(file_path, (str, Path)) and Path(file_path).is_file():
+        suffix = Path(file_path).suffix.lower()
+        if suffix == r.DataFrameFormat.XLSX.value_with_dot:
+            import openpyxl
+
+            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            try:
+                return workbook.sheetnames
+            finally:
+                workbook.close()
+        if suffix == r.DataFrameFormat.XLS.value_with_dot:
+            import xlrd
+
+            workbook = xlrd.open_workbook(file_path, on_demand=True)
+            try:
+                return workbook.sheet_names()
+            finally:
+                workbook.release_resources()
+    import pandas as pd
+
     return pd.ExcelFile(file_path).sheet_names
+
+
+def read_table_preview(
+    file_path: Union[str, Path],
+    max_rows: int = PREVIEW_MAX_ROWS,
+    max_cols: Optional[int] = PREVIEW_MAX_COLS,
+    sheet_name: Union[str, int] = 0,
+) -> pd.DataFrame:
+    """Read only the first rows and columns of a table.
+
+    CSV and TXT files are read with ``nrows`` and ``usecols``, Parquet files by
+    reading the selected columns of the first row groups holding max_rows rows and
+    Excel sheets with ``nrows``.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the table file.
+    max_rows : int, optional
+        The number of rows to read (default is PREVIEW_MAX_ROWS).
+    max_cols : int, optional
+        The number of columns to read (default is PREVIEW_MAX_COLS). None reads all
+        columns.
+    sheet_name : str | int, optional
+        The sheet of an Excel file (default is 0, the first sheet).
+
+    Returns
+    -------
+    pd.DataFrame
+        The first max_rows rows of the first max_cols columns of the table.
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix in [
+        r.DataFrameFormat.CSV.value_with_dot,
+        r.DataFrameFormat.TXT.value_with_dot,
+    ]:
+        read_function = read_function_mapping[suffix]
+        if max_cols is None:
+            return read_function(file_path, nrows=max_rows)
+        n_cols = min(len(read_function(file_path, nrows=0).columns), max_cols)
+        return read_function(file_path, nrows=max_rows, usecols=range(n_cols))
+    if suffix == r.DataFrameFormat.PARQUET.value_with_dot:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file_path)
+        columns = parquet_file.schema_arrow.names[:max_cols]
+        row_groups = get_first_row_groups(parquet_file.metadata, max_rows)
+        if not row_groups:
+            return parquet_file.schema_arrow.empty_table().select(columns).to_pandas()
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+        return table.slice(0, max_rows).to_pandas()
+    df = read_function_mapping[suffix](file_path, sheet_name=sheet_name, nrows=max_rows)
+    return df.iloc[:, :max_cols]
+
+
+def get_first_row_groups(metadata, n_rows: int) -> list[int]:
+    """Get the indices of the first row groups of a Parquet file which hold n_rows
+    rows, or all its row groups if it has fewer rows.
+
+    Batches of the rows of a Parquet file may end at the end of a row group, so
+    reading row groups is the way to get n_rows rows without reading the others.
+
+    Parameters
+    ----------
+    metadata : pyarrow.parquet.FileMetaData
+        The metadata of the Parquet file.
+    n_rows : int
+        The number of rows to read.
+
+    Returns
+    -------
+    list[int]
+        The indices of the row groups to read.
+    """
+    row_groups = []
+    n_read = 0
+    for index in range(metadata.num_row_groups):
+        if n_read >= n_rows:
+            break
+        row_groups.append(index)
+        n_read += metadata.row_group(index).num_rows
+    return row_groups
+
+
+def get_table_shape(
+    file_path: Union[str, Path],
+    sheet_name: Union[str, int] = 0,
+    max_rows: Optional[int] = None,
+) -> tuple[Optional[int], Optional[int]]:
+    """Get the number of rows and columns of a table without loading its data.
+
+    The shape is read from the metadata of Parquet files and Excel sheets. For CSV and
+    TXT files, the records are counted with the csv module, without converting
+    their values, so that quoted values with line breaks are not counted as rows.
+    Blank lines are skipped, as by pandas.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the table file.
+    sheet_name : str | int, optional
+        The sheet of an Excel file (default is 0, the first sheet).
+    max_rows : int, optional
+        Stop counting the lines of CSV and TXT files after max_rows rows (default
+        is None, counting all of them). The number of rows is then None if the
+        table has more rows.
+
+    Returns
+    -------
+    tuple[Optional[int], Optional[int]]
+        The number of rows and columns, each None if it is not known.
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix in [
+        r.DataFrameFormat.CSV.value_with_dot,
+        r.DataFrameFormat.TXT.value_with_dot,
+    ]:
+        n_cols = len(read_function_mapping[suffix](file_path, nrows=0).columns)
+        delimiter = "\t" if suffix == r.DataFrameFormat.TXT.value_with_dot else ","
+        with open(file_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            records = (row for row in csv.reader(f, delimiter=delimiter) if row)
+            if max_rows is not None:
+                # the header and one record more than max_rows
+                records = itertools.islice(records, max_rows + 2)
+            try:
+                n_records = sum(1 for _ in records)
+            except csv.Error:
+                return None, n_cols
+        if max_rows is not None and n_records > max_rows + 1:
+            return None, n_cols
+        # without the header
+        return max(n_records - 1, 0), n_cols
+    if suffix == r.DataFrameFormat.PARQUET.value_with_dot:
+        import pyarrow.parquet as pq
+
+        metadata = pq.ParquetFile(file_path).metadata
+        return metadata.num_rows, len(metadata.schema.names)
+    if suffix in [
+        r.DataFrameFormat.XLS.value_with_dot,
+        r.DataFrameFormat.XLSX.value_with_dot,
+    ]:
+        shapes = get_sheet_shapes(file_path)
+        if isinstance(sheet_name, int):
+            sheet_name = list(shapes)[sheet_name]
+        return shapes[sheet_name]
+    return None, None
+
+
+def get_sheet_shapes(
+    file_path: Union[str, Path],
+) -> dict[str, tuple[Optional[int], Optional[int]]]:
+    """Get the number of rows and columns of each sheet of an Excel file.
+
+    The workbook is opened once and the shapes are read from the metadata of its
+    sheets, without loading their data.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the Excel file.
+
+    Returns
+    -------
+    dict[str, tuple[Optional[int], Optional[int]]]
+        The number of rows and columns of each sheet, by sheet name, each None if
+        it is not known.
+    """
+    if Path(file_path).suffix.lower() == r.DataFrameFormat.XLSX.value_with_dot:
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            return {
+                sheet.title: (
+                    (max(sheet.max_row - 1, 0), sheet.max_column)
+                    if sheet.max_row is not None and sheet.max_column is not None
+                    else (None, None)
+                )
+                for sheet in workbook.worksheets
+            }
+        finally:
+            workbook.close()
+    import xlrd
+
+    workbook = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        shapes = {}
+        for name in workbook.sheet_names():
+            sheet = workbook.sheet_by_name(name)
+            shapes[name] = (max(sheet.nrows - 1, 0), sheet.ncols)
+            workbook.unload_sheet(name)
+        return shapes
+    finally:
+        workbook.release_resources()
+
+
+def estimate_row_bytes(
+    file_path: Union[str, Path], sheet_name: Union[str, int] = 0, n_rows: int = 1000
+) -> float:
+    """Estimate the number of bytes a row of a table takes when embedded in a report.
+
+    The estimate is the mean size of the JSON records of the first rows of the
+    table, which is how interactive tables embed their data in HTML reports.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the table file.
+    sheet_name : str | int, optional
+        The sheet of an Excel file (default is 0, the first sheet).
+    n_rows : int, optional
+        The number of rows to sample (default is 1000).
+
+    Returns
+    -------
+    float
+        The mean number of bytes per row, 0 for an empty table.
+    """
+    sample = read_table_preview(
+        file_path, max_rows=n_rows, max_cols=None, sheet_name=sheet_name
+    )
+    if sample.empty:
+        return 0.0
+    n_bytes = len(sample.to_json(orient="values", date_format="iso").encode("utf-8"))
+    return n_bytes / len(sample)
+
+
+def write_table_sidecar(
+    file_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    sheet_name: Optional[str] = None,
+) -> Path:
+    """Write the full table as a compressed file next to a report.
+
+    CSV and TXT files are gzip-compressed as a stream, Parquet files are copied as
+    they are already compressed and Excel sheets are converted to Parquet. The
+    sidecar is named after the table file and the hash of its absolute path, so
+    that tables with the same file name in different folders get their own
+    sidecars. An existing sidecar newer than the table file is reused.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the table file.
+    output_dir : str | Path
+        The folder where the sidecar file is written.
+    sheet_name : str, optional
+        The sheet of an Excel file (default is None, the first sheet).
+
+    Returns
+    -------
+    Path
+        The path of the sidecar file.
+    """
+    file_path = Path(file_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    suffix = file_path.suffix.lower()
+    path_hash = hashlib.sha256(str(file_path.resolve()).encode("utf-8")).hexdigest()
+    stem = f"{file_path.stem}_{path_hash[:10]}"
+    if suffix in [
+        r.DataFrameFormat.CSV.value_with_dot,
+        r.DataFrameFormat.TXT.value_with_dot,
+    ]:
+        sidecar = output_dir / f"{stem}{file_path.suffix}.gz"
+    elif suffix == r.DataFrameFormat.PARQUET.value_with_dot:
+        sidecar = output_dir / f"{stem}{file_path.suffix}"
+    else:
+        if sheet_name is not None:
+            stem += f"_{sheet_name.replace(' ', '_')}"
+        sidecar = output_dir / f"{stem}.parquet"
+
+    if sidecar.exists() and sidecar.stat().st_mtime >= file_path.stat().st_mtime:
+        return sidecar
+    # Components sharing a table may write its sidecar from several threads, so
+    # each writes its own temporary file and moves it in place
+    tmp_file = output_dir / f".{sidecar.name}.{threading.get_ident()}.tmp"
+    try:
+        if sidecar.suffix == ".gz":
+            with open(file_path, "rb") as f_in, open(tmp_file, "wb") as f_tmp:
+                with gzip.GzipFile(
+                    filename=sidecar.name, mode="wb", fileobj=f_tmp
+                ) as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+        elif suffix == r.DataFrameFormat.PARQUET.value_with_dot:
+            shutil.copyfile(file_path, tmp_file)
+        else:
+            df = read_function_mapping[suffix](
+                file_path, sheet_name=0 if sheet_name is None else sheet_name
+            )
+            # Parquet needs string column names
+            df.columns = df.columns.astype(str)
+            df.to_parquet(tmp_file)
+        os.replace(tmp_file, sidecar)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return sidecar
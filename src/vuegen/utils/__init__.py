@@ -16,20 +16,30 @@ import textwrap
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from typing import Iterable, Optional, Type
+from typing import TYPE_CHECKING, Iterable, Optional, Type
 from urllib.parse import urlparse
 
-import networkx as nx
-import requests
 import yaml
-from bs4 import BeautifulSoup
 
 try:
     from enum import StrEnum
 except ImportError:
     from strenum import StrEnum
 
-from vuegen.constants import GITHUB_ORG_URL, LOGO_URL, ORG, REPO_URL, TIMEOUT
+from vuegen.constants import (
+    GITHUB_ORG_URL,
+    LOGO_URL,
+    ORG,
+    REPO_URL,
+    TABLE_MAX_BYTES,
+    TABLE_MAX_ROWS,
+    TIMEOUT,
+)
+
+from .remote import get_session
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 # CHECKS
@@ -130,6 +140,8 @@ def is_pyvis_html(filepath: str) -> bool:
         Returns False otherwise.
 
     """
+    from bs4 import BeautifulSoup
+
     # Parse the HTML file
     with open(filepath, "r", encoding="utf-8") as f:
         soup = BeautifulSoup(f, "html.parser")
@@ -315,10 +327,360 @@ def get_parser(prog_name: str, others: Optional[dict] = None) -> argparse.Namesp
             "Ignored if a config file is provided."
         ),
     )
+    parser.add_argument(
+        "-prefetch",
+        "--prefetch_remote",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Download files of components given as URLs into the static folder of "
+            "the report, instead of fetching them when the report is viewed."
+        ),
+    )
+    parser.add_argument(
+        "-prerender",
+        "--prerender_static",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Render the images of plots and tables of static reports (pdf, docx, odt,"
+            " pptx) in parallel before running Quarto, skipping unchanged images."
+        ),
+    )
+    parser.add_argument(
+        "-rowcount",
+        "--table_row_count",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Show the number of rows and columns of each table below its snapshot in"
+            " static reports (pdf, docx, odt, pptx), counting the rows of CSV and TXT"
+            " files. Truncated snapshots always get a note."
+        ),
+    )
+    parser.add_argument(
+        "-maxrows",
+        "--table_max_rows",
+        type=int,
+        default=TABLE_MAX_ROWS,
+        help=(
+            "Maximum number of rows of a table embedded in interactive Quarto reports"
+            " (html, revealjs, jupyter). Larger tables are truncated and linked as a"
+            " compressed file. 0 disables the limit."
+        ),
+    )
+    parser.add_argument(
+        "-maxbytes",
+        "--table_max_bytes",
+        type=int,
+        default=TABLE_MAX_BYTES,
+        help=(
+            "Maximum estimated size in bytes of the data of a table embedded in"
+            " interactive Quarto reports. 0 disables the limit."
+        ),
+    )
+    parser.add_argument(
+        "-project",
+        "--quarto_project",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Generate html reports as a Quarto website with one page per section."
+            " Only the pages which changed since the last build are rendered again,"
+            " several at a time."
+        ),
+    )
+    parser.add_argument(
+        "-profchunks",
+        "--profile_chunks",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Time each chunk when Quarto renders the report and write the wall time"
+            " of the chunks to render_profile.txt, slowest first."
+        ),
+    )
+    parser.add_argument(
+        "-profmem",
+        "--profile_memory",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Also record the peak memory of each chunk timed with --profile_chunks."
+            " Tracing the memory slows down the chunks."
+        ),
+    )
+    parser.add_argument(
+        "-exec",
+        "--execute_notebooks",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help="Execute the notebooks of jupyter reports.",
+    )
+    parser.add_argument(
+        "-dedup",
+        "--dedup_assets",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Ship the JavaScript and CSS libraries of the networks and HTML files of"
+            " html and revealjs reports once in the static folder, instead of one"
+            " copy per file."
+        ),
+    )
+    parser.add_argument(
+        "-pdfengine",
+        "--pdf_engine",
+        type=str,
+        choices=["latex", "typst"],
+        default="latex",
+        help=(
+            "Engine to render pdf reports: latex, or typst, which needs no TeX"
+            " installation and renders faster."
+        ),
+    )
+    parser.add_argument(
+        "-imgdpi",
+        "--image_dpi",
+        type=int,
+        default=None,
+        help="Resolution in dpi of the plot and table images of static reports.",
+    )
+    parser.add_argument(
+        "-imgsize",
+        "--image_max_size",
+        type=int,
+        default=None,
+        help=(
+            "Maximum width and height in pixels of the images of static reports."
+            " Larger images are downscaled."
+        ),
+    )
+    parser.add_argument(
+        "-imgformat",
+        "--image_format",
+        type=str,
+        choices=["png", "jpeg"],
+        default=None,
+        help="File format of the images of static reports (default is png).",
+    )
+    parser.add_argument(
+        "-profile",
+        "--profile",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Record the time of each build stage and component and write them to"
+            " build_profile.json and, as a Chrome trace, to build_trace.json in the"
+            " report folder."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of threads generating the components of the report, e.g."
+            " reading tables and networks and writing their static files. The"
+            " report is the same as with one thread."
+        ),
+    )
+    parser.add_argument(
+        "-stream",
+        "--stream",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Parse, generate and write the sections one at a time, so that very"
+            " large reports are built with little memory."
+        ),
+    )
+    parser.add_argument(
+        "-static_store",
+        "--static_store",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Name the static files of the components after the hash of their"
+            " content and settings, writing identical files once and reusing those"
+            " of previous builds."
+        ),
+    )
+    parser.add_argument(
+        "-skip_val",
+        "--skip_validation",
+        action="store_true",  # Automatically sets True if the flag is passed
+        default=False,
+        help=(
+            "Do not check the whole configuration before building the report. By"
+            " default, all its problems are reported together before any work."
+        ),
+    )
     # Parse arguments
     return parser
 
 
+def get_batch_parser(prog_name: str) -> argparse.ArgumentParser:
+    """
+    Initiates the argparse.ArgumentParser() of the batch command, which builds the
+    reports listed in a manifest file.
+
+    Parameters
+    ----------
+    prog_name : str
+        The name of the program.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser of the batch command.
+    """
+    assert isinstance(prog_name, str), f"prog_name should be a string: {prog_name}"
+    parser = argparse.ArgumentParser(
+        prog=f"{prog_name} batch",
+        description="Build the reports listed in a YAML manifest file.",
+    )
+    parser.add_argument(
+        "manifest",
+        type=str,
+        help="Path to the YAML manifest listing the reports to build.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Number of reports built at the same time in worker processes. Defaults"
+            " to the 'jobs' setting of the manifest, or 1."
+        ),
+    )
+    return parser
+
+
+def get_serve_parser(prog_name: str) -> argparse.ArgumentParser:
+    """
+    Initiates the argparse.ArgumentParser() of the serve command, which runs a local
+    service building reports on demand.
+
+    Parameters
+    ----------
+    prog_name : str
+        The name of the program.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser of the serve command.
+    """
+    assert isinstance(prog_name, str), f"prog_name should be a string: {prog_name}"
+    parser = argparse.ArgumentParser(
+        prog=f"{prog_name} serve",
+        description=(
+            "Run a local HTTP service which builds the reports of the jobs it is sent"
+            " in warm worker processes. Send jobs with POST /jobs and follow them"
+            " with GET /jobs/<id>."
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help=(
+            "Address to listen on. Defaults to 127.0.0.1, only local clients. Other"
+            " addresses need a --token."
+        ),
+    )
+    parser.add_argument(
+        "--token",
+        type=str,
+        default=os.environ.get("VUEGEN_SERVE_TOKEN"),
+        help=(
+            "Token which the requests send in their 'Authorization: Bearer <token>'"
+            " header. Defaults to the VUEGEN_SERVE_TOKEN environment variable, or a"
+            " random token which is logged when the service starts."
+        ),
+    )
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to listen on. Defaults to 8765.",
+    )
+    parser.add_argument(
+        "-output_dir",
+        "--output_directory",
+        type=str,
+        default=".",
+        help=(
+            "Folder in which the folder of each job is created. Defaults to the"
+            " current directory."
+        ),
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=2,
+        help="Number of reports built at the same time in worker processes.",
+    )
+    parser.add_argument(
+        "--max_queued",
+        type=int,
+        default=100,
+        help=(
+            "Number of reports which may wait for a worker. Further jobs are refused"
+            " until the queue shrinks."
+        ),
+    )
+    return parser
+
+
+def get_validate_parser(prog_name: str) -> argparse.ArgumentParser:
+    """
+    Initiates the argparse.ArgumentParser() of the validate command, which checks a
+    configuration file without building the report.
+
+    Parameters
+    ----------
+    prog_name : str
+        The name of the program.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser of the validate command.
+    """
+    assert isinstance(prog_name, str), f"prog_name should be a string: {prog_name}"
+    parser = argparse.ArgumentParser(
+        prog=f"{prog_name} validate",
+        description=(
+            "Check a YAML configuration file and list all its problems, e.g. missing"
+            " files, invalid values or colliding titles, without building the report."
+            " File paths are resolved from the current directory."
+        ),
+    )
+    parser.add_argument(
+        "config",
+        type=str,
+        help="Path to the YAML configuration file.",
+    )
+    parser.add_argument(
+        "-rt",
+        "--report_type",
+        type=str,
+        default=None,
+        help=(
+            "Type of the report to check the configuration for. Titles giving two"
+            " pages the same name are only problems of streamlit reports. By default,"
+            " they are checked too."
+        ),
+    )
+    return parser
+
+
 def fetch_file_stream(file_path: str, timeout: int = TIMEOUT) -> StringIO:
     """
     Fetches a file-like stream from a given file path or URL.
@@ -342,13 +704,15 @@ def fetch_file_stream(file_path: str, timeout: int = TIMEOUT) -> StringIO:
     ValueError
         If an error occurs while fetching content from a URL.
     """
+    import requests
+
     # Assert that the file_path is a string
     assert isinstance(file_path, str), f"File path must be a string: {file_path}"
 
     if is_url(file_path):
         # Handle URL input
         try:
-            response = requests.get(file_path, timeout=timeout)
+            response = get_session().get(file_path, timeout=timeout)
             response.raise_for_status()  # Raise an exception for HTTP errors
             return StringIO(response.text)
         except requests.exceptions.RequestException as e:
@@ -396,6 +760,8 @@ def cyjs_to_networkx(file_path: str, name: str = "name", ident: str = "id") -> n
         If the data format is invalid or missing required elements, such as 'id'
         or 'name' for nodes.
     """
+    import networkx as nx
+
     try:
         # If file_path is a file-like object (e.g., StringIO), read from it
         if hasattr(file_path, "read"):
@@ -477,6 +843,9 @@ def pyvishtml_to_networkx(html_file: str) -> nx.Graph:
         If the HTML file does not contain the expected network data,
         or if nodes lack 'id' attribute.
     """
+    import networkx as nx
+    from bs4 import BeautifulSoup
+
     # Load the HTML file
     if isinstance(html_file, StringIO):
         # If the input is a StringIO, read its content
@@ -0,0 +1,268 @@
+"""Shared JavaScript and CSS assets of the HTML files embedded in a report. Each
+library referenced by the network views and HTML components is saved once in the
+static folder and all files point to that copy, instead of every file loading (or,
+in self-contained reports, inlining) its own copy."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+from urllib.parse import urlparse
+
+from vuegen.constants import TIMEOUT
+from vuegen.utils.remote import get_session
+
+# Folder (inside the static folder) with the shared assets
+ASSETS_DIR = "lib"
+# Sizes of the HTML files and assets, with and without sharing the assets
+ASSET_REPORT_FILE = "asset_report.json"
+
+# The vis-network files of the CDN used by PyVis are also bundled with PyVis
+_VIS_NETWORK_CDN = re.compile(
+    r"/vis-network/(?P<version>[\d.]+)/.*vis-network\.min\.(?P<ext>js|css)$"
+)
+
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_ASSET_TAG = re.compile(r"<(?:script|link)\b[^>]*>", re.IGNORECASE)
+_ASSET_URL = re.compile(r"""\b(?:src|href)\s*=\s*(["'])(?P<url>[^"']+)\1""")
+_STYLESHEET = re.compile(r"""\brel\s*=\s*["']?stylesheet""", re.IGNORECASE)
+_INTEGRITY = re.compile(
+    r"""\s+(?:integrity|crossorigin)\s*=\s*(["'])[^"']*\1""", re.IGNORECASE
+)
+
+
+def _pyvis_lib_dir() -> Path:
+    """Folder of the assets bundled with PyVis."""
+    import pyvis
+
+    return Path(pyvis.__file__).resolve().parent / "lib"
+
+
+class AssetStore:
+    """
+    Shared copies of the scripts and stylesheets referenced by HTML files.
+
+    Parameters
+    ----------
+    static_dir : str | Path
+        The static folder of the report. Assets are saved in its ASSETS_DIR
+        subfolder.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+    timeout : int, optional
+        The timeout in seconds of the downloads (default is TIMEOUT).
+
+    Attributes
+    ----------
+    html_files : dict[str, int]
+        The size in bytes of each rewritten HTML file, by path relative to the
+        static folder.
+    references : dict[str, int]
+        The number of HTML files referencing each shared asset.
+    """
+
+    def __init__(
+        self,
+        static_dir: Union[str, Path],
+        logger: logging.Logger,
+        timeout: int = TIMEOUT,
+    ):
+        self.directory = Path(static_dir) / ASSETS_DIR
+        self.logger = logger
+        self.timeout = timeout
+        self.html_files: Dict[str, int] = {}
+        self.references: Dict[str, int] = {}
+        # asset URL or local file -> shared copy, or None if it could not be saved
+        self._assets: Dict[str, Optional[Path]] = {}
+        # HTML files may be localized from several threads at once
+        self._lock = threading.Lock()
+
+    def _destination(self, url: str) -> Path:
+        """Path of the shared copy of an asset, readable and unique per URL."""
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https"):
+            return self.directory / parsed.netloc / parsed.path.lstrip("/")
+        return self.directory / Path(url).relative_to(ASSETS_DIR)
+
+    def _save(self, url: str, source_dir: Path) -> Optional[Path]:
+        """Save an asset in the shared folder, once per URL or local file."""
+        with self._lock:
+            return self._save_unlocked(url, source_dir)
+
+    def _save_unlocked(self, url: str, source_dir: Path) -> Optional[Path]:
+        parsed = urlparse(url)
+        key = url if parsed.scheme else (source_dir / url).resolve().as_posix()
+        if key in self._assets:
+            return self._assets[key]
+
+        fpath = None
+        if parsed.scheme in ("http", "https"):
+            fpath = self._destination(url)
+            vis_network = _VIS_NETWORK_CDN.search(parsed.path)
+            bundled = None
+            if vis_network:
+                bundled = _pyvis_lib_dir() / f"vis-{vis_network['version']}"
+                bundled /= (
+                    "vis-network.min.js"
+                    if vis_network["ext"] == "js"
+                    else "vis-network.css"
+                )
+            if fpath.exists():
+                pass
+            elif bundled is not None and bundled.exists():
+                fpath.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(bundled, fpath)
+            else:
+                import requests
+
+                try:
+                    response = get_session().get(url, timeout=self.timeout)
+                    response.raise_for_status()
+                except requests.exceptions.RequestException as e:
+                    self.logger.warning(
+                        "Could not download asset %s, keeping the URL: %s", url, e
+                    )
+                    fpath = None
+                else:
+                    fpath.parent.mkdir(parents=True, exist_ok=True)
+                    fpath.write_bytes(response.content)
+        elif not parsed.scheme and not url.startswith(("/", "#")):
+            # Relative paths are resolved next to the HTML file and, for the 'lib'
+            # folder that PyVis expects next to its files, in the PyVis package
+            source = source_dir / url
+            if not source.exists() and Path(url).parts[0] == ASSETS_DIR:
+                source = _pyvis_lib_dir().parent / url
+            if source.is_file():
+                if Path(url).parts[0] == ASSETS_DIR:
+                    fpath = self._destination(url)
+                else:
+                    digest = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+                    fpath = self.directory / f"{digest}_{source.name}"
+                if not fpath.exists():
+                    fpath.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(source, fpath)
+
+        if fpath is not None:
+            self.logger.debug("Shared asset %s saved as: %s", url, fpath)
+        self._assets[key] = fpath
+        return fpath
+
+    def localize_html(
+        self,
+        html_file: Union[str, Path],
+        output_file: Optional[Union[str, Path]] = None,
+    ) -> Path:
+        """
+        Point the scripts and stylesheets of an HTML file to the shared assets.
+        Integrity attributes of the rewritten tags are dropped, as the files are
+        served from the report folder. Assets which cannot be saved keep their URL.
+
+        Parameters
+        ----------
+        html_file : str | Path
+            The HTML file to rewrite.
+        output_file : str | Path, optional
+            Where to write the rewritten file (default is None, overwriting
+            html_file).
+
+        Returns
+        -------
+        Path
+            The rewritten HTML file.
+        """
+        html_file = Path(html_file)
+        output_file = Path(output_file) if output_file is not None else html_file
+        html = html_file.read_text(encoding="utf-8")
+        referenced = set()
+
+        def rewrite_tag(tag: re.Match) -> str:
+            match = _ASSET_URL.search(tag.group(0))
+            if match is None or match["url"].startswith("data:"):
+                return tag.group(0)
+            if tag.group(0)[1:5].lower() == "link" and not _STYLESHEET.search(
+                tag.group(0)
+            ):
+                return tag.group(0)
+            fpath = self._save(match["url"], html_file.parent)
+            if fpath is None:
+                return tag.group(0)
+            referenced.add(fpath)
+            rel_path = Path(os.path.relpath(fpath, output_file.parent)).as_posix()
+            new_tag = (
+                tag.group(0)[: match.start("url")]
+                + rel_path
+                + tag.group(0)[match.end("url") :]
+            )
+            return _INTEGRITY.sub("", new_tag)
+
+        # Commented out tags are left as they are
+        parts = []
+        position = 0
+        for comment in _COMMENT.finditer(html):
+            parts.append(_ASSET_TAG.sub(rewrite_tag, html[position : comment.start()]))
+            parts.append(comment.group(0))
+            position = comment.end()
+        parts.append(_ASSET_TAG.sub(rewrite_tag, html[position:]))
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text("".join(parts), encoding="utf-8")
+        html_name = Path(os.path.relpath(output_file, self.directory.parent))
+        with self._lock:
+            self.html_files[html_name.as_posix()] = output_file.stat().st_size
+            for fpath in referenced:
+                key = fpath.relative_to(self.directory).as_posix()
+                self.references[key] = self.references.get(key, 0) + 1
+        return output_file
+
+    def write_report(self, output_file: Optional[Union[str, Path]] = None) -> dict:
+        """
+        Write the sizes of the HTML files and of the shared assets, compared with
+        every HTML file carrying its own copy of the assets it references.
+
+        Parameters
+        ----------
+        output_file : str | Path, optional
+            The JSON file to write (default is ASSET_REPORT_FILE in the assets
+            folder).
+
+        Returns
+        -------
+        dict
+            The size report, with the total bytes before and after sharing.
+        """
+        if output_file is None:
+            output_file = self.directory / ASSET_REPORT_FILE
+        assets = {
+            name: {
+                "bytes": (self.directory / name).stat().st_size,
+                "references": count,
+            }
+            for name, count in sorted(self.references.items())
+        }
+        html_bytes = sum(self.html_files.values())
+        report = {
+            "html_files": dict(sorted(self.html_files.items())),
+            "assets": assets,
+            "bytes_before": html_bytes
+            + sum(asset["bytes"] * asset["references"] for asset in assets.values()),
+            "bytes_after": html_bytes
+            + sum(asset["bytes"] for asset in assets.values()),
+        }
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        self.logger.info(
+            "Shared %d asset(s) of %d HTML file(s): %.1f MiB instead of %.1f MiB"
+            " with one copy per file. Size report: %s",
+            len(assets),
+            len(self.html_files),
+            report["bytes_after"] / 2**20,
+            report["bytes_before"] / 2**20,
+            output_file,
+        )
+        return report
@@ -0,0 +1,131 @@
+"""Helpers to prepare figure files (e.g. Plotly JSON) once at build time, so that the
+generated reports can load them without further processing."""
+
+import base64
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Plotly JSON sections which are needed to render a figure
+PLOTLY_FIGURE_KEYS = ("data", "layout")
+
+# Shortest numeric array worth encoding as a typed array
+TYPED_ARRAY_MIN_LENGTH = 8
+
+# Integer dtypes supported by plotly.js typed arrays, from smallest to largest
+_TYPED_ARRAY_INT_DTYPES = ("i1", "u1", "i2", "u2", "i4", "u4")
+
+
+def plotly_supports_typed_arrays() -> bool:
+    """Check if the installed Plotly version accepts typed array specs in figures.
+
+    Plotly.py >= 6.0 validates (and plotly.js >= 2.28 renders) numeric arrays given as
+    ``{"dtype": ..., "bdata": ...}`` objects.
+
+    Returns
+    -------
+    bool
+        True if typed array specs are accepted by the installed Plotly version.
+    """
+    try:
+        from _plotly_utils import basevalidators
+    except ImportError:
+        return False
+    return hasattr(basevalidators, "is_typed_array_spec")
+
+
+def _to_typed_array(values: list) -> Union[list, dict]:
+    """Encode a flat list of numbers as a base64 typed array spec.
+
+    Lists which are too short or which contain other values than numbers (strings,
+    booleans, None, nested lists) are returned unchanged.
+    """
+    if len(values) < TYPED_ARRAY_MIN_LENGTH or not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+    ):
+        return values
+
+    import numpy as np
+
+    arr = np.asarray(values)
+    dtype = "f8"
+    if arr.dtype.kind == "i":
+        for int_dtype in _TYPED_ARRAY_INT_DTYPES:
+            info = np.iinfo(int_dtype)
+            if arr.min() >= info.min and arr.max() <= info.max:
+                dtype = int_dtype
+                break
+    # plotly.js expects little-endian buffers
+    bdata = arr.astype(np.dtype(dtype).newbyteorder("<")).tobytes()
+    return {"dtype": dtype, "bdata": base64.b64encode(bdata).decode("ascii")}
+
+
+def _encode_typed_arrays(obj: Any) -> Any:
+    """Recursively replace numeric arrays in a trace by typed array specs."""
+    if isinstance(obj, dict):
+        return {key: _encode_typed_arrays(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        if obj and all(isinstance(v, dict) for v in obj):
+            return [_encode_typed_arrays(v) for v in obj]
+        return _to_typed_array(obj)
+    return obj
+
+
+def compact_plotly_json(plot_json: dict, typed_arrays: bool = False) -> dict:
+    """
+    Reduce a Plotly figure JSON to what is needed for rendering it.
+
+    Only the 'data' and 'layout' sections are kept and the 'frame' entries of the
+    traces are removed (e.g. present in figures exported from R).
+
+    Parameters
+    ----------
+    plot_json : dict
+        The Plotly figure as loaded from a JSON file.
+    typed_arrays : bool, optional
+        Whether to encode numeric arrays of the traces using Plotly's compact
+        typed array encoding (default is False).
+
+    Returns
+    -------
+    dict
+        The reduced Plotly figure.
+    """
+    figure = {key: plot_json[key] for key in PLOTLY_FIGURE_KEYS if key in plot_json}
+    figure["data"] = [
+        {k: v for k, v in entry.items() if k != "frame"}
+        for entry in figure.get("data", [])
+    ]
+    if typed_arrays:
+        figure["data"] = [_encode_typed_arrays(entry) for entry in figure["data"]]
+    return figure
+
+
+def write_compact_plotly_json(
+    plot_json: dict, output_file: Union[str, Path], typed_arrays: Optional[bool] = None
+) -> Path:
+    """
+    Write a compact version of a Plotly figure JSON to a file.
+
+    Parameters
+    ----------
+    plot_json : dict
+        The Plotly figure as loaded from a JSON file.
+    output_file : str | Path
+        The path where the compact JSON file should be saved.
+    typed_arrays : bool, optional
+        Whether to use Plotly's typed array encoding. If None (default), it is used
+        when supported by the installed Plotly version.
+
+    Returns
+    -------
+    Path
+        The path to the written file.
+    """
+    if typed_arrays is None:
+        typed_arrays = plotly_supports_typed_arrays()
+    figure = compact_plotly_json(plot_json, typed_arrays=typed_arrays)
+    output_file = Path(output_file)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(figure, f, separators=(",", ":"))
+    return output_file
@@ -0,0 +1,213 @@
+"""Resolution, size and compression of the images of static reports (PDF, DOCX, ODT,
+PPTX). Images are rendered as PNG at the configured resolution and then downscaled,
+optimized or converted to JPEG with Pillow, so that their size follows what is
+shown in the report."""
+
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Optional, Union
+
+# Formats supported by LaTeX, Typst and the office formats alike
+IMAGE_FORMATS = ("png", "jpeg")
+# Plotly and Altair figures are laid out in CSS pixels, i.e. at 96 dpi
+SCREEN_DPI = 96
+
+# Code of the function which downscales and re-encodes an image. It is written to
+# the chunks of static reports which render Plotly and Altair figures, so that
+# rendering them does not require vuegen, and defines postprocess_image below.
+POSTPROCESS_IMAGE_CODE = """\
+def _vuegen_postprocess_image(
+    input_file,
+    output_file,
+    max_size=None,
+    format="png",
+    quality=85,
+    optimize=False,
+    keep_input=False,
+):
+    from pathlib import Path
+
+    from PIL import Image
+
+    input_file, output_file = Path(input_file), Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with Image.open(input_file) as image:
+        image.load()
+    if max_size is not None and max(image.size) > max_size:
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    if format == "jpeg":
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(output_file, "JPEG", quality=quality, optimize=True)
+    else:
+        image.save(
+            output_file, "PNG", optimize=optimize, compress_level=9 if optimize else 6
+        )
+    if not keep_input and output_file.resolve() != input_file.resolve():
+        input_file.unlink()
+    return output_file.as_posix()
+"""
+# Name of the function defined by POSTPROCESS_IMAGE_CODE
+POSTPROCESS_IMAGE_FUNCTION = "_vuegen_postprocess_image"
+_HELPERS: dict = {}
+exec(POSTPROCESS_IMAGE_CODE, _HELPERS)
+
+
+@dataclass(frozen=True)
+class ImageSettings:
+    """
+    How the static images of a report are rendered and saved.
+
+    Attributes
+    ----------
+    dpi : int, optional
+        The resolution of rendered images (default is None, the default of each
+        renderer: 300 dpi for networks and one pixel per CSS pixel for Plotly and
+        Altair figures).
+    max_size : int, optional
+        The maximum width and height in pixels. Larger images are downscaled,
+        keeping their aspect ratio (default is None, no limit).
+    format : str, optional
+        The file format, one of IMAGE_FORMATS (default is "png").
+    quality : int, optional
+        The quality of JPEG images from 1 to 95 (default is 85).
+    optimize : bool, optional
+        Whether to compress PNG images with the best zlib compression, which is
+        slower to write (default is False).
+    """
+
+    dpi: Optional[int] = None
+    max_size: Optional[int] = None
+    format: str = "png"
+    quality: int = 85
+    optimize: bool = False
+
+    def __post_init__(self):
+        if self.format == "jpg":
+            object.__setattr__(self, "format", "jpeg")
+        if self.format not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Invalid image format: {self.format}. Supported formats are:"
+                f" {', '.join(IMAGE_FORMATS)}."
+            )
+        for name in ["dpi", "max_size"]:
+            value = getattr(self, name)
+            if value is not None and (not isinstance(value, int) or value <= 0):
+                raise ValueError(f"Image {name} must be a positive integer: {value}.")
+        if not 1 <= self.quality <= 95:
+            raise ValueError(f"Image quality must be between 1 and 95: {self.quality}.")
+
+    def merge(self, overrides: Optional[dict]) -> "ImageSettings":
+        """
+        Get a copy of the settings with some of them replaced.
+
+        Parameters
+        ----------
+        overrides : dict, optional
+            The settings to replace, e.g. those of a component. None values are
+            ignored.
+
+        Returns
+        -------
+        ImageSettings
+            The merged settings.
+
+        Raises
+        ------
+        ValueError
+            If a setting is unknown or invalid.
+        """
+        if not overrides:
+            return self
+        if not isinstance(overrides, dict):
+            raise ValueError(f"Image settings must be a mapping: {overrides}.")
+        names = {f.name for f in fields(self)}
+        unknown = set(overrides) - names
+        if unknown:
+            raise ValueError(
+                f"Unknown image settings: {', '.join(sorted(unknown))}. Valid settings"
+                f" are: {', '.join(sorted(names))}."
+            )
+        return replace(
+            self,
+            **{key: value for key, value in overrides.items() if value is not None},
+        )
+
+    @property
+    def suffix(self) -> str:
+        """The file extension of the images."""
+        return ".jpg" if self.format == "jpeg" else ".png"
+
+    @property
+    def scale(self) -> Optional[float]:
+        """The scale of Plotly and Altair figures for the dpi, if set."""
+        return None if self.dpi is None else self.dpi / SCREEN_DPI
+
+    @property
+    def needs_postprocessing(self) -> bool:
+        """Whether rendered PNG images have to be downscaled or re-encoded."""
+        return self.max_size is not None or self.format != "png" or self.optimize
+
+    def postprocess_kwargs(self) -> dict:
+        """The arguments of postprocess_image for these settings."""
+        kwargs = asdict(self)
+        del kwargs["dpi"]
+        return kwargs
+
+
+def postprocess_image(
+    input_file: Union[str, Path],
+    output_file: Optional[Union[str, Path]] = None,
+    max_size: Optional[int] = None,
+    format: str = "png",
+    quality: int = 85,
+    optimize: bool = False,
+    keep_input: bool = False,
+) -> str:
+    """
+    Downscale an image to a maximum size and save it as PNG or JPEG. Transparent
+    areas become white in JPEG images.
+
+    Parameters
+    ----------
+    input_file : str | Path
+        The image to process.
+    output_file : str | Path, optional
+        The image to write (default is None, the input file with the extension of
+        the format).
+    max_size : int, optional
+        The maximum width and height in pixels (default is None, no limit).
+    format : str, optional
+        The file format, one of IMAGE_FORMATS (default is "png").
+    quality : int, optional
+        The quality of JPEG images (default is 85).
+    optimize : bool, optional
+        Whether to use the best zlib compression for PNG images (default is False).
+    keep_input : bool, optional
+        Whether to keep the input file, e.g. an image of the user, if it differs
+        from the output file (default is False).
+
+    Returns
+    -------
+    str
+        The path of the written image.
+    """
+    settings = ImageSettings(
+        max_size=max_size, format=format, quality=quality, optimize=optimize
+    )
+    if output_file is None:
+        output_file = Path(input_file).with_suffix(settings.suffix)
+    return _HELPERS[POSTPROCESS_IMAGE_FUNCTION](
+        input_file,
+        output_file,
+        max_size=max_size,
+        format=settings.format,
+        quality=quality,
+        optimize=optimize,
+        keep_input=keep_input,
+    )
@@ -0,0 +1,149 @@
+"""Load the configuration of large reports without parsing all sections at once.
+
+The list of sections of a YAML configuration file is replaced by a LazyYamlList,
+which parses one section at a time each time it is iterated. Only the section being
+generated is in memory, instead of the whole configuration and the YAML node tree it
+is built from. The events are parsed with libyaml when PyYAML was built with it.
+"""
+
+from pathlib import Path
+from typing import Iterator, Union
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+if getattr(yaml, "__with_libyaml__", False):
+    from yaml.cyaml import CParser
+
+    class _Loader(CParser, Composer, SafeConstructor, Resolver):
+        """Safe loader composing nodes one at a time from the events of libyaml."""
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+else:
+    _Loader = yaml.SafeLoader
+
+
+def _iter_keys(loader: _Loader) -> Iterator[str]:
+    """Iterate over the keys of the top-level mapping of a YAML document. The loader
+    is left at the value of each key, which must be consumed before the next one."""
+    loader.get_event()  # stream start
+    if loader.check_event(yaml.StreamEndEvent):
+        return
+    loader.get_event()  # document start
+    if not loader.check_event(yaml.MappingStartEvent):
+        raise ValueError("The YAML configuration must be a mapping.")
+    loader.get_event()
+    while not loader.check_event(yaml.MappingEndEvent):
+        yield _load_node(loader)
+
+
+def _load_node(loader: _Loader):
+    """Compose and construct the next node of the loader."""
+    return loader.construct_document(loader.compose_node(None, None))
+
+
+def _skip_node(loader: _Loader) -> None:
+    """Consume the events of the next node of the loader without composing it."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+class LazyYamlList:
+    """
+    A top-level list of a YAML file, parsed one item at a time each time it is
+    iterated.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The YAML file.
+    key : str
+        The top-level key of the list.
+    """
+
+    def __init__(self, file_path: Union[str, Path], key: str):
+        self.file_path = Path(file_path)
+        self.key = key
+
+    def __iter__(self) -> Iterator:
+        with open(self.file_path, "r", encoding="utf-8") as file:
+            loader = _Loader(file)
+            try:
+                for key in _iter_keys(loader):
+                    if key != self.key:
+                        _skip_node(loader)
+                        continue
+                    if not loader.check_event(yaml.SequenceStartEvent):
+                        _skip_node(loader)
+                        return
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield _load_node(loader)
+                    return
+            finally:
+                loader.dispose()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.file_path.as_posix()!r}, {self.key!r})"
+
+
+def load_yaml_config_lazily(file_path: Union[str, Path], key: str = "sections") -> dict:
+    """
+    Load a YAML configuration file except for one top-level list, which is parsed
+    one item at a time when it is iterated.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the YAML configuration file.
+    key : str, optional
+        The top-level key of the list to parse lazily (default is "sections").
+
+    Returns
+    -------
+    config : dict
+        The contents of the YAML file, with a LazyYamlList under key if the file
+        has this key.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist at the specified path.
+    ValueError
+        If there is an error parsing the YAML file.
+    """
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"The config file at {file_path} was not found.")
+
+    config = {}
+    with open(file_path, "r", encoding="utf-8") as file:
+        loader = _Loader(file)
+        try:
+            for name in _iter_keys(loader):
+                if name == key:
+                    _skip_node(loader)
+                    config[name] = LazyYamlList(file_path, key)
+                else:
+                    config[name] = _load_node(loader)
+        except yaml.YAMLError as exc:
+            raise ValueError("Error parsing YAML file.") from exc
+        finally:
+            loader.dispose()
+    return config
@@ -0,0 +1,142 @@
+"""Build Jupyter notebooks directly from the generated qmd files, without rendering
+them with Quarto, and optionally execute them with nbclient."""
+
+from __future__ import annotations
+
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Union
+
+if TYPE_CHECKING:
+    import nbformat
+
+# Time in seconds a cell may run when a notebook is executed
+CELL_TIMEOUT: int = 600
+
+KERNELSPEC = {"display_name": "Python 3", "language": "python", "name": "python3"}
+
+_FRONT_MATTER = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+_PYTHON_CHUNK = re.compile(
+    r"^```\{python\}\n(.*?)^```[ \t]*$", re.DOTALL | re.MULTILINE
+)
+
+
+def qmd_to_notebook(qmd_text: str) -> nbformat.NotebookNode:
+    """
+    Convert the text of a qmd file to a notebook, like `quarto convert`: the YAML
+    header becomes a raw cell, the Python chunks code cells (keeping their options)
+    and the text between them markdown cells.
+
+    Parameters
+    ----------
+    qmd_text : str
+        The text of the qmd file.
+
+    Returns
+    -------
+    nbformat.NotebookNode
+        The notebook, not executed.
+    """
+    import nbformat
+
+    cells = []
+    front_matter = _FRONT_MATTER.match(qmd_text)
+    if front_matter:
+        cells.append(nbformat.v4.new_raw_cell(front_matter.group(0).strip()))
+        qmd_text = qmd_text[front_matter.end() :]
+
+    def add_markdown(text: str) -> None:
+        text = text.strip("\n")
+        if text.strip():
+            cells.append(nbformat.v4.new_markdown_cell(text))
+
+    position = 0
+    for chunk in _PYTHON_CHUNK.finditer(qmd_text):
+        add_markdown(qmd_text[position : chunk.start()])
+        cells.append(nbformat.v4.new_code_cell(chunk.group(1).strip("\n")))
+        position = chunk.end()
+    add_markdown(qmd_text[position:])
+
+    notebook = nbformat.v4.new_notebook(cells=cells)
+    notebook.metadata["kernelspec"] = KERNELSPEC
+    notebook.metadata["language_info"] = {"name": "python"}
+    return notebook
+
+
+def execute_notebook(
+    notebook_path: Union[str, Path], timeout: int = CELL_TIMEOUT
+) -> str:
+    """
+    Execute a notebook in its folder and save it with its outputs. Runs in a worker
+    process.
+
+    Parameters
+    ----------
+    notebook_path : str | Path
+        Path to the notebook.
+    timeout : int, optional
+        The time in seconds a cell may run (default is CELL_TIMEOUT).
+
+    Returns
+    -------
+    str
+        The path of the executed notebook.
+    """
+    import nbformat
+    from nbclient import NotebookClient
+
+    notebook_path = Path(notebook_path)
+    notebook = nbformat.read(notebook_path, as_version=4)
+    NotebookClient(
+        notebook,
+        timeout=timeout,
+        kernel_name=KERNELSPEC["name"],
+        resources={"metadata": {"path": str(notebook_path.parent)}},
+    ).execute()
+    nbformat.write(notebook, notebook_path)
+    return str(notebook_path)
+
+
+def execute_notebooks(
+    notebook_paths: List[Union[str, Path]],
+    logger: logging.Logger,
+    max_workers: Optional[int] = None,
+    timeout: int = CELL_TIMEOUT,
+) -> None:
+    """
+    Execute notebooks in a process pool, each with its own kernel.
+
+    Parameters
+    ----------
+    notebook_paths : list[str | Path]
+        Paths to the notebooks.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+    max_workers : int, optional
+        The maximum number of notebooks executed at the same time (default is None,
+        the number of CPUs).
+    timeout : int, optional
+        The time in seconds a cell may run (default is CELL_TIMEOUT).
+
+    Raises
+    ------
+    RuntimeError
+        If a notebook cannot be executed.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(execute_notebook, path, timeout): path
+            for path in notebook_paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(
+                    "Error executing notebook '%s': %s", path, e, exc_info=True
+                )
+                raise RuntimeError(f"Error executing notebook '{path}'.") from e
+            logger.info("Executed notebook: %s", path)
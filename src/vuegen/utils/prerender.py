@@ -0,0 +1,203 @@
+"""Pre-render the images of static reports (PDF, DOCX, ODT, PPTX) in parallel before
+Quarto renders the report, skipping images whose source and settings did not change
+since the last build."""
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from vuegen.utils.images import ImageSettings, postprocess_image
+
+# Manifest in the static folder with the content hash of each pre-rendered image
+MANIFEST_FILE = "prerender_manifest.json"
+
+# Bump to invalidate all pre-rendered images when the rendering code changes
+PRERENDER_VERSION = 1
+
+PLOTLY_LAYOUT = dict(
+    autosize=False, width=950, height=400, margin=dict(b=50, t=50, l=50, r=50)
+)
+ALTAIR_PROPERTIES = dict(width=900, height=370)
+DATAFRAME_EXPORT = dict(max_rows=10, max_cols=5, table_conversion="matplotlib")
+
+
+@dataclass
+class PrerenderTask:
+    """
+    An image to render from a local source file.
+
+    Attributes
+    ----------
+    kind : str
+        The renderer to use: 'plotly', 'altair' or 'dataframe'.
+    source : str
+        Path to the source file (a figure JSON or a table file).
+    output : str
+        Path of the image to write.
+    options : dict
+        Further settings, e.g. the sheet name of an Excel file.
+    image : dict
+        The ImageSettings of the image as a dict. The image is rendered as PNG and
+        then downscaled or converted if needed.
+    """
+
+    kind: str
+    source: str
+    output: str
+    options: dict = field(default_factory=dict)
+    image: dict = field(default_factory=dict)
+
+    def content_hash(self) -> str:
+        """Hash of the source file content and of all the render settings."""
+        digest = hashlib.sha256()
+        with open(self.source, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        settings = [
+            PRERENDER_VERSION,
+            self.kind,
+            self.options,
+            self.image,
+            PLOTLY_LAYOUT,
+            ALTAIR_PROPERTIES,
+            DATAFRAME_EXPORT,
+        ]
+        digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+
+def render_task(task: PrerenderTask) -> str:
+    """
+    Render the image of a task. Runs in a worker process.
+
+    Parameters
+    ----------
+    task : PrerenderTask
+        The image to render.
+
+    Returns
+    -------
+    str
+        The path of the written image.
+    """
+    image = ImageSettings(**task.image)
+    rendered = Path(task.output).with_suffix(".png").as_posix()
+    if task.kind == "plotly":
+        import plotly.io as pio
+
+        fig = pio.read_json(task.source)
+        fig.update_layout(**PLOTLY_LAYOUT)
+        fig.write_image(rendered, scale=image.scale)
+    elif task.kind == "altair":
+        import altair as alt
+
+        with open(task.source, "r", encoding="utf-8") as f:
+            chart = alt.Chart.from_json(f.read())
+        chart.properties(**ALTAIR_PROPERTIES).save(
+            rendered, scale_factor=image.scale or 1.0
+        )
+    elif task.kind == "dataframe":
+        import dataframe_image as dfi
+
+        from vuegen import table_utils
+
+        # Read only the rows and columns shown in the image
+        df = table_utils.read_table_preview(
+            task.source,
+            max_rows=DATAFRAME_EXPORT["max_rows"],
+            max_cols=DATAFRAME_EXPORT["max_cols"],
+            **task.options,
+        )
+        dfi.export(df, rendered, dpi=image.dpi, **DATAFRAME_EXPORT)
+    else:
+        raise ValueError(f"Unsupported pre-render task: {task.kind}")
+    if image.needs_postprocessing:
+        postprocess_image(rendered, task.output, **image.postprocess_kwargs())
+    return task.output
+
+
+def prerender_images(
+    tasks: List[PrerenderTask],
+    static_dir: Union[str, Path],
+    logger: logging.Logger,
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Render the images of the tasks in a process pool. Images which exist and whose
+    content hash matches the manifest of the last build are skipped.
+
+    Parameters
+    ----------
+    tasks : list[PrerenderTask]
+        The images to render.
+    static_dir : str | Path
+        The static folder of the report, where the manifest is stored.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+    max_workers : int, optional
+        The number of worker processes (default is None, the number of CPUs).
+
+    Returns
+    -------
+    dict
+        The status of each image by output path: 'cached' or 'rendered'.
+
+    Raises
+    ------
+    RuntimeError
+        If an image cannot be rendered.
+    """
+    manifest_path = Path(static_dir) / MANIFEST_FILE
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    status = {}
+    todo = []
+    for task in tasks:
+        key = task.content_hash()
+        if (
+            manifest.get(task.output, {}).get("hash") == key
+            and Path(task.output).exists()
+        ):
+            status[task.output] = "cached"
+        else:
+            todo.append((task, key))
+    logger.info(
+        "Pre-rendering %d image(s), %d unchanged image(s) skipped.",
+        len(todo),
+        len(status),
+    )
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(render_task, task): (task, key) for task, key in todo
+            }
+            for future in as_completed(futures):
+                task, key = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(
+                        "Error pre-rendering '%s' to '%s': %s",
+                        task.source,
+                        task.output,
+                        e,
+                        exc_info=True,
+                    )
+                    raise RuntimeError(
+                        f"Error pre-rendering '{task.source}' to '{task.output}'."
+                    ) from e
+                manifest[task.output] = {"hash": key, **asdict(task)}
+                status[task.output] = "rendered"
+                logger.debug("Pre-rendered image: %s", task.output)
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return status
@@ -0,0 +1,385 @@
+"""Profiling of report builds.
+
+The BuildProfiler records the nested stages of a build, e.g. reading the
+configuration, generating each component and running Quarto, and writes them as a
+JSON summary and a Chrome trace-event file.
+
+The chunks executed when Quarto renders a report are profiled separately. The
+generated qmd files define and start the profiler of CHUNK_PROFILER_CODE in their
+imports chunk and mark the start of each chunk with its label. The timings are
+written to a JSON file next to the qmd file and summarized once the report is
+rendered."""
+
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+# Suffix of the JSON files with the chunk timings of a qmd file
+PROFILE_SUFFIX = "_profile.json"
+# Summary of all chunk timings of a report, sorted by time
+PROFILE_SUMMARY_FILE = "render_profile.txt"
+# Summary of the build stages of a report and its trace, in the report folder
+BUILD_PROFILE_FILE = "build_profile.json"
+BUILD_TRACE_FILE = "build_trace.json"
+
+# The profiler recording the stages of the build run in the current context, if
+# any, so that concurrent builds are recorded by their own profiler. Threads
+# started by a build have to run in a copy of its context.
+_active_profiler: contextvars.ContextVar[Optional["BuildProfiler"]] = (
+    contextvars.ContextVar("vuegen_build_profiler", default=None)
+)
+
+
+class BuildProfiler:
+    """
+    Record the wall time of the nested stages of a report build.
+
+    Stages are recorded by the code of the build through `profile_stage`, which does
+    nothing unless a profiler is activated. Stages of worker threads are recorded
+    with their thread.
+
+    Attributes
+    ----------
+    spans : list[dict]
+        The recorded stages with their name, category ('stage' or 'component'),
+        start and duration in seconds, nesting depth, thread and arguments.
+    """
+
+    def __init__(self):
+        self.spans: List[dict] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def stage(self, name: str, category: str = "stage", **args) -> Iterator[None]:
+        """
+        Time a stage of the build, nested in the current stage of the thread.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        category : str, optional
+            The category of the stage, 'stage' or 'component' (default is 'stage').
+        **args
+            Details of the stage, e.g. the id and title of a component.
+        """
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self.spans.append(
+                    {
+                        "name": name,
+                        "category": category,
+                        "start": start - self._origin,
+                        "seconds": seconds,
+                        "depth": len(stack),
+                        "thread": threading.current_thread().name,
+                        "args": args,
+                    }
+                )
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["BuildProfiler"]:
+        """Record the stages of the build run in this context with this profiler."""
+        token = _active_profiler.set(self)
+        try:
+            yield self
+        finally:
+            _active_profiler.reset(token)
+
+    def summary(self) -> dict:
+        """
+        Summarize the recorded stages.
+
+        Returns
+        -------
+        dict
+            The total time, the time and count of each stage by name, and the time
+            of each component, slowest first.
+        """
+        stages = {}
+        for span in self.spans:
+            if span["category"] != "stage":
+                continue
+            stage = stages.setdefault(span["name"], {"seconds": 0.0, "count": 0})
+            stage["seconds"] += span["seconds"]
+            stage["count"] += 1
+        components = sorted(
+            (
+                {**span["args"], "seconds": span["seconds"]}
+                for span in self.spans
+                if span["category"] == "component"
+            ),
+            key=lambda component: component["seconds"],
+            reverse=True,
+        )
+        return {
+            "seconds": max(
+                (span["start"] + span["seconds"] for span in self.spans), default=0.0
+            ),
+            "stages": {
+                name: {**stage, "seconds": round(stage["seconds"], 6)}
+                for name, stage in sorted(
+                    stages.items(), key=lambda item: item[1]["seconds"], reverse=True
+                )
+            },
+            "components": [
+                {**component, "seconds": round(component["seconds"], 6)}
+                for component in components
+            ],
+        }
+
+    def trace_events(self) -> dict:
+        """
+        Get the recorded stages in the Chrome trace-event format, which can be
+        opened with chrome://tracing or https://ui.perfetto.dev.
+
+        Returns
+        -------
+        dict
+            The trace, with one complete event per stage.
+        """
+        threads = {}
+        for span in sorted(self.spans, key=lambda span: span["start"]):
+            threads.setdefault(span["thread"], len(threads) + 1)
+        pid = os.getpid()
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread},
+            }
+            for thread, tid in threads.items()
+        ]
+        events.extend(
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6, 1),
+                "dur": round(span["seconds"] * 1e6, 1),
+                "pid": pid,
+                "tid": threads[span["thread"]],
+                "args": span["args"],
+            }
+            for span in self.spans
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, output_dir: Union[str, Path]) -> tuple[Path, Path]:
+        """
+        Write the summary and the trace of the build.
+
+        Parameters
+        ----------
+        output_dir : str | Path
+            The folder of the files, e.g. the report folder.
+
+        Returns
+        -------
+        tuple[Path, Path]
+            The summary (BUILD_PROFILE_FILE) and trace (BUILD_TRACE_FILE) files.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary_file = output_dir / BUILD_PROFILE_FILE
+        trace_file = output_dir / BUILD_TRACE_FILE
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2, default=str)
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(self.trace_events(), f, default=str)
+        return summary_file, trace_file
+
+
+def profile_stage(name: str, category: str = "stage", **args):
+    """
+    Time a stage of the build with the active BuildProfiler, if any.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+    category : str, optional
+        The category of the stage, 'stage' or 'component' (default is 'stage').
+    **args
+        Details of the stage, e.g. the id and title of a component.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context in which the stage runs.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name, category, **args)
+
+
+def profile_component(component):
+    """
+    Time the generation of a component with the active BuildProfiler, if any.
+
+    Parameters
+    ----------
+    component : Component
+        The component being generated.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context in which the component is generated.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(
+        f"{component.component_type}: {component.title}",
+        "component",
+        id=component.id,
+        title=component.title,
+        component_type=str(component.component_type),
+    )
+
+
+# Code of the profiler of the chunks run in an IPython kernel, which is written to
+# the imports chunk of the profiled qmd files, so that rendering them does not
+# require vuegen. A chunk is timed from the call of `start` until the end of the
+# cell which called it, using the `post_run_cell` event of IPython. Thus, the last
+# expression of a chunk is still displayed. Memory tracing slows down the chunks and
+# is only started if requested.
+CHUNK_PROFILER_CODE = """\
+import json as _json
+import time as _time
+import tracemalloc as _tracemalloc
+
+
+class _VuegenChunkProfiler:
+    def __init__(self, output_file, memory=False):
+        self.output_file = output_file
+        self.memory = memory
+        self.timings = []
+        self._label = None
+        self._start = 0.0
+        self._start_memory = 0
+
+    @classmethod
+    def install(cls, output_file, memory=False):
+        from IPython import get_ipython
+
+        profiler = cls(output_file, memory)
+        if memory and not _tracemalloc.is_tracing():
+            _tracemalloc.start()
+        shell = get_ipython()
+        if shell is not None:
+            shell.events.register("post_run_cell", profiler.stop)
+        return profiler
+
+    def start(self, label):
+        self._label = label
+        if self.memory:
+            _tracemalloc.reset_peak()
+            self._start_memory, _ = _tracemalloc.get_traced_memory()
+        self._start = _time.perf_counter()
+
+    def stop(self, result=None):
+        if self._label is None:
+            return
+        elapsed = _time.perf_counter() - self._start
+        peak_memory = None
+        if self.memory:
+            _, peak_memory = _tracemalloc.get_traced_memory()
+            peak_memory = max(peak_memory - self._start_memory, 0)
+        self.timings.append(
+            {
+                "label": self._label,
+                "seconds": round(elapsed, 6),
+                "peak_memory": peak_memory,
+                "failed": bool(result is not None and not result.success),
+            }
+        )
+        self._label = None
+        with open(self.output_file, "w", encoding="utf-8") as f:
+            _json.dump(self.timings, f, indent=2)
+"""
+# Name of the profiler class defined by CHUNK_PROFILER_CODE
+CHUNK_PROFILER_CLASS = "_VuegenChunkProfiler"
+
+
+def clear_profiles(profile_dir: Union[str, Path]) -> None:
+    """
+    Remove the chunk timings of earlier builds from a report folder.
+
+    Parameters
+    ----------
+    profile_dir : str | Path
+        The folder with the JSON files of the chunk timings.
+    """
+    for profile_file in Path(profile_dir).glob(f"*{PROFILE_SUFFIX}"):
+        profile_file.unlink()
+
+
+def summarize_profiles(
+    profile_dir: Union[str, Path], output_file: Optional[Union[str, Path]] = None
+) -> List[dict]:
+    """
+    Merge the chunk timings of all qmd files of a report and write them as a text
+    table sorted by time, the slowest chunks first.
+
+    Parameters
+    ----------
+    profile_dir : str | Path
+        The folder with the JSON files of the chunk timings.
+    output_file : str | Path, optional
+        The text file to write (default is PROFILE_SUMMARY_FILE in profile_dir).
+
+    Returns
+    -------
+    list[dict]
+        The chunk timings sorted by time, with the qmd file of each chunk.
+    """
+    profile_dir = Path(profile_dir)
+    if output_file is None:
+        output_file = profile_dir / PROFILE_SUMMARY_FILE
+    timings = []
+    for profile_file in sorted(profile_dir.glob(f"*{PROFILE_SUFFIX}")):
+        with open(profile_file, "r", encoding="utf-8") as f:
+            for timing in json.load(f):
+                timing["file"] = profile_file.name[: -len(PROFILE_SUFFIX)] + ".qmd"
+                timings.append(timing)
+    timings.sort(key=lambda timing: timing["seconds"], reverse=True)
+
+    total = sum(timing["seconds"] for timing in timings)
+    lines = [
+        f"{'seconds':>10} {'share':>6} {'peak MiB':>9}  chunk",
+        *(
+            f"{timing['seconds']:10.3f} {timing['seconds'] / (total or 1):6.1%}"
+            f" {_format_memory(timing['peak_memory']):>9}"
+            f"  {timing['file']}: {timing['label']}"
+            f"{' (failed)' if timing['failed'] else ''}"
+            for timing in timings
+        ),
+        f"{total:10.3f} {'':>6} {'':>9}  total of {len(timings)} chunk(s)",
+    ]
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return timings
+
+
+def _format_memory(size: Optional[int]) -> str:
+    """Format a size in bytes in MiB, or '-' if the memory was not traced."""
+    return "-" if size is None else f"{size / 2**20:.1f}"
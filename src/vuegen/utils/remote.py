@@ -0,0 +1,269 @@
+"""Helpers to fetch remote (URL-backed) component files, either once at build time
+into the static folder or at runtime of a generated report through a shared
+connection pool."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+from urllib.parse import urlparse
+
+from vuegen.constants import TIMEOUT
+
+if TYPE_CHECKING:
+    import requests
+
+# Folder (inside the static folder) and manifest file for prefetched files
+REMOTE_DIR = "remote"
+MANIFEST_FILE = "manifest.json"
+
+# Folder (inside the cache folder of the user, see get_cache_dir) for cached API
+# responses. It is kept out of the report, as responses may contain secrets.
+API_CACHE_DIR = "api_cache"
+
+# Time in seconds a remote file fetched by a running report is cached
+REMOTE_CACHE_TTL: int = 3600
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the cache folder of vuegen for the user: VUEGEN_CACHE_DIR if set, else
+    'vuegen' in the cache folder of the platform, e.g. ~/.cache/vuegen.
+
+    Returns
+    -------
+    Path
+        The cache folder, which may not exist yet.
+    """
+    if os.environ.get("VUEGEN_CACHE_DIR"):
+        return Path(os.environ["VUEGEN_CACHE_DIR"]).expanduser()
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "vuegen" / "Cache"
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "vuegen"
+    return Path.home() / ".cache" / "vuegen"
+
+
+@lru_cache(maxsize=None)
+def get_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Get a requests session shared by all calls in the process, so that connections
+    to the same host are reused.
+
+    Parameters
+    ----------
+    pool_maxsize : int, optional
+        The maximum number of connections kept per host (default is 10).
+
+    Returns
+    -------
+    requests.Session
+        The shared session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_text(url: str, timeout: int = TIMEOUT) -> str:
+    """
+    Fetch the content of a URL as text using the shared session.
+
+    Parameters
+    ----------
+    url : str
+        The URL to fetch.
+    timeout : int, optional
+        The timeout in seconds of the request (default is TIMEOUT).
+
+    Returns
+    -------
+    str
+        The content of the response.
+
+    Raises
+    ------
+    requests.exceptions.HTTPError
+        If the server answers with an error status.
+    """
+    response = get_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+class RemoteAssetCache:
+    """
+    Local copies of remote files, revalidated with the ETag and Last-Modified
+    headers stored in a manifest.
+
+    Parameters
+    ----------
+    static_dir : str | Path
+        The static folder of the report. Files are saved in its REMOTE_DIR subfolder.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+    timeout : int, optional
+        The timeout in seconds of the requests (default is TIMEOUT).
+    """
+
+    def __init__(
+        self,
+        static_dir: Union[str, Path],
+        logger: logging.Logger,
+        timeout: int = TIMEOUT,
+    ):
+        self.directory = Path(static_dir) / REMOTE_DIR
+        self.manifest_path = self.directory / MANIFEST_FILE
+        self.logger = logger
+        self.timeout = timeout
+        self.manifest = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    def _local_path(self, url: str) -> Path:
+        """Local file for an URL, keeping the file extension of the URL path."""
+        suffix = Path(urlparse(url).path).suffix
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"{digest}{suffix}"
+
+    def fetch(self, url: str) -> Path:
+        """
+        Download a remote file, unless the local copy is still valid.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the file.
+
+        Returns
+        -------
+        Path
+            The path to the local copy of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file cannot be fetched and no local copy exists.
+        """
+        import requests
+
+        fpath = self._local_path(url)
+        entry: Optional[dict] = self.manifest.get(url)
+        headers = {}
+        if entry is not None and fpath.exists():
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = get_session().get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                self.logger.debug("Remote file not modified: %s", url)
+                return fpath
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            if fpath.exists():
+                self.logger.warning(
+                    "Could not revalidate %s, using the local copy %s: %s",
+                    url,
+                    fpath,
+                    e,
+                )
+                return fpath
+            self.logger.error("Error fetching content from URL %s: %s", url, e)
+            raise ValueError(f"Error fetching content from URL: {url}.") from e
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fpath.write_bytes(response.content)
+        self.manifest[url] = {
+            "file": fpath.name,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        self.logger.info("Remote file %s saved as: %s", url, fpath)
+        return fpath
+
+    def save_manifest(self) -> None:
+        """Write the manifest with the URLs and headers of the local copies."""
+        if not self.manifest:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+
+
+class ResponseCache:
+    """
+    On-disk cache of JSON API responses, one file per request.
+
+    Parameters
+    ----------
+    directory : str | Path
+        The folder where the responses are saved.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        body: Optional[dict] = None,
+    ) -> str:
+        """Create a key identifying a request from all its parts."""
+        request = json.dumps(
+            [method, url, headers or {}, params or {}, body], sort_keys=True
+        )
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get a cached response if it is younger than ttl seconds.
+
+        Parameters
+        ----------
+        key : str
+            The key of the request, see make_key.
+        ttl : float
+            The time to live of the response in seconds.
+
+        Returns
+        -------
+        Any, optional
+            The cached response, or None if there is no valid one.
+        """
+        fpath = self.directory / f"{key}.json"
+        try:
+            if time.time() - fpath.stat().st_mtime > ttl:
+                return None
+            with open(fpath, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, response: Any) -> None:
+        """Save a JSON response for the request with the given key."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fpath = self.directory / f"{key}.json"
+        # write to a temporary file first, as other threads might read the file
+        tmp_path = fpath.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(response, f)
+        tmp_path.replace(fpath)
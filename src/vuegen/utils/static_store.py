@@ -0,0 +1,212 @@
+"""Content-addressed static files of the components of a report.
+
+The static files of a component (figure JSON, network HTML, images) are named
+after the hash of its source file and of the settings they are rendered with,
+instead of after its title. Components with the same content share one file, a
+file is written once per build, and files kept from a previous build are reused
+as they are: their name changes whenever their content would. A manifest in the
+static folder maps the components to their files.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from vuegen.utils import is_url
+
+# Manifest in the static folder mapping the components to their static files
+MANIFEST_FILE = "static_manifest.json"
+
+# Bump to invalidate all stored files when the code writing them changes
+STATIC_STORE_VERSION = 1
+
+# Attributes of the components which do not change their static files
+_IGNORED_ATTRIBUTES = {"id", "title", "logger", "caption", "file_path"}
+
+
+class StaticStore:
+    """
+    Names, writes once and records the static files of the components of a report.
+    Safe to use from the threads generating the components.
+
+    Parameters
+    ----------
+    static_dir : str | Path
+        The static folder of the report.
+    logger : logging.Logger
+        A logger object to track warnings, errors, and info messages.
+
+    Attributes
+    ----------
+    n_written : int
+        The number of files written in this build.
+    n_reused : int
+        The number of files reused, from this build or a previous one.
+    """
+
+    def __init__(self, static_dir: Union[str, Path], logger: logging.Logger):
+        self.static_dir = Path(static_dir)
+        self.logger = logger
+        self.n_written = 0
+        self.n_reused = 0
+        self._lock = threading.Lock()
+        self._names: Dict[tuple, str] = {}
+        # asset name -> its files and whether they can be reused by later builds
+        self._assets: Dict[str, dict] = {}
+        self._components: Dict[tuple, dict] = {}
+        self._claimed = set()
+        self._previous = self._read_manifest()
+
+    def _read_manifest(self) -> Dict[str, dict]:
+        """The assets recorded by the previous build, if any."""
+        manifest_file = self.static_dir / MANIFEST_FILE
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != STATIC_STORE_VERSION:
+            return {}
+        return manifest.get("assets", {})
+
+    def asset_name(self, component, settings: Optional[dict] = None) -> str:
+        """
+        Get the name, without extension, of the static files of a component: its
+        type and the hash of its source file, of its attributes and of the given
+        settings. The source file is only hashed once per build.
+
+        Parameters
+        ----------
+        component : Component
+            The component.
+        settings : dict, optional
+            The settings of the report view which change the static files, e.g.
+            the report type and the image settings (default is None).
+
+        Returns
+        -------
+        str
+            The name, like 'plot_<hash>'.
+        """
+        attributes = {
+            name: getattr(component, name, None)
+            for cls in type(component).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name not in _IGNORED_ATTRIBUTES
+        }
+        params = json.dumps(
+            [STATIC_STORE_VERSION, attributes, settings or {}],
+            sort_keys=True,
+            default=str,
+        )
+        source = str(component.file_path)
+        cache_key = (source, params)
+        with self._lock:
+            name = self._names.get(cache_key)
+        if name is None:
+            digest = hashlib.sha256()
+            if is_url(source) or not Path(source).is_file():
+                digest.update(source.encode("utf-8"))
+            else:
+                with open(source, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+            digest.update(params.encode("utf-8"))
+            name = f"{component.component_type}_{digest.hexdigest()[:20]}"
+        with self._lock:
+            self._names[cache_key] = name
+            asset = self._assets.setdefault(name, {"files": [], "reusable": True})
+            # The content of remote files may change without their URL
+            if is_url(source):
+                asset["reusable"] = False
+            self._components[(str(component.component_type), component.id)] = {
+                "id": component.id,
+                "title": component.title,
+                "component_type": str(component.component_type),
+                "asset": name,
+            }
+        return name
+
+    @contextmanager
+    def writing(self, name: str, file_path: Union[str, Path]) -> Iterator[bool]:
+        """
+        Claim a static file before writing it. Yields False if the file was
+        already written in this build or is kept from a previous one, so that the
+        caller skips writing it, and True otherwise. The file is recorded in the
+        manifest if the block ends without error.
+
+        Parameters
+        ----------
+        name : str
+            The asset name of the component, from asset_name.
+        file_path : str | Path
+            The static file, named after the asset name.
+
+        Yields
+        ------
+        bool
+            Whether the caller should write the file.
+        """
+        file_path = Path(file_path)
+        with self._lock:
+            claimed = file_path in self._claimed
+            self._claimed.add(file_path)
+            previous = self._previous.get(name, {})
+            reused = (
+                not claimed
+                and previous.get("reusable", False)
+                and self._assets.get(name, {}).get("reusable", True)
+                and file_path.name in previous.get("files", [])
+                and file_path.exists()
+            )
+            if reused:
+                self._record(name, file_path.name)
+            if claimed or reused:
+                self.n_reused += 1
+            else:
+                self.n_written += 1
+        yield not (claimed or reused)
+        if not (claimed or reused):
+            with self._lock:
+                self._record(name, file_path.name)
+
+    def _record(self, name: str, file_name: str):
+        """Add a file to an asset of the manifest. Call with the lock held."""
+        asset = self._assets.setdefault(name, {"files": [], "reusable": True})
+        if file_name not in asset["files"]:
+            asset["files"].append(file_name)
+
+    def write_manifest(self) -> Path:
+        """
+        Write the manifest mapping the components to their static files.
+
+        Returns
+        -------
+        Path
+            The manifest file.
+        """
+        manifest_file = self.static_dir / MANIFEST_FILE
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            assets = {
+                name: {"files": sorted(asset["files"]), "reusable": asset["reusable"]}
+                for name, asset in sorted(self._assets.items())
+            }
+            manifest = {
+                "version": STATIC_STORE_VERSION,
+                "assets": assets,
+                "components": list(self._components.values()),
+            }
+        with open(manifest_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        self.logger.info(
+            "Static files: %d written, %d reused. Manifest written to %s",
+            self.n_written,
+            self.n_reused,
+            manifest_file,
+        )
+        return manifest_file
@@ -0,0 +1,78 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answer each request with the respond function of the server."""
+
+    def _handle(self):
+        server = self.server
+        self.body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with server.lock:
+            server.requests.append((self.command, self.path))
+            count = server.requests.count((self.command, self.path))
+        status, headers, body = server.respond(self, count)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def config(tmp_path):
+    """
+    Configuration of a report with one section, one subsection and a Markdown
+    component, whose file is written to tmp_path.
+    """
+    md_file = tmp_path / "text.md"
+    md_file.write_text("Some text")
+    component = {
+        "title": "Text",
+        "file_path": str(md_file),
+        "component_type": "markdown",
+    }
+    return {
+        "report": {"title": "Report", "description": "A report"},
+        "sections": [
+            {
+                "title": "Section",
+                "subsections": [{"title": "Subsection", "components": [component]}],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Start local HTTP servers answering each request with respond(handler, count),
+    which returns the status, headers and body of the response. count is the
+    number of requests with the same method and path so far, and the requests are
+    listed in server.requests as (method, path).
+    """
+    servers = []
+
+    def start(respond):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        server.respond = respond
+        server.requests = []
+        server.lock = threading.Lock()
+        server.url = f"http://127.0.0.1:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
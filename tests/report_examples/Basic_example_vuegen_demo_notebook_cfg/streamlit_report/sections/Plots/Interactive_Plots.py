@@ -1,7 +1,6 @@
 from pathlib import Path
 import altair as alt
 import json
-import requests
 import streamlit as st
 section_dir = Path(__file__).resolve().parent.parent
 
@@ -33,17 +32,9 @@ st.markdown(
     unsafe_allow_html=True)
 
 
-file_path = (section_dir / '../../../../../docs/example_data/Basic_example_vuegen_demo_notebook/1_Plots/1_Interactive_plots/1_top_species_plot_by_biome_plotly.json').resolve().as_posix()
+file_path = (section_dir / '../static/Top_Species_Plot_By_Biome_Plotly.json').resolve().as_posix()
 with open(file_path, 'r') as plot_file:
     plot_json = json.load(plot_file)
-
-# Keep only 'data' and 'layout' sections
-plot_json = {key: plot_json[key] for key in plot_json
-                                 if key in ['data', 'layout']}
-
-# Remove 'frame' section in 'data'
-plot_json['data'] = [{k: v for k, v in entry.items() if k != 'frame'}
-                                for entry in plot_json.get('data', [])]
 st.plotly_chart(plot_json, use_container_width=True)
 
 st.markdown(
@@ -74,17 +65,9 @@ st.markdown(
     unsafe_allow_html=True)
 
 
-file_path = (section_dir / '../../../../../docs/example_data/Basic_example_vuegen_demo_notebook/1_Plots/1_Interactive_plots/3_pie_plot_countries_plotly.json').resolve().as_posix()
+file_path = (section_dir / '../static/Pie_Plot_Countries_Plotly.json').resolve().as_posix()
 with open(file_path, 'r') as plot_file:
     plot_json = json.load(plot_file)
-
-# Keep only 'data' and 'layout' sections
-plot_json = {key: plot_json[key] for key in plot_json
-                                 if key in ['data', 'layout']}
-
-# Remove 'frame' section in 'data'
-plot_json['data'] = [{k: v for k, v in entry.items() if k != 'frame'}
-                                for entry in plot_json.get('data', [])]
 st.plotly_chart(plot_json, use_container_width=True)
 
 st.markdown(
@@ -97,37 +80,11 @@ st.markdown(
     unsafe_allow_html=True)
 
 
-file_path = (section_dir / '../../../../../docs/example_data/Basic_example_vuegen_demo_notebook/1_Plots/1_Interactive_plots/4_pie_plots_biomes_plotly.json').resolve().as_posix()
+file_path = (section_dir / '../static/Pie_Plots_Biomes_Plotly.json').resolve().as_posix()
 with open(file_path, 'r') as plot_file:
     plot_json = json.load(plot_file)
-
-# Keep only 'data' and 'layout' sections
-plot_json = {key: plot_json[key] for key in plot_json
-                                 if key in ['data', 'layout']}
-
-# Remove 'frame' section in 'data'
-plot_json['data'] = [{k: v for k, v in entry.items() if k != 'frame'}
-                                for entry in plot_json.get('data', [])]
 st.plotly_chart(plot_json, use_container_width=True)
 
-st.markdown(
-    '''
-    <h4 style='text-align: center;
-    color: #2b8cbe;'>
-    Saline Metagenomics Samples Map Altair
-    </h4>
-    ''',
-    unsafe_allow_html=True)
-
-
-file_path = (section_dir / '../../../../../docs/example_data/Basic_example_vuegen_demo_notebook/1_Plots/1_Interactive_plots/5_saline_metagenomics_samples_map_altair.json').resolve().as_posix()
-with open(file_path, 'r') as plot_file:
-    plot_json = json.load(plot_file)
-
-altair_plot = alt.Chart.from_dict(plot_json)
-st.vega_lite_chart(json.loads(altair_plot.to_json()),
-                   use_container_width=True)
-
 st.markdown(
     '''
     <h4 style='text-align: center;
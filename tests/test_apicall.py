@@ -0,0 +1,143 @@
+import json
+import logging
+import time
+
+import pytest
+
+from vuegen import report as r
+from vuegen.report_generator import build_report
+from vuegen.utils.remote import ResponseCache
+
+logger = logging.getLogger("test_apicall")
+
+
+def stub_api(handler, count):
+    """Stub API: '/slow' answers after a delay, '/flaky' fails twice first."""
+    if handler.path.startswith("/slow"):
+        time.sleep(0.5)
+    if handler.path.startswith("/flaky") and count <= 2:
+        return 503, {}, b""
+    body = json.dumps({"path": handler.path, "count": count}).encode()
+    return 200, {"Content-Type": "application/json"}, body
+
+
+@pytest.fixture
+def server_url(stub_server):
+    return stub_server(stub_api).url
+
+
+class _View(r.ReportView):
+    """Minimal report view to run the API calls of a report."""
+
+    def generate_report(self, output_dir=None):
+        pass
+
+    def run_report(self, output_dir=None):
+        pass
+
+    def _generate_component_imports(self, component):
+        return []
+
+
+def test_api_calls_run_concurrently(tmp_path, server_url):
+    apicalls = [
+        r.APICall(title=f"call {i}", logger=logger, api_url=f"{server_url}/slow/{i}")
+        for i in range(4)
+    ]
+    report = r.Report(
+        title="API calls",
+        logger=logger,
+        sections=[
+            r.Section(
+                title="Section", subsections=[r.Subsection("Sub", components=apicalls)]
+            )
+        ],
+    )
+    start = time.perf_counter()
+    responses = _View(report, r.ReportType.STREAMLIT)._run_api_calls(tmp_path)
+    assert time.perf_counter() - start < 4 * 0.5
+    assert [responses[apicall.id]["path"] for apicall in apicalls] == [
+        f"/slow/{i}" for i in range(4)
+    ]
+
+
+def test_api_call_retries(server_url):
+    apicall = r.APICall(
+        title="flaky",
+        logger=logger,
+        api_url=f"{server_url}/flaky",
+        retries=2,
+        backoff_factor=0.01,
+    )
+    assert apicall.make_api_request() == {"path": "/flaky", "count": 3}
+
+
+def test_api_call_without_retries_fails(server_url):
+    apicall = r.APICall(title="flaky", logger=logger, api_url=f"{server_url}/flaky")
+    assert apicall.make_api_request() is None
+
+
+def test_api_call_cache(tmp_path, stub_server):
+    server = stub_server(stub_api)
+    cache = ResponseCache(tmp_path)
+    apicall = r.APICall(
+        title="cached", logger=logger, api_url=f"{server.url}/data", cache_ttl=60
+    )
+    first = apicall.make_api_request(cache=cache)
+    assert apicall.make_api_request(cache=cache) == first
+    assert server.requests == [("GET", "/data")]
+
+    # an expired response is requested again
+    apicall.cache_ttl = 1e-6
+    assert apicall.make_api_request(cache=cache)["count"] == 2
+
+
+def test_post_is_neither_retried_nor_cached(tmp_path, stub_server):
+    server = stub_server(stub_api)
+    cache = ResponseCache(tmp_path)
+    apicall = r.APICall(
+        title="post",
+        logger=logger,
+        api_url=f"{server.url}/flaky",
+        method="POST",
+        retries=2,
+        backoff_factor=0.01,
+        cache_ttl=60,
+    )
+    assert apicall.make_api_request(cache=cache) is None
+    assert server.requests == [("POST", "/flaky")]
+
+    apicall.api_url = f"{server.url}/data"
+    assert apicall.make_api_request(cache=cache)["count"] == 1
+    assert apicall.make_api_request(cache=cache)["count"] == 2
+
+    # unless the API is idempotent for this method
+    apicall.api_url = f"{server.url}/flaky/idempotent"
+    apicall.retry_methods = ("POST",)
+    assert apicall.make_api_request(cache=cache)["count"] == 3
+
+
+def test_api_cache_not_in_report(tmp_path, server_url, monkeypatch):
+    monkeypatch.setenv("VUEGEN_CACHE_DIR", str(tmp_path / "cache"))
+    apicall = {
+        "title": "Cached",
+        "component_type": "apicall",
+        "api_url": f"{server_url}/data",
+        "method": "GET",
+        "cache_ttl": 60,
+    }
+    config = {
+        "report": {"title": "API calls", "description": "API calls"},
+        "sections": [
+            {
+                "title": "Section",
+                "subsections": [{"title": "Sub", "components": [apicall]}],
+            }
+        ],
+    }
+    result = build_report(
+        "streamlit", config=config, output_dir=tmp_path, logger=logger, run=False
+    )
+    # the responses, e.g. of authenticated requests, are not published
+    assert not list(result.report_dir.rglob("api_cache"))
+    assert len(list((tmp_path / "cache" / "api_cache").glob("*.json"))) == 1
@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+import yaml
+
+from vuegen.batch import SUMMARY_FILE, read_manifest, run_batch, write_summary
+
+logger = logging.getLogger("test_batch")
+
+
+@pytest.fixture
+def manifest(tmp_path, config):
+    (tmp_path / "config.yaml").write_text(yaml.safe_dump(config))
+    manifest = {
+        "output_dir": "reports",
+        "defaults": {"report_type": "streamlit", "run": False},
+        "reports": [
+            {"name": "first", "config": "config.yaml"},
+            {"name": "second", "config": "config.yaml", "report_type": "jupyter"},
+            {"directory": "missing"},
+        ],
+    }
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(yaml.safe_dump(manifest))
+    return manifest_path
+
+
+def test_read_manifest(tmp_path, manifest):
+    entries, settings = read_manifest(manifest, logger)
+    assert [entry.name for entry in entries] == ["first", "second", "missing"]
+    assert settings == {"output_dir": tmp_path / "reports", "jobs": 1}
+    assert entries[0].config_path == tmp_path / "config.yaml"
+    assert entries[0].output_dir == tmp_path / "reports" / "first"
+    assert entries[1].options == {"report_type": "jupyter", "run": False}
+
+
+def test_read_manifest_errors(tmp_path):
+    manifest_path = tmp_path / "manifest.yaml"
+    for reports in [
+        [],
+        [{"config": "a.yaml", "directory": "a"}],
+        [{"config": "a.yaml", "unknown_option": True}],
+        [{"config": "a.yaml"}, {"directory": "a"}],
+    ]:
+        manifest_path.write_text(yaml.safe_dump({"reports": reports}))
+        with pytest.raises(ValueError):
+            read_manifest(manifest_path, logger)
+
+
+def test_run_batch_continues_after_failures(tmp_path, manifest):
+    entries, settings = read_manifest(manifest, logger)
+    results = run_batch(entries, logger, log_folder=tmp_path / "logs")
+    assert [result.ok for result in results] == [True, True, False]
+    assert results[2].error.startswith("FileNotFoundError")
+    assert (settings["output_dir"] / "first" / "streamlit_report").is_dir()
+    assert (settings["output_dir"] / "second" / "quarto_report").is_dir()
+    assert len(list((tmp_path / "logs").glob("*.log"))) == 3
+
+    summary = write_summary(results, settings["output_dir"] / SUMMARY_FILE)
+    lines = summary.read_text().splitlines()
+    assert len(lines) == 4
+    assert lines[3].split("\t")[:3] == ["missing", "streamlit", "failed"]
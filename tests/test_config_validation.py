@@ -0,0 +1,87 @@
+import logging
+from pathlib import Path
+
+import pytest
+import yaml
+
+from vuegen.config_validation import ConfigValidationError, main, validate_config
+from vuegen.report_generator import build_report
+
+logger = logging.getLogger("test_config_validation")
+DOCS_DIR = Path(__file__).parents[1] / "docs"
+
+
+@pytest.fixture
+def config(tmp_path, config):
+    """The shared configuration, with a relative file path and a table."""
+    (tmp_path / "table.csv").write_text("a,b\n1,2\n")
+    components = config["sections"][0]["subsections"][0]["components"]
+    components[0]["file_path"] = "text.md"
+    components.append(
+        {
+            "title": "Table",
+            "file_path": str(tmp_path / "table.csv"),
+            "component_type": "dataframe",
+            "file_format": "csv",
+        }
+    )
+    return config
+
+
+def test_validate_config(tmp_path, config):
+    assert validate_config(config, base_dir=tmp_path) == []
+
+
+@pytest.mark.parametrize(
+    "config_path",
+    sorted((DOCS_DIR / "example_config_files").glob("*.yaml")),
+    ids=lambda path: path.name,
+)
+def test_example_configs_are_valid(config_path):
+    config = yaml.safe_load(config_path.read_text())
+    # the file paths of the examples are relative to the docs folder
+    assert validate_config(config, base_dir=DOCS_DIR) == []
+
+
+def test_validate_config_reports_all_problems(tmp_path, config):
+    components = config["sections"][0]["subsections"][0]["components"]
+    components[0]["file_path"] = "missing.md"
+    components[1]["file_format"] = "tsv"
+    components.append({"title": "Plot", "component_type": "plot", "plot_type": "3d"})
+    config["sections"].append({"title": "Other", "subsections": [{"title": "Sub?"}]})
+    config["sections"][1]["subsections"].append({"title": "Subsection"})
+
+    problems = validate_config(config, base_dir=tmp_path)
+    where = "section 'Section', subsection 'Subsection'"
+    assert problems == [
+        f"{where}, component 'Text': file not found: missing.md",
+        f"{where}, component 'Table': invalid file_format 'tsv', expected one of:"
+        " csv, txt, parquet, xls, xlsx",
+        f"{where}, component 'Plot': missing 'file_path'",
+        f"{where}, component 'Plot': invalid plot_type '3d', expected one of:"
+        " static, plotly, altair, interactive_network",
+        "section 'Other', subsection 'Subsection': the subsection has the same name"
+        f" as {where}, so their pages collide in Streamlit reports",
+    ]
+
+
+def test_build_report_fails_before_generating(tmp_path, config):
+    config["sections"][0]["subsections"][0]["components"][0]["file_path"] = "x.md"
+    with pytest.raises(ConfigValidationError) as error:
+        build_report(
+            "streamlit", config=config, output_dir=tmp_path, logger=logger, run=False
+        )
+    assert isinstance(error.value, ValueError)
+    assert len(error.value.problems) == 1
+    assert not (tmp_path / "streamlit_report").exists()
+
+
+def test_main(tmp_path, config, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config))
+    assert main(config_path) == 0
+    config["report"]["image_settings"] = {"dpi": -1}
+    config_path.write_text(yaml.safe_dump(config))
+    assert main(config_path) == 1
+    assert "report: invalid image_settings" in capsys.readouterr().out
@@ -1,3 +1,32 @@
+import os
+import subprocess
+import sys
+
+# Libraries which are only imported when a component or report type needs them
+HEAVY_MODULES = {
+    "bs4",
+    "matplotlib",
+    "nbformat",
+    "networkx",
+    "pandas",
+    "pyvis",
+    "requests",
+    "streamlit",
+}
+# Modules of vuegen which are imported to build or check a report
+LIGHT_MODULES = [
+    "vuegen.__main__",
+    "vuegen.batch",
+    "vuegen.config_validation",
+    "vuegen.report",
+    "vuegen.report_generator",
+    "vuegen.server",
+]
+# Generous budget for the cumulative import time of vuegen.report, which is
+# imported by every report, in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("VUEGEN_IMPORT_BUDGET_MS", 2000))
+
+
 def test_imports():
     import vuegen
     import vuegen.__main__
@@ -8,3 +37,38 @@ def test_imports():
     import vuegen.utils
 
     assert vuegen.__version__
+
+
+def test_heavy_modules_not_imported():
+    # imported in a new interpreter, as the other tests import the heavy modules
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; import {', '.join(LIGHT_MODULES)}; print(*sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {name.split(".")[0] for name in result.stdout.split()}
+    assert not imported & HEAVY_MODULES
+
+
+def test_report_import_time():
+    # imported in a new interpreter, as the module is cached in this one
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import vuegen.report"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines of "import time: self [us] | cumulative | imported package"
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            cumulative_us[name.strip()] = int(cumulative)
+    assert cumulative_us["vuegen.report"] / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,107 @@
+import logging
+import threading
+
+import pytest
+
+from vuegen import report as r
+from vuegen.quarto_reportview import (
+    QUARTO_INDEX_FILE,
+    QUARTO_OUTPUT_DIR,
+    QUARTO_PROJECT_FILE,
+    QuartoReportView,
+)
+
+logger = logging.getLogger("test_quarto_project")
+
+
+@pytest.fixture
+def report(tmp_path):
+    sections = []
+    for title in ["First section", "Second section", "Third section"]:
+        md_file = tmp_path / f"{title}.md"
+        md_file.write_text(f"Text of {title}")
+        markdown = r.Markdown(title="Text", logger=logger, file_path=str(md_file))
+        sections.append(
+            r.Section(
+                title=title,
+                subsections=[r.Subsection("Subsection", components=[markdown])],
+            )
+        )
+    return r.Report(title="Project report", logger=logger, sections=sections)
+
+
+def test_quarto_project_renders_changed_pages(tmp_path, report, monkeypatch):
+    output_dir = tmp_path / "quarto_report"
+    view = QuartoReportView(
+        report,
+        r.ReportType.HTML,
+        output_dir=output_dir,
+        static_dir=str(output_dir / "static"),
+        quarto_project=True,
+    )
+    rendered = []
+
+    def run_quarto(args):
+        rendered.append(args[-1])
+        (output_dir / QUARTO_OUTPUT_DIR).mkdir(exist_ok=True)
+        (output_dir / QUARTO_OUTPUT_DIR / "index.html").touch()
+
+    monkeypatch.setattr(view, "_run_quarto", run_quarto)
+
+    view.generate_report()
+    pages = [QUARTO_INDEX_FILE, "1_first_section.qmd", "2_second_section.qmd"]
+    for page in [*pages, QUARTO_PROJECT_FILE]:
+        assert (output_dir / page).exists()
+    view.run_report()
+    assert rendered == [str(output_dir)]
+
+    # nothing changed
+    view.generate_report()
+    view.run_report()
+    assert rendered == [str(output_dir)]
+
+    # only the page of the changed file is rendered again
+    (tmp_path / "Second section.md").write_text("Changed text")
+    view.generate_report()
+    view.run_report()
+    assert rendered == [str(output_dir), str(output_dir / "2_second_section.qmd")]
+
+
+def test_quarto_project_renders_changed_pages_concurrently(
+    tmp_path, report, monkeypatch
+):
+    output_dir = tmp_path / "quarto_report"
+    view = QuartoReportView(
+        report,
+        r.ReportType.HTML,
+        output_dir=output_dir,
+        static_dir=str(output_dir / "static"),
+        quarto_project=True,
+        max_workers=2,
+    )
+    rendered = []
+    # fails unless the two last pages are rendered at the same time
+    barrier = threading.Barrier(2, timeout=10)
+
+    def run_quarto(args):
+        page = args[-1]
+        rendered.append(page)
+        (output_dir / QUARTO_OUTPUT_DIR).mkdir(exist_ok=True)
+        (output_dir / QUARTO_OUTPUT_DIR / "index.html").touch()
+        if page.endswith(("2_second_section.qmd", "3_third_section.qmd")):
+            barrier.wait()
+
+    monkeypatch.setattr(view, "_run_quarto", run_quarto)
+    view.generate_report()
+    view.run_report()
+
+    for title in ["First section", "Second section", "Third section"]:
+        (tmp_path / f"{title}.md").write_text("Changed text")
+    view.generate_report()
+    view.run_report()
+    # the first page is rendered alone, as it writes the site libraries
+    assert rendered[:2] == [str(output_dir), str(output_dir / "1_first_section.qmd")]
+    assert sorted(rendered[2:]) == [
+        str(output_dir / "2_second_section.qmd"),
+        str(output_dir / "3_third_section.qmd"),
+    ]
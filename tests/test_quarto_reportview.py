@@ -0,0 +1,92 @@
+import logging
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from vuegen import report as r
+from vuegen.quarto_reportview import QuartoReportView
+
+logger = logging.getLogger("test_quarto_reportview")
+
+
+def test_truncated_workbook_is_parsed_once(tmp_path):
+    fpath = tmp_path / "workbook.xlsx"
+    with pd.ExcelWriter(fpath) as writer:
+        for sheet_name, n_rows in [("large", 30), ("small", 5), ("medium", 20)]:
+            pd.DataFrame({"a": range(n_rows)}).to_excel(
+                writer, sheet_name=sheet_name, index=False
+            )
+    dataframe = r.DataFrame(
+        title="Workbook",
+        logger=logger,
+        file_path=str(fpath),
+        file_format=r.DataFrameFormat.XLSX,
+    )
+    report = r.Report(
+        title="Report",
+        logger=logger,
+        sections=[
+            r.Section(
+                title="Section",
+                subsections=[r.Subsection("Subsection", components=[dataframe])],
+            )
+        ],
+    )
+    output_dir = tmp_path / "quarto_report"
+    view = QuartoReportView(
+        report,
+        r.ReportType.HTML,
+        output_dir=output_dir,
+        static_dir=str(output_dir / "static"),
+        table_max_rows=10,
+    )
+    view.generate_report()
+    qmd = next(output_dir.glob("*.qmd")).read_text()
+
+    assert qmd.count("pd.read_excel(") == 1
+    assert "sheet_name=['large', 'small', 'medium'], nrows=10)" in qmd
+    # the truncated sheets keep their embedded rows, the others all their rows
+    assert "df = df_sheets['large']\ndf = df.iloc[:10]\n" in qmd
+    assert "df = df_sheets['small']\n" in qmd
+    assert "df = df_sheets['medium']\ndf = df.iloc[:10]\n" in qmd
+    # itables only keeps its downsampling for the sheet which is not truncated
+    assert qmd.count("maxBytes=0") == 2
+    assert qmd.count("show(df, ") == 3
+
+
+def test_truncated_parquet_table_reads_enough_row_groups(tmp_path):
+    fpath = tmp_path / "table.parquet"
+    table = pd.DataFrame({"a": range(100)})
+    table.to_parquet(fpath, row_group_size=4)
+    dataframe = r.DataFrame(
+        title="Table",
+        logger=logger,
+        file_path=str(fpath),
+        file_format=r.DataFrameFormat.PARQUET,
+    )
+    report = r.Report(
+        title="Report",
+        logger=logger,
+        sections=[
+            r.Section(
+                title="Section",
+                subsections=[r.Subsection("Subsection", components=[dataframe])],
+            )
+        ],
+    )
+    output_dir = tmp_path / "quarto_report"
+    QuartoReportView(
+        report,
+        r.ReportType.HTML,
+        output_dir=output_dir,
+        static_dir=str(output_dir / "static"),
+        table_max_rows=10,
+    ).generate_report()
+    qmd = next(output_dir.glob("*.qmd")).read_text()
+    code = next(line for line in qmd.splitlines() if "read_row_groups" in line)
+
+    namespace = {"pq": pq, "report_dir": output_dir}
+    exec(code, namespace)
+    # the 10 rows of the note, from 3 row groups of 4 rows
+    pd.testing.assert_frame_equal(namespace["df"], table.iloc[:10])
+    assert "Showing the first 10 of 100 rows" in qmd
@@ -0,0 +1,155 @@
+import logging
+
+import pytest
+import yaml
+
+from vuegen import report as r
+from vuegen.report_generator import build_report
+from vuegen.utils.profiling import BUILD_PROFILE_FILE, BUILD_TRACE_FILE
+
+logger = logging.getLogger("test_report_generator")
+
+
+def test_build_report_from_config(tmp_path, config):
+    output_dir = tmp_path / "output"
+    result = build_report(
+        "streamlit", config=config, output_dir=output_dir, logger=logger, run=False
+    )
+    assert result.report_dir == output_dir / "streamlit_report"
+    assert (result.report_dir / "sections").is_dir()
+    assert result.config_path is None
+    assert not list(output_dir.glob("*.yaml"))
+    assert (result.n_sections, result.n_subsections, result.n_components) == (1, 1, 1)
+    assert set(result.timings) == {"config", "generate"}
+
+
+def test_build_report_profile(tmp_path, config):
+    result = build_report(
+        "jupyter", config=config, output_dir=tmp_path, logger=logger, profile=True
+    )
+    assert set(result.profile["stages"]) >= {"config", "generate", "run"}
+    assert [c["title"] for c in result.profile["components"]] == ["Text"]
+    assert (result.report_dir / BUILD_PROFILE_FILE).exists()
+    assert (result.report_dir / BUILD_TRACE_FILE).exists()
+
+
+def test_build_report_from_report(tmp_path, config):
+    report = build_report(
+        "streamlit", config=config, output_dir=tmp_path, logger=logger, run=False
+    ).report
+    assert isinstance(report, r.Report)
+    result = build_report(
+        "jupyter", report=report, output_dir=tmp_path / "output", run=False
+    )
+    assert (result.report_dir / "quarto_report.qmd").exists()
+
+
+def test_build_report_needs_one_source(tmp_path, config):
+    with pytest.raises(ValueError):
+        build_report("streamlit", output_dir=tmp_path, logger=logger)
+    with pytest.raises(ValueError):
+        build_report(
+            "streamlit",
+            config=config,
+            config_path="config.yaml",
+            output_dir=tmp_path,
+            logger=logger,
+        )
+
+
+def test_build_report_jobs(tmp_path, config):
+    plot_file = tmp_path / "plot.json"
+    plot_file.write_text('{"data": [{"type": "bar", "x": [1, 2], "y": [3, 4]}]}')
+    plot = {
+        "title": "Plot",
+        "file_path": str(plot_file),
+        "component_type": "plot",
+        "plot_type": "plotly",
+    }
+    subsection = config["sections"][0]["subsections"][0]
+    subsection["components"].extend([plot, dict(plot), subsection["components"][0]])
+
+    files = []
+    for jobs in [1, 4]:
+        result = build_report(
+            "streamlit",
+            config=config,
+            output_dir=tmp_path / f"jobs_{jobs}",
+            logger=logger,
+            run=False,
+            jobs=jobs,
+        )
+        files.append(
+            {
+                path.relative_to(result.report_dir).as_posix(): path.read_text()
+                for path in result.report_dir.rglob("*")
+                if path.is_file()
+            }
+        )
+    # same report, with one static file per plot whatever the number of jobs
+    assert files[0].keys() == files[1].keys()
+    assert {"static/Plot.json", "static/Plot_2.json"} <= files[0].keys()
+    for name, content in files[0].items():
+        assert content.replace("jobs_1", "jobs_4") == files[1][name]
+
+
+def test_build_report_stream(tmp_path, config):
+    subsections = [dict(config["sections"][0]["subsections"][0], title="Other")]
+    config["sections"].append({"title": "Other section", "subsections": subsections})
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config))
+
+    files = []
+    for stream in [False, True]:
+        result = build_report(
+            "streamlit",
+            config_path=config_path,
+            output_dir=tmp_path / f"stream_{stream}",
+            logger=logger,
+            run=False,
+            stream=stream,
+        )
+        assert isinstance(result.report.sections, r.SectionStream) == stream
+        assert (result.n_sections, result.n_components) == (2, 2)
+        if stream:
+            # counted while the report was generated
+            assert result.report.sections.counts == (2, 2, 2)
+        files.append(
+            {
+                path.relative_to(result.report_dir).as_posix(): path.read_text()
+                for path in result.report_dir.rglob("*.py")
+            }
+        )
+    assert files[0] == files[1]
+
+
+def test_report_to_file(tmp_path, config):
+    config["sections"][0]["subsections"][0]["components"].append(
+        {
+            "title": "Chat",
+            "api_url": "http://localhost:11434/api/chat",
+            "component_type": "chatbot",
+        }
+    )
+    report = build_report(
+        "streamlit", config=config, output_dir=tmp_path, logger=logger, run=False
+    ).report
+    file_path = report.to_file(tmp_path / "report.pkl")
+
+    other_logger = logging.getLogger("test_report_to_file")
+    loaded = r.Report.from_file(file_path, logger=other_logger)
+    assert not hasattr(loaded, "__dict__")
+    components = loaded.sections[0].subsections[0].components
+    assert [c.title for c in components] == ["Text", "Chat"]
+    assert not any(hasattr(c, "__dict__") for c in components)
+    assert components[1].api_call.logger is other_logger
+    assert r.Markdown("New", logger).id > components[0].id
+
+    result = build_report(
+        "jupyter", report=loaded, output_dir=tmp_path / "output", run=False
+    )
+    assert (result.report_dir / "quarto_report.qmd").exists()
+
+    file_path.write_bytes(b"\x80\x04K\x01.")
+    with pytest.raises(ValueError):
+        r.Report.from_file(file_path)
@@ -0,0 +1,116 @@
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from vuegen.server import MAX_JOB_BYTES, BuildService, create_server, parse_job
+
+logger = logging.getLogger("test_server")
+TOKEN = "test-token"
+
+
+def test_parse_job(tmp_path, config):
+    job = parse_job(
+        {"config": "configs/a.yaml", "report_types": ["html", "PDF"], "run": False},
+        "id1",
+        tmp_path / "out",
+        tmp_path,
+        logger,
+    )
+    assert job.name == "a"
+    assert [entry.report_type for entry in job.entries] == ["html", "pdf"]
+    assert job.entries[0].config_path == tmp_path / "configs" / "a.yaml"
+    assert job.entries[1].output_dir == tmp_path / "out" / "id1" / "pdf"
+    assert job.entries[1].options == {"run": False, "report_type": "pdf"}
+
+    job = parse_job({"config": config}, "id2", tmp_path, tmp_path, logger)
+    assert job.entries[0].config == config and job.entries[0].report_type == "streamlit"
+
+    for data in [
+        [],
+        {"config": "a.yaml", "directory": "a"},
+        {"config": "a.yaml", "streamlit_autorun": True},
+        {"config": "a.yaml", "report_types": ["html", "website"]},
+        # paths outside of the folder of the service
+        {"config": "../a.yaml"},
+        {"config": str(tmp_path.parent / "a.yaml")},
+        {"directory": "configs/../.."},
+        {"config": "a.yaml", "output_dir": "/"},
+    ]:
+        with pytest.raises(ValueError):
+            parse_job(data, "id3", tmp_path, tmp_path, logger)
+
+
+def call(url, data=None, token=TOKEN, headers=None):
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    request = urllib.request.Request(url, data=body)
+    if body is not None:
+        request.add_header("Content-Type", "application/json")
+    if token is not None:
+        request.add_header("Authorization", f"Bearer {token}")
+    for name, value in (headers or {}).items():
+        request.add_header(name, value)
+    try:
+        with urllib.request.urlopen(request) as r:
+            return r.status, json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_serve(tmp_path, config):
+    service = BuildService(
+        tmp_path / "reports", logger, workers=1, log_folder=tmp_path / "logs"
+    )
+    server = create_server(service, port=0, token=TOKEN)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        status, job = call(
+            f"{url}/jobs",
+            {"config": config, "report_types": ["streamlit", "jupyter"], "run": False},
+        )
+        assert status == 202 and job["status"] in ("queued", "running")
+        for _ in range(600):
+            status, job = call(f"{url}/jobs/{job['id']}")
+            if job["status"] not in ("queued", "running"):
+                break
+            time.sleep(0.1)
+        assert job["status"] == "done", job
+        assert [report["status"] for report in job["reports"]] == ["ok", "ok"]
+        assert set(job["reports"][0]["timings"]) == {"config", "generate"}
+        assert (tmp_path / "reports" / job["id"] / "jupyter" / "quarto_report").is_dir()
+
+        assert call(f"{url}/jobs", {"directory": "a", "config": "a.yaml"})[0] == 400
+        assert call(f"{url}/jobs/unknown")[0] == 404
+        status, health = call(f"{url}/health")
+        assert health["workers"] == 1 and health["jobs"] == 1
+        assert len(call(f"{url}/jobs")[1]["jobs"]) == 1
+
+        # requests without the token, from other sites or to other hosts
+        assert call(f"{url}/jobs", token=None)[0] == 401
+        assert call(f"{url}/jobs", token="wrong")[0] == 401
+        assert call(f"{url}/jobs", headers={"Origin": "https://example.com"})[0] == 403
+        assert (
+            call(f"{url}/jobs", headers={"Origin": "http://localhost:3000"})[0] == 200
+        )
+        assert call(f"{url}/jobs", headers={"Host": "attacker.example"})[0] == 403
+        assert call(f"{url}/jobs", headers={"Host": "[invalid"})[0] == 403
+        # jobs which are not JSON or too large
+        headers = {"Content-Type": "text/plain"}
+        assert call(f"{url}/jobs", {"config": "a.yaml"}, headers=headers)[0] == 415
+        headers = {"Content-Length": str(MAX_JOB_BYTES + 1)}
+        assert call(f"{url}/jobs", {"config": "a.yaml"}, headers=headers)[0] == 413
+        headers = {"Content-Length": "-1"}
+        assert call(f"{url}/jobs", {"config": "a.yaml"}, headers=headers)[0] == 400
+        assert len(call(f"{url}/jobs")[1]["jobs"]) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+    # other machines are only served with a given token
+    with pytest.raises(ValueError):
+        create_server(service, host="0.0.0.0", port=0)
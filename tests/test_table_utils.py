@@ -0,0 +1,116 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from vuegen import table_utils
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    fpath = tmp_path / "workbook.xlsx"
+    with pd.ExcelWriter(fpath) as writer:
+        for sheet_name in ["first", "second sheet"]:
+            pd.DataFrame({"a": [1, 2], "b": [3, 4]}).to_excel(
+                writer, sheet_name=sheet_name, index=False
+            )
+    return fpath
+
+
+def test_get_sheet_names(excel_file):
+    assert table_utils.get_sheet_names(str(excel_file)) == ["first", "second sheet"]
+
+
+@pytest.fixture
+def table():
+    return pd.DataFrame({f"col{i}": range(25) for i in range(7)})
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".txt", ".parquet", ".xlsx"])
+def test_read_table_preview(tmp_path, table, suffix):
+    fpath = tmp_path / f"table{suffix}"
+    if suffix == ".csv":
+        table.to_csv(fpath, index=False)
+    elif suffix == ".txt":
+        table.to_csv(fpath, index=False, sep="\t")
+    elif suffix == ".parquet":
+        # several row groups, only the first two are read
+        table.to_parquet(fpath, row_group_size=5)
+    else:
+        table.to_excel(fpath, index=False)
+
+    preview = table_utils.read_table_preview(fpath, max_rows=8, max_cols=3)
+    pd.testing.assert_frame_equal(preview, table.iloc[:8, :3], check_dtype=False)
+    assert table_utils.get_table_shape(fpath) == (25, 7)
+
+
+def test_get_table_shape_sheet(excel_file):
+    assert table_utils.get_table_shape(excel_file, sheet_name="second sheet") == (2, 2)
+
+
+def test_get_sheet_shapes(excel_file):
+    assert table_utils.get_sheet_shapes(excel_file) == {
+        "first": (2, 2),
+        "second sheet": (2, 2),
+    }
+
+
+def test_get_table_shape_max_rows(tmp_path, table):
+    fpath = tmp_path / "table.csv"
+    table.to_csv(fpath, index=False)
+    # only the lines needed to know that the table has more rows are read
+    assert table_utils.get_table_shape(fpath, max_rows=10) == (None, 7)
+    assert table_utils.get_table_shape(fpath, max_rows=25) == (25, 7)
+
+
+def test_get_table_shape_quoted_line_breaks(tmp_path):
+    fpath = tmp_path / "table.csv"
+    table = pd.DataFrame({"text": ["first\nline", "second\n\nline", "third"]})
+    table.to_csv(fpath, index=False)
+    assert table_utils.get_table_shape(fpath) == (3, 1)
+    assert table_utils.get_table_shape(fpath, max_rows=2) == (None, 1)
+    assert table_utils.get_table_shape(fpath, max_rows=3) == (3, 1)
+
+
+def test_write_table_sidecar(tmp_path, table):
+    fpath = tmp_path / "table.csv"
+    table.to_csv(fpath, index=False)
+    sidecar = table_utils.write_table_sidecar(fpath, tmp_path / "tables")
+    assert sidecar.name.startswith("table_") and sidecar.name.endswith(".csv.gz")
+    pd.testing.assert_frame_equal(pd.read_csv(sidecar), table)
+
+
+def test_write_table_sidecar_same_file_names(tmp_path, table):
+    sidecars = []
+    for i, section in enumerate(["first", "second"]):
+        fpath = tmp_path / section / "table.csv"
+        fpath.parent.mkdir()
+        table.iloc[i:].to_csv(fpath, index=False)
+        sidecars.append(table_utils.write_table_sidecar(fpath, tmp_path / "tables"))
+    assert sidecars[0] != sidecars[1]
+    for i, sidecar in enumerate(sidecars):
+        assert len(pd.read_csv(sidecar)) == len(table) - i
+
+
+def test_write_table_sidecar_excel_sheet(excel_file, tmp_path):
+    sidecar = table_utils.write_table_sidecar(
+        excel_file, tmp_path / "tables", sheet_name="second sheet"
+    )
+    assert sidecar.name.startswith("workbook_")
+    assert sidecar.name.endswith("_second_sheet.parquet")
+    assert pd.read_parquet(sidecar).shape == (2, 2)
+
+
+def test_estimate_row_bytes(tmp_path, table):
+    fpath = tmp_path / "table.parquet"
+    table.to_parquet(fpath)
+    n_bytes = len(table.to_json(orient="values"))
+    assert table_utils.estimate_row_bytes(fpath) == pytest.approx(n_bytes / 25)
+
+
+def test_get_first_row_groups(tmp_path, table):
+    fpath = tmp_path / "table.parquet"
+    table.to_parquet(fpath, row_group_size=10)
+    metadata = pq.ParquetFile(fpath).metadata
+    assert table_utils.get_first_row_groups(metadata, 10) == [0]
+    assert table_utils.get_first_row_groups(metadata, 11) == [0, 1]
+    assert table_utils.get_first_row_groups(metadata, 100) == [0, 1, 2]
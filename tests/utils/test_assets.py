@@ -0,0 +1,45 @@
+import json
+import logging
+
+from vuegen.utils.assets import ASSET_REPORT_FILE, ASSETS_DIR, AssetStore
+
+VIS_JS = (
+    "https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js"
+)
+
+NETWORK_HTML = f"""<html>
+<head>
+<script src="lib/bindings/utils.js"></script>
+<script src="{VIS_JS}" integrity="sha512-abc" crossorigin="anonymous"></script>
+<!-- <script type="text/javascript" src="../node_modules/vis/dist/vis.js"></script> -->
+</head>
+<body></body>
+</html>
+"""
+
+
+def test_asset_store_shares_assets(tmp_path):
+    static_dir = tmp_path / "static"
+    source_dir = tmp_path / "networks"
+    source_dir.mkdir()
+    store = AssetStore(static_dir, logging.getLogger("test_assets"))
+    for name in ["first", "second"]:
+        (source_dir / f"{name}.html").write_text(NETWORK_HTML)
+        store.localize_html(source_dir / f"{name}.html", static_dir / f"{name}.html")
+
+    html = (static_dir / "first.html").read_text()
+    vis_js = "lib/cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/"
+    assert f'<script src="{vis_js}vis-network.min.js"></script>' in html
+    assert '<script src="lib/bindings/utils.js"></script>' in html
+    # commented out tags are kept
+    assert 'src="../node_modules/vis/dist/vis.js"' in html
+    # the source files are not changed
+    assert (source_dir / "first.html").read_text() == NETWORK_HTML
+
+    report = store.write_report()
+    assert (static_dir / ASSETS_DIR / ASSET_REPORT_FILE).exists()
+    assert json.loads((static_dir / ASSETS_DIR / ASSET_REPORT_FILE).read_text())
+    assert set(report["html_files"]) == {"first.html", "second.html"}
+    assert [asset["references"] for asset in report["assets"].values()] == [2, 2]
+    assets_bytes = sum(asset["bytes"] for asset in report["assets"].values())
+    assert report["bytes_before"] - report["bytes_after"] == assets_bytes
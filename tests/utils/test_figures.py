@@ -0,0 +1,61 @@
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from vuegen.utils.figures import compact_plotly_json, write_compact_plotly_json
+
+plot_json = {
+    "data": [
+        {
+            "type": "scatter",
+            "x": list(range(10)),
+            "y": [v / 3 for v in range(10)],
+            "text": [str(v) for v in range(10)],
+            "marker": {"size": [300] * 10},
+            "frame": None,
+        }
+    ],
+    "layout": {"title": {"text": "test"}},
+    "config": {"responsive": True},
+    "attrs": {},
+}
+
+
+def test_compact_plotly_json():
+    """Only 'data' and 'layout' are kept and 'frame' is removed from the traces."""
+    figure = compact_plotly_json(plot_json)
+    assert list(figure) == ["data", "layout"]
+    assert "frame" not in figure["data"][0]
+    assert figure["data"][0]["x"] == plot_json["data"][0]["x"]
+
+
+@pytest.mark.parametrize(
+    "key,dtype,expected",
+    [
+        (("x",), "i1", list(range(10))),
+        (("y",), "f8", [v / 3 for v in range(10)]),
+        (("marker", "size"), "i2", [300] * 10),
+    ],
+)
+def test_compact_plotly_json_typed_arrays(key, dtype, expected):
+    """Numeric arrays are encoded as typed arrays which decode to the same values."""
+    trace = compact_plotly_json(plot_json, typed_arrays=True)["data"][0]
+    spec = trace
+    for k in key:
+        spec = spec[k]
+    assert spec["dtype"] == dtype
+    decoded = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=f"<{dtype}")
+    np.testing.assert_allclose(decoded, expected)
+    # non-numeric arrays are kept as they are
+    assert trace["text"] == plot_json["data"][0]["text"]
+
+
+def test_write_compact_plotly_json(tmp_path):
+    fpath = write_compact_plotly_json(
+        plot_json, tmp_path / "plot.json", typed_arrays=False
+    )
+    content = fpath.read_text(encoding="utf-8")
+    assert ", " not in content
+    assert json.loads(content) == compact_plotly_json(plot_json)
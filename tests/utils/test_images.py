@@ -0,0 +1,44 @@
+import pytest
+from PIL import Image
+
+from vuegen.utils.images import ImageSettings, postprocess_image
+
+
+def test_image_settings_merge():
+    settings = ImageSettings(dpi=150).merge({"format": "jpg", "max_size": None})
+    assert settings == ImageSettings(dpi=150, format="jpeg")
+    assert settings.suffix == ".jpg"
+    assert settings.scale == pytest.approx(150 / 96)
+    assert settings.needs_postprocessing
+    assert not ImageSettings(dpi=150).needs_postprocessing
+
+
+@pytest.mark.parametrize(
+    "overrides", [{"resolution": 150}, {"format": "webp"}, {"max_size": -1}]
+)
+def test_image_settings_invalid(overrides):
+    with pytest.raises(ValueError):
+        ImageSettings().merge(overrides)
+
+
+def test_postprocess_image(tmp_path):
+    png_file = tmp_path / "plot.png"
+    Image.new("RGBA", (2000, 1000), (255, 0, 0, 128)).save(png_file)
+
+    jpg_file = postprocess_image(png_file, max_size=800, format="jpeg")
+    assert jpg_file == (tmp_path / "plot.jpg").as_posix()
+    assert not png_file.exists()
+    with Image.open(jpg_file) as image:
+        assert image.format == "JPEG"
+        assert image.size == (800, 400)
+
+
+def test_postprocess_image_keep_input(tmp_path):
+    png_file = tmp_path / "user_image.png"
+    Image.new("RGB", (300, 300)).save(png_file)
+    output = postprocess_image(
+        png_file, tmp_path / "static" / "image.png", max_size=100, keep_input=True
+    )
+    assert png_file.exists()
+    with Image.open(output) as image:
+        assert image.size == (100, 100)
@@ -0,0 +1,37 @@
+import pytest
+import yaml
+
+from vuegen.utils.lazy_yaml import LazyYamlList, load_yaml_config_lazily
+
+CONFIG = """\
+sections:
+  - title: &title First
+    components: [{title: a, file_path: a.md}]
+  - title: Second
+    subsections: []
+    description: *title
+report:
+  title: Report
+  image_settings: {dpi: 150}
+"""
+
+
+def test_load_yaml_config_lazily(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(CONFIG)
+    config = load_yaml_config_lazily(config_path)
+    assert config["report"] == {"title": "Report", "image_settings": {"dpi": 150}}
+    assert isinstance(config["sections"], LazyYamlList)
+    # parsed again on each iteration, with the same result as loading the file
+    assert list(config["sections"]) == yaml.safe_load(CONFIG)["sections"]
+    assert list(config["sections"]) == yaml.safe_load(CONFIG)["sections"]
+    assert len(config["sections"]) == 2
+
+
+def test_load_yaml_config_lazily_errors(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    with pytest.raises(FileNotFoundError):
+        load_yaml_config_lazily(config_path)
+    config_path.write_text("- not a mapping\n")
+    with pytest.raises(ValueError):
+        load_yaml_config_lazily(config_path)
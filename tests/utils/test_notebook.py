@@ -0,0 +1,37 @@
+from vuegen.utils.notebook import qmd_to_notebook
+
+QMD = """---
+title: Report
+jupyter: python3
+---
+
+```{python}
+#| label: 'Imports'
+import pandas as pd
+```
+
+# Section
+Some text
+
+```{python}
+#| label: 'Table 1'
+df = pd.DataFrame({"a": [1, 2]})
+df
+```
+"""
+
+
+def test_qmd_to_notebook():
+    notebook = qmd_to_notebook(QMD)
+    assert [cell.cell_type for cell in notebook.cells] == [
+        "raw",
+        "code",
+        "markdown",
+        "code",
+    ]
+    assert notebook.cells[0].source.startswith("---\ntitle: Report")
+    assert notebook.cells[2].source == "# Section\nSome text"
+    assert notebook.cells[3].source == (
+        "#| label: 'Table 1'\ndf = pd.DataFrame({\"a\": [1, 2]})\ndf"
+    )
+    assert notebook.metadata.kernelspec.name == "python3"
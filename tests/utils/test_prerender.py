@@ -0,0 +1,27 @@
+import logging
+
+from vuegen.utils.prerender import PrerenderTask, prerender_images
+
+logger = logging.getLogger("test_prerender")
+
+
+def test_prerender_images_skips_unchanged(tmp_path):
+    source = tmp_path / "table.csv"
+    source.write_text("a,b\n1,2\n3,4\n")
+    task = PrerenderTask(
+        kind="dataframe", source=str(source), output=str(tmp_path / "table.png")
+    )
+
+    assert prerender_images([task], tmp_path, logger, max_workers=1) == {
+        task.output: "rendered"
+    }
+    assert (tmp_path / "table.png").exists()
+    assert prerender_images([task], tmp_path, logger, max_workers=1) == {
+        task.output: "cached"
+    }
+
+    # a changed source file is rendered again
+    source.write_text("a,b\n1,2\n3,5\n")
+    assert prerender_images([task], tmp_path, logger, max_workers=1) == {
+        task.output: "rendered"
+    }
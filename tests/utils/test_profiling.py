@@ -0,0 +1,116 @@
+import json
+import logging
+import threading
+import tracemalloc
+
+from vuegen import report as r
+from vuegen.utils.profiling import (
+    BUILD_PROFILE_FILE,
+    BUILD_TRACE_FILE,
+    CHUNK_PROFILER_CLASS,
+    CHUNK_PROFILER_CODE,
+    PROFILE_SUMMARY_FILE,
+    BuildProfiler,
+    clear_profiles,
+    profile_component,
+    profile_stage,
+    summarize_profiles,
+)
+
+
+def _load_chunk_profiler():
+    namespace = {}
+    exec(CHUNK_PROFILER_CODE, namespace)
+    return namespace[CHUNK_PROFILER_CLASS]
+
+
+def test_chunk_profiler(tmp_path):
+    ChunkProfiler = _load_chunk_profiler()
+    tracemalloc.start()
+    try:
+        profiler = ChunkProfiler(tmp_path / "report_profile.json", memory=True)
+        # cells which did not start a chunk are ignored
+        profiler.stop()
+        profiler.start("Small chunk 1")
+        profiler.stop()
+        profiler.start("Large chunk 2")
+        data = bytearray(10 * 2**20)
+        profiler.stop()
+        del data
+    finally:
+        tracemalloc.stop()
+    # memory is not traced by default
+    profiler = ChunkProfiler(tmp_path / "other_profile.json")
+    profiler.start("Chunk 1")
+    profiler.stop()
+
+    with open(tmp_path / "report_profile.json", encoding="utf-8") as f:
+        timings = json.load(f)
+    assert [timing["label"] for timing in timings] == ["Small chunk 1", "Large chunk 2"]
+    assert timings[1]["peak_memory"] >= 10 * 2**20
+
+    summary = summarize_profiles(tmp_path)
+    assert {timing["file"] for timing in summary} == {"report.qmd", "other.qmd"}
+    assert [t["peak_memory"] for t in summary if t["file"] == "other.qmd"] == [None]
+    assert (tmp_path / PROFILE_SUMMARY_FILE).read_text().count("report.qmd: ") == 2
+
+    # the timings of earlier builds are removed
+    clear_profiles(tmp_path)
+    assert not list(tmp_path.glob("*_profile.json"))
+
+
+def test_build_profiler(tmp_path):
+    component = r.Markdown(
+        title="Text", logger=logging.getLogger(), file_path="text.md"
+    )
+    # nothing is recorded without an active profiler
+    with profile_stage("ignored"):
+        pass
+    profiler = BuildProfiler()
+    with profiler.activate():
+        with profile_stage("generate"):
+            with profile_component(component):
+                pass
+            with profile_stage("write_file", file="report.qmd"):
+                pass
+    with profile_stage("ignored"):
+        pass
+
+    assert [span["name"] for span in profiler.spans] == [
+        "markdown: Text",
+        "write_file",
+        "generate",
+    ]
+    assert [span["depth"] for span in profiler.spans] == [1, 1, 0]
+    summary = profiler.summary()
+    assert set(summary["stages"]) == {"generate", "write_file"}
+    assert summary["components"][0]["title"] == "Text"
+    assert summary["components"][0]["id"] == component.id
+
+    summary_file, trace_file = profiler.write(tmp_path)
+    assert summary_file == tmp_path / BUILD_PROFILE_FILE
+    with open(tmp_path / BUILD_TRACE_FILE, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert len(complete) == 3
+    assert {event["cat"] for event in complete} == {"stage", "component"}
+
+
+def test_build_profilers_of_concurrent_builds():
+    profilers = [BuildProfiler(), BuildProfiler()]
+    barrier = threading.Barrier(len(profilers))
+
+    def build(index):
+        with profilers[index].activate():
+            # both profilers are active at the same time
+            barrier.wait()
+            with profile_stage(f"build {index}"):
+                barrier.wait()
+
+    threads = [threading.Thread(target=build, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for index, profiler in enumerate(profilers):
+        assert [span["name"] for span in profiler.spans] == [f"build {index}"]
@@ -0,0 +1,34 @@
+import json
+import logging
+
+from vuegen.utils.remote import MANIFEST_FILE, REMOTE_DIR, RemoteAssetCache
+
+ETAG = '"v1"'
+
+
+def test_remote_asset_cache_revalidates(tmp_path, stub_server):
+    downloads = []
+
+    def serve_markdown(handler, count):
+        """Serve a markdown file with an ETag and count the full downloads."""
+        if handler.headers.get("If-None-Match") == ETAG:
+            return 304, {}, b""
+        downloads.append(handler.path)
+        return 200, {"ETag": ETAG}, b"# Remote description"
+
+    server = stub_server(serve_markdown)
+    url = f"{server.url}/docs/description.md"
+    logger = logging.getLogger("test_remote")
+
+    cache = RemoteAssetCache(tmp_path, logger)
+    fpath = cache.fetch(url)
+    cache.save_manifest()
+    assert fpath.parent == tmp_path / REMOTE_DIR
+    assert fpath.suffix == ".md"
+    assert fpath.read_text() == "# Remote description"
+    manifest = json.loads((tmp_path / REMOTE_DIR / MANIFEST_FILE).read_text())
+    assert manifest[url]["etag"] == ETAG
+
+    # a new build revalidates the local copy instead of downloading it again
+    assert RemoteAssetCache(tmp_path, logger).fetch(url) == fpath
+    assert len(server.requests) == 2 and len(downloads) == 1
@@ -0,0 +1,62 @@
+import json
+import logging
+
+from vuegen import report as r
+from vuegen.utils.static_store import MANIFEST_FILE, StaticStore
+
+logger = logging.getLogger("test_static_store")
+
+
+def make_plot(tmp_path, title, content):
+    file_path = tmp_path / f"{title}.json"
+    file_path.write_text(content)
+    return r.Plot(title, logger, r.PlotType.PLOTLY, file_path=str(file_path))
+
+
+def write(store, plot, static_dir):
+    name = store.asset_name(plot, {"report_type": "html"})
+    file_path = static_dir / f"{name}.json"
+    with store.writing(name, file_path) as needed:
+        if needed:
+            file_path.write_text("figure")
+    return name, needed
+
+
+def test_static_store_names_by_content(tmp_path):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    store = StaticStore(static_dir, logger)
+    first = make_plot(tmp_path, "first", "{}")
+    # same content, another title
+    same = make_plot(tmp_path, "same", "{}")
+    other = make_plot(tmp_path, "other", '{"data": []}')
+
+    name, needed = write(store, first, static_dir)
+    assert name.startswith("plot_") and needed
+    assert write(store, same, static_dir) == (name, False)
+    assert write(store, other, static_dir)[0] != name
+    assert store.asset_name(first, {"report_type": "pdf"}) != name
+    manifest = json.loads(store.write_manifest().read_text())
+    assert manifest["assets"][name]["files"] == [f"{name}.json"]
+    assert [c["title"] for c in manifest["components"]] == ["first", "same", "other"]
+
+    # files of the previous build are reused
+    store = StaticStore(static_dir, logger)
+    assert write(store, first, static_dir) == (name, False)
+    assert (store.n_written, store.n_reused) == (0, 1)
+    (static_dir / f"{name}.json").unlink()
+    store = StaticStore(static_dir, logger)
+    assert write(store, first, static_dir) == (name, True)
+
+
+def test_static_store_rewrites_remote_files(tmp_path):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    plot = r.Plot(
+        "remote", logger, r.PlotType.PLOTLY, file_path="https://example.com/fig.json"
+    )
+    for _ in range(2):
+        store = StaticStore(static_dir, logger)
+        assert write(store, plot, static_dir)[1]
+        store.write_manifest()
+    assert (static_dir / MANIFEST_FILE).exists()